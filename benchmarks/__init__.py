@@ -0,0 +1,4 @@
+"""Benchmarks of the client against a local mock FMP server.
+
+Run them with python -m benchmarks.run, see benchmarks/run.py for options.
+"""
@@ -0,0 +1,209 @@
+"""Deterministic payloads shaped like the FMP responses the benchmarks hit.
+
+They reproduce the field names, types and sizes of real responses (a quote
+row, five years of daily bars, as-reported statements with their long tail of
+XBRL fields, 13F portfolio pages and the bulk statement CSV), generated from a
+fixed seed so every run and release serves identical bytes.
+"""
+from __future__ import annotations
+
+import csv
+import datetime
+import io
+import json
+import random
+
+SEED = 20240101
+
+
+def symbols(count: int) -> list:
+    """Returns count distinct ticker-like symbols."""
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    result = []
+    for index in range(count):
+        name = ""
+        index += 26
+        while index:
+            index, rest = divmod(index, 26)
+            name = letters[rest] + name
+        result.append(name)
+    return result
+
+
+def quote(symbol: str) -> dict:
+    """Returns a full quote row."""
+    rng = random.Random(symbol)
+    price = round(rng.uniform(5, 500), 2)
+    return {
+        "symbol": symbol,
+        "name": f"{symbol} Inc.",
+        "price": price,
+        "changesPercentage": round(rng.uniform(-5, 5), 4),
+        "change": round(rng.uniform(-5, 5), 2),
+        "dayLow": round(price * 0.98, 2),
+        "dayHigh": round(price * 1.02, 2),
+        "yearHigh": round(price * 1.4, 2),
+        "yearLow": round(price * 0.7, 2),
+        "marketCap": rng.randrange(10**8, 3 * 10**12),
+        "priceAvg50": round(price * 0.99, 4),
+        "priceAvg200": round(price * 0.95, 4),
+        "exchange": "NASDAQ",
+        "volume": rng.randrange(10**5, 10**8),
+        "avgVolume": rng.randrange(10**5, 10**8),
+        "open": round(price * 0.995, 2),
+        "previousClose": round(price * 0.99, 2),
+        "eps": round(rng.uniform(-2, 12), 2),
+        "pe": round(rng.uniform(5, 60), 2),
+        "earningsAnnouncement": "2024-01-25T21:30:00.000+0000",
+        "sharesOutstanding": rng.randrange(10**7, 10**10),
+        "timestamp": 1704067200,
+    }
+
+
+def daily_chart(symbol: str, bars: int = 1250) -> dict:
+    """Returns a historical-price-full payload, newest bar first."""
+    rng = random.Random(f"{SEED}{symbol}")
+    day = datetime.date(2024, 1, 1)
+    close = 100.0
+    historical = []
+    while len(historical) < bars:
+        day -= datetime.timedelta(days=1)
+        if day.weekday() >= 5:
+            continue
+        open_ = close * rng.uniform(0.98, 1.02)
+        high = max(open_, close) * rng.uniform(1, 1.02)
+        low = min(open_, close) * rng.uniform(0.98, 1)
+        volume = rng.randrange(10**6, 10**8)
+        historical.append(
+            {
+                "date": day.isoformat(),
+                "open": round(open_, 2),
+                "high": round(high, 2),
+                "low": round(low, 2),
+                "close": round(close, 2),
+                "adjClose": round(close, 2),
+                "volume": volume,
+                "unadjustedVolume": volume,
+                "change": round(close - open_, 2),
+                "changePercent": round((close - open_) / open_ * 100, 5),
+                "vwap": round((high + low + close) / 3, 4),
+                "label": day.strftime("%B %d, %y"),
+                "changeOverTime": round((close - open_) / open_, 7),
+            }
+        )
+        close = open_
+    return {"symbol": symbol, "historical": historical}
+
+
+def statements_as_reported(symbol: str, limit: int = 10) -> list:
+    """Returns income statements as reported, about 150 fields each."""
+    rng = random.Random(f"{SEED}{symbol}statements")
+    fields = [f"xbrlconcept{index:03d}" for index in range(140)]
+    return [
+        {
+            "date": f"{2023 - year}-09-30",
+            "symbol": symbol,
+            "period": "FY",
+            "revenuefromcontractwithcustomerexcludingassessedtax": rng.randrange(
+                10**9, 10**12
+            ),
+            "netincomeloss": rng.randrange(-(10**9), 10**11),
+            **{field: rng.randrange(10**6, 10**11) for field in fields},
+        }
+        for year in range(limit)
+    ]
+
+
+def portfolio_page(cik: str, page: int, rows: int = 100) -> list:
+    """Returns one page of a 13F portfolio composition."""
+    rng = random.Random(f"{SEED}{cik}{page}")
+    names = symbols(rows * (page + 1))[-rows:]
+    return [
+        {
+            "date": "2023-09-30",
+            "cik": cik,
+            "filingDate": "2023-11-14",
+            "investorName": "BENCHMARK CAPITAL MANAGEMENT",
+            "symbol": symbol,
+            "securityName": f"{symbol} INC",
+            "typeOfSecurity": "COM",
+            "securityCusip": f"{rng.randrange(10**8, 10**9)}",
+            "sharesType": "SH",
+            "putCallShare": "Share",
+            "investmentDiscretion": "SOLE",
+            "industryTitle": "SERVICES-PREPACKAGED SOFTWARE",
+            "weight": round(rng.uniform(0, 2), 4),
+            "lastWeight": round(rng.uniform(0, 2), 4),
+            "changeInWeight": round(rng.uniform(-1, 1), 4),
+            "changeInWeightPercentage": round(rng.uniform(-50, 50), 4),
+            "marketValue": rng.randrange(10**5, 10**10),
+            "lastMarketValue": rng.randrange(10**5, 10**10),
+            "changeInMarketValue": rng.randrange(-(10**9), 10**9),
+            "sharesNumber": rng.randrange(100, 10**8),
+            "lastSharesNumber": rng.randrange(100, 10**8),
+            "changeInSharesNumber": rng.randrange(-(10**6), 10**6),
+            "ownership": round(rng.uniform(0, 5), 4),
+            "isNew": False,
+            "isSoldOut": False,
+        }
+        for symbol in names
+    ]
+
+
+def bulk_income_statements_csv(rows: int = 20000) -> bytes:
+    """Returns a bulk income statement CSV body."""
+    rng = random.Random(f"{SEED}bulk")
+    header = [
+        "date",
+        "symbol",
+        "reportedCurrency",
+        "cik",
+        "fillingDate",
+        "calendarYear",
+        "period",
+        "revenue",
+        "costOfRevenue",
+        "grossProfit",
+        "grossProfitRatio",
+        "operatingExpenses",
+        "operatingIncome",
+        "netIncome",
+        "eps",
+        "epsdiluted",
+        "weightedAverageShsOut",
+        "link",
+    ]
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(header)
+    for symbol in symbols(rows):
+        revenue = rng.randrange(10**6, 10**11)
+        cost = int(revenue * rng.uniform(0.2, 0.9))
+        writer.writerow(
+            [
+                "2023-12-31",
+                symbol,
+                "USD",
+                f"{rng.randrange(10**9):010d}",
+                "2024-02-20",
+                2023,
+                "FY",
+                revenue,
+                cost,
+                revenue - cost,
+                round((revenue - cost) / revenue, 6),
+                rng.randrange(10**5, 10**10),
+                rng.randrange(-(10**9), 10**10),
+                rng.randrange(-(10**9), 10**10),
+                round(rng.uniform(-5, 20), 2),
+                round(rng.uniform(-5, 20), 2),
+                rng.randrange(10**6, 10**10),
+                f"https://www.sec.gov/Archives/edgar/data/{symbol}.htm",
+            ]
+        )
+    return out.getvalue().encode()
+
+
+def dumps(payload) -> bytes:
+    """Serializes a payload as the API does."""
+    return json.dumps(payload).encode()
@@ -0,0 +1,225 @@
+"""A local stand-in for the FMP API serving the benchmark fixtures.
+
+Point a client at it with client.base_url = server.base_url. Every response
+can be delayed by a fixed latency, and a token bucket answers HTTP 429 with
+Retry-After once the configured rate is exceeded, like the real API.
+"""
+from __future__ import annotations
+
+import re
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks import fixtures
+
+
+class _Bucket:
+    """A token bucket refilled at rate tokens per second."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> float:
+        """Returns 0 when a token was taken, else the seconds until one."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+
+@lru_cache(maxsize=None)
+def _exchange_prices(exchange, count):
+    rows = [fixtures.quote(symbol) for symbol in fixtures.symbols(count)]
+    for row in rows:
+        row["exchange"] = exchange
+    return fixtures.dumps(rows)
+
+
+@lru_cache(maxsize=None)
+def _daily_chart(symbol, bars):
+    return fixtures.dumps(fixtures.daily_chart(symbol, bars))
+
+
+@lru_cache(maxsize=None)
+def _statements(symbol, limit):
+    return fixtures.dumps(fixtures.statements_as_reported(symbol, limit))
+
+
+@lru_cache(maxsize=None)
+def _portfolio(cik, page):
+    return fixtures.dumps(fixtures.portfolio_page(cik, page))
+
+
+@lru_cache(maxsize=None)
+def _bulk_csv(rows):
+    return fixtures.bulk_income_statements_csv(rows)
+
+
+class MockFMPServer:
+    """Serves the benchmark fixtures over HTTP on a background thread.
+
+    Routes: v3/quote/{symbols}, v3/quotes/{exchange},
+    v3/historical-price-full/{symbol},
+    v3/income-statement-as-reported/{symbol},
+    v4/institutional-ownership/portfolio-holdings and
+    v4/income-statement-bulk (CSV).
+
+    Methods:
+    - start()
+    - stop()
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        rate_limit: float | None = None,
+        bars: int = 1250,
+        bulk_rows: int = 20000,
+        exchange_size: int = 5000,
+        port: int = 0,
+    ):
+        """Initializes the server.
+
+        Args:
+            latency (float): Seconds added to every response.
+            rate_limit (float, optional): Requests per second served before
+             answering 429.
+            bars (int): Bars in each daily chart.
+            bulk_rows (int): Rows in the bulk CSV.
+            exchange_size (int): Quotes in each exchange price list.
+            port (int): The port, any free one by default.
+
+        Returns:
+            None
+        """
+        self.latency = latency
+        self.bucket = None if rate_limit is None else _Bucket(rate_limit)
+        self.bars = bars
+        self.bulk_rows = bulk_rows
+        self.exchange_size = exchange_size
+        self.requests = 0
+        self.rejected = 0
+        # Guards the counters, which handler threads update concurrently.
+        self.lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """The URL to use as a client's base_url."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/api/"
+
+    def __enter__(self):
+        """Starts the server."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stops the server."""
+        self.stop()
+
+    def start(self):
+        """Starts serving on a daemon thread.
+
+        Returns:
+            None
+        """
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops serving.
+
+        Returns:
+            None
+        """
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def route(self, path: str, query: dict):
+        """Returns (status, content type, body) for a request.
+
+        Args:
+            path (str): The path after /api/.
+            query (dict): The query parameters, one value each.
+
+        Returns:
+            tuple[int, str, bytes]
+        """
+        match = re.fullmatch(r"v3/quote/([^/]+)", path)
+        if match:
+            rows = [fixtures.quote(symbol) for symbol in match[1].split(",")]
+            return 200, "application/json", fixtures.dumps(rows)
+        match = re.fullmatch(r"v3/quotes/([^/]+)", path)
+        if match:
+            body = _exchange_prices(match[1], self.exchange_size)
+            return 200, "application/json", body
+        match = re.fullmatch(r"v3/historical-price-full/([^/]+)", path)
+        if match:
+            return 200, "application/json", _daily_chart(match[1], self.bars)
+        match = re.fullmatch(r"v3/income-statement-as-reported/([^/]+)", path)
+        if match:
+            limit = int(query.get("limit", 10))
+            return 200, "application/json", _statements(match[1], limit)
+        if path == "v4/institutional-ownership/portfolio-holdings":
+            page = int(query.get("page", 0))
+            return 200, "application/json", _portfolio(query.get("cik", ""), page)
+        if path == "v4/income-statement-bulk":
+            return 200, "text/csv", _bulk_csv(self.bulk_rows)
+        message = fixtures.dumps({"Error Message": f"Unknown endpoint {path}."})
+        return 404, "application/json", message
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Answers GET requests from MockFMPServer.route."""
+
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """Serves one request."""
+                with server.lock:
+                    server.requests += 1
+                url = urlsplit(self.path)
+                if server.bucket is not None:
+                    wait = server.bucket.take()
+                    if wait:
+                        with server.lock:
+                            server.rejected += 1
+                        body = fixtures.dumps({"Error Message": "Limit Reach."})
+                        self._reply(429, "application/json", body, wait)
+                        return
+                if server.latency:
+                    time.sleep(server.latency)
+                query = {key: values[0] for key, values in parse_qs(url.query).items()}
+                path = url.path.removeprefix("/api/")
+                self._reply(*server.route(path, query))
+
+            def _reply(self, status, content_type, body, retry_after=None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                if retry_after is not None:
+                    self.send_header("Retry-After", f"{retry_after:.3f}")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                """Stays quiet."""
+
+        return Handler
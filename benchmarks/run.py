@@ -0,0 +1,389 @@
+"""Runs the benchmarks against a local mock FMP server.
+
+Usage:
+    python -m benchmarks.run [--latency 0.02] [--rate-limit 300]
+        [--requests 200] [--workers 16] [--repeat 3] [--only fetch,decode]
+        [--json results.json]
+
+Benchmarks:
+- fetch: the same quotes requested sequentially, on threads (api.map), with
+  asyncio (AsyncFinancialModelingPrep) and batched (api.batch).
+- decode: json, orjson, Columns and Struct decoding of the fixture payloads.
+- cache: daily charts without cache, with LRUCache and with SQLite, cold and
+  warm.
+- bulk: streaming the bulk income statement CSV.
+- endpoints: network and decode latency per endpoint from MetricsCollector.
+- import: startup cost in a fresh interpreter, importing the package, then
+  creating a client and using api.quote, then making a first request.
+
+Every timing is the best of --repeat runs. The JSON output records the
+package and Python versions next to the settings, so results of different
+releases can be compared.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from importlib import metadata
+
+from requests_cache import SQLiteCache
+
+from benchmarks import fixtures
+from benchmarks.mock_server import MockFMPServer
+from financial_modeling_prep import (
+    AsyncFinancialModelingPrep,
+    Columns,
+    FinancialModelingPrep,
+    LRUCache,
+    MetricsCollector,
+)
+from financial_modeling_prep.structs import DailyBar, StockQuote
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+API_KEY = "benchmark"
+FROM_DATE = "2019-01-01"
+TO_DATE = "2023-12-29"
+
+
+def _best(repeat, function):
+    """Returns the shortest of repeat timed calls of function."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _retained(function, *args) -> int:
+    """Returns the bytes still allocated by the result of function(*args)."""
+    tracemalloc.start()
+    try:
+        result = function(*args)
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def _client(server, cls=None, **kwargs):
+    kwargs.setdefault("cache", False)
+    kwargs.setdefault("max_retries", 10)
+    api = (cls or FinancialModelingPrep)(API_KEY, **kwargs)
+    api.base_url = server.base_url
+    return api
+
+
+def bench_fetch(server, args) -> dict:
+    """Sequential, threaded, async and batched quote requests."""
+    symbols = fixtures.symbols(args.requests)
+    api = _client(server)
+
+    def sequential():
+        for symbol in symbols:
+            api.quote.get_full_quote(symbol)
+
+    def threaded():
+        for result in api.map(api.quote.get_full_quote, symbols, workers=args.workers):
+            if not result.ok:
+                raise result.error
+
+    def concurrent():
+        async def gather():
+            async with _client(
+                server, AsyncFinancialModelingPrep, max_concurrency=args.workers
+            ) as client:
+                await asyncio.gather(
+                    *(client.quote.get_full_quote(symbol) for symbol in symbols)
+                )
+
+        asyncio.run(gather())
+
+    def batched():
+        api.batch(api.quote.get_full_quote, symbols)
+
+    results = {}
+    for name, function in (
+        ("sequential", sequential),
+        ("threaded", threaded),
+        ("async", concurrent),
+        ("batched", batched),
+    ):
+        seconds = _best(args.repeat, function)
+        results[name] = {
+            "seconds": seconds,
+            "symbols_per_second": len(symbols) / seconds,
+        }
+    return results
+
+
+def bench_decode(server, args) -> dict:
+    """Decoding the fixture payloads with json, orjson, Columns and structs."""
+    exchange = [fixtures.quote(symbol) for symbol in fixtures.symbols(1000)]
+    payloads = {
+        "exchange_prices": (fixtures.dumps(exchange), StockQuote),
+        "daily_chart": (
+            fixtures.dumps(fixtures.daily_chart("AAPL", server.bars)),
+            DailyBar,
+        ),
+        "statements_as_reported": (
+            fixtures.dumps(fixtures.statements_as_reported("AAPL")),
+            None,
+        ),
+        "portfolio_page": (
+            fixtures.dumps(fixtures.portfolio_page("0001067983", 0)),
+            None,
+        ),
+    }
+    decoders = {"json": json.loads}
+    if orjson is not None:
+        decoders["orjson"] = orjson.loads
+    decoders["columns"] = lambda body: Columns.from_payload(json.loads(body))
+    loops = max(1, args.requests // 10)
+    results = {}
+    for name, (body, struct) in payloads.items():
+        results[name] = {"bytes": len(body)}
+        measured = dict(decoders)
+        if struct is not None:
+            measured["structs"] = struct.decode
+        for decoder, function in measured.items():
+
+            def decode(function=function, body=body):
+                for _ in range(loops):
+                    function(body)
+
+            seconds = _best(args.repeat, decode) / loops
+            results[name][decoder] = {
+                "microseconds": seconds * 1e6,
+                "megabytes_per_second": len(body) / seconds / 1e6,
+                "retained_kilobytes": _retained(function, body) / 1e3,
+            }
+    return results
+
+
+def bench_cache(server, args) -> dict:
+    """Daily chart requests through each cache backend, cold then warm."""
+    symbols = fixtures.symbols(max(1, args.requests // 4))
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        backends = (
+            ("none", lambda: False),
+            ("lru", lambda: LRUCache(max_entries=len(symbols))),
+            ("sqlite", lambda: SQLiteCache(os.path.join(directory, "benchmark"))),
+        )
+        for name, backend in backends:
+            cold = warm = float("inf")
+            for _ in range(args.repeat):
+                api = _client(server, cache=backend())
+                if hasattr(api.session, "cache"):
+                    api.session.cache.clear()
+
+                def fetch(api=api):
+                    for symbol in symbols:
+                        api.charts.get_daily_chart_eod(
+                            symbol, FROM_DATE, TO_DATE, "line"
+                        )
+
+                cold = min(cold, _best(1, fetch))
+                warm = min(warm, _best(1, fetch))
+                api.session.close()
+            results[name] = {
+                "cold_seconds": cold,
+                "warm_seconds": warm,
+                "warm_requests_per_second": len(symbols) / warm,
+            }
+    return results
+
+
+def bench_bulk(server, args) -> dict:
+    """Streaming the bulk income statement CSV."""
+    api = _client(server)
+    rows = 0
+
+    def stream():
+        nonlocal rows
+        rows = sum(1 for _ in api.bulk_data.bulk_income_statements(2023, "annual"))
+
+    seconds = _best(args.repeat, stream)
+    columns = _best(
+        args.repeat,
+        lambda: api.bulk_data.bulk_income_statements(2023, "annual", as_columns=True),
+    )
+    return {
+        "rows": rows,
+        "seconds": seconds,
+        "rows_per_second": rows / seconds,
+        "columns_seconds": columns,
+    }
+
+
+def bench_endpoints(server, args) -> dict:
+    """Network and decode latency of each endpoint from MetricsCollector."""
+    collector = MetricsCollector()
+    api = _client(server, hooks=[collector])
+    symbols = fixtures.symbols(max(1, args.requests // 10))
+    for _ in range(args.repeat):
+        for page, symbol in enumerate(symbols):
+            api.quote.get_full_quote(symbol)
+            api.charts.get_daily_chart_eod(symbol, FROM_DATE, TO_DATE, "line")
+            api.financial_statements.get_income_statement_as_reported(symbol, limit=10)
+            api.institutional_stock_ownership.get_portfolio_composition(
+                "0001067983", "2023-09-30", page
+            )
+    return {
+        template: {
+            "requests": stats["requests"],
+            "bytes": stats["bytes"],
+            "network_mean_ms": stats["network"]["mean"] * 1e3,
+            "decode_mean_ms": stats["decode"]["mean"] * 1e3,
+        }
+        for template, stats in collector.snapshot().items()
+    }
+
+
+IMPORT_STEPS = {
+    "import": "import financial_modeling_prep",
+    "client": (
+        "from financial_modeling_prep import FinancialModelingPrep\n"
+        "api = FinancialModelingPrep('benchmark')\n"
+        "api.quote"
+    ),
+    "first_request": (
+        "from financial_modeling_prep import FinancialModelingPrep\n"
+        "api = FinancialModelingPrep('benchmark', cache=False)\n"
+        "api.base_url = {base_url!r}\n"
+        "api.quote.get_full_quote('AAPL')"
+    ),
+}
+
+_TIMED = """
+import sys, time
+started = time.perf_counter()
+{code}
+print(time.perf_counter() - started, sum(1 for name in sys.modules))
+"""
+
+
+def bench_import(server, args) -> dict:
+    """Import, client creation and first request in a fresh interpreter."""
+    results = {}
+    for name, code in IMPORT_STEPS.items():
+        script = _TIMED.format(code=code.format(base_url=server.base_url))
+        best = float("inf")
+        for _ in range(args.repeat):
+            output = subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout.split()
+            best = min(best, float(output[0]))
+        results[name] = {"milliseconds": best * 1e3, "modules": int(output[1])}
+    return results
+
+
+BENCHMARKS = {
+    "fetch": bench_fetch,
+    "decode": bench_decode,
+    "cache": bench_cache,
+    "bulk": bench_bulk,
+    "endpoints": bench_endpoints,
+    "import": bench_import,
+}
+
+
+def _version() -> str:
+    try:
+        return metadata.version("financial-modeling-prep-api")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _print(name, results, indent=0):
+    for key, value in results.items():
+        if isinstance(value, dict):
+            print(f"{' ' * indent}{key}:")
+            _print(name, value, indent + 2)
+        elif isinstance(value, float):
+            print(f"{' ' * indent}{key}: {value:,.4f}")
+        else:
+            print(f"{' ' * indent}{key}: {value:,}")
+
+
+def main(argv=None) -> dict:
+    """Runs the selected benchmarks and prints their results.
+
+    Args:
+        argv (list, optional): The command line arguments, sys.argv by default.
+
+    Returns:
+        dict: The settings and the results of every benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds added per response"
+    )
+    parser.add_argument(
+        "--rate-limit", type=float, default=None, help="requests per second served"
+    )
+    parser.add_argument(
+        "--requests", type=int, default=200, help="requests per benchmark"
+    )
+    parser.add_argument("--workers", type=int, default=16, help="concurrent requests")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per timing")
+    parser.add_argument("--bars", type=int, default=1250, help="bars per daily chart")
+    parser.add_argument("--bulk-rows", type=int, default=20000, help="bulk CSV rows")
+    parser.add_argument(
+        "--only", default=",".join(BENCHMARKS), help="comma-separated benchmarks"
+    )
+    parser.add_argument("--json", metavar="PATH", help="also write results here")
+    args = parser.parse_args(argv)
+    selected = [name for name in args.only.split(",") if name]
+    unknown = set(selected) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    report = {
+        "version": _version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "orjson": orjson is not None,
+        "settings": {
+            key: value for key, value in vars(args).items() if key not in ("json",)
+        },
+        "results": {},
+    }
+    with MockFMPServer(
+        latency=args.latency,
+        rate_limit=args.rate_limit,
+        bars=args.bars,
+        bulk_rows=args.bulk_rows,
+    ) as server:
+        for name in selected:
+            started = time.perf_counter()
+            results = BENCHMARKS[name](server, args)
+            report["results"][name] = results
+            print(f"{name} ({time.perf_counter() - started:.1f}s)")
+            _print(name, results, indent=2)
+        report["server"] = {"requests": server.requests, "rejected": server.rejected}
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,143 +1,731 @@
-"""Financial Modeling Prep API client."""
+"""Financial Modeling Prep API client.
+
+Importing the package is cheap: endpoint modules, the WebSocket clients and
+the HTTP stack are imported on first use, the endpoint sub-clients of
+FinancialModelingPrep (quote, charts, ...) are created when first accessed,
+and the shared response cache is opened by the first request.
+"""
 from __future__ import annotations
 
-from requests_cache import CachedSession
-
-from financial_modeling_prep.bulk import BulkData
-from financial_modeling_prep.charts import Charts
-from financial_modeling_prep.commodities import Commodities
-from financial_modeling_prep.company_info import CompanyInfo
-from financial_modeling_prep.company_search import CompanySearch
-from financial_modeling_prep.constituents import Constituents
-from financial_modeling_prep.crypto import CryptoCurrency
-from financial_modeling_prep.dividends import Dividends
-from financial_modeling_prep.earnings import Earnings
-from financial_modeling_prep.earnings_transcripts import EarningsTranscripts
-from financial_modeling_prep.economic_data import EconomicData
-from financial_modeling_prep.esg import ESG
-from financial_modeling_prep.etf_holdings import ETFHoldings
-from financial_modeling_prep.financial_statements import FinancialStatements
-from financial_modeling_prep.forex import Forex
-from financial_modeling_prep.fundraising import Fundraising
-from financial_modeling_prep.insider_trading import InsiderTrading
-from financial_modeling_prep.institutional_stock_ownership import (
-    InstitutionalStockOwnership,
-)
-from financial_modeling_prep.ipo_calendar import IPOCalendar
-from financial_modeling_prep.market_performance import MarketPerformance
-from financial_modeling_prep.mergers_and_acquisitions import MergersAndAcquisitions
-from financial_modeling_prep.mutual_fund_holdings import MutualFundHoldings
-from financial_modeling_prep.news import News
-from financial_modeling_prep.price_targets import PriceTargets
-from financial_modeling_prep.quote import Quote
-from financial_modeling_prep.sales_revenue_by_segments import SalesRevenueBySegments
-from financial_modeling_prep.sec_filings import SECFilings
-from financial_modeling_prep.senate import Senate
-from financial_modeling_prep.splits import Splits
-from financial_modeling_prep.statement_analysis import StatementAnalysis
-from financial_modeling_prep.stock_list import StockList
-from financial_modeling_prep.technical_indicators import TechnicalIndicators
-from financial_modeling_prep.upgrades_downgrades import UpgradesAndDowngrades
-from financial_modeling_prep.valuation import Valuation
-from financial_modeling_prep.websockets import (
-    CompanyWSClient,
-    CryptoWSClient,
-    ForexWSClient,
-)
+import importlib
+import threading
+import time
+from typing import TYPE_CHECKING
 
-session = CachedSession(
-    "fmp_cache",
-    ignored_parameters=["api_key"],
-    use_cache_dir=True,
-    cache_control=True,
-    expire_after=300,
-    allowable_methods=("GET", "POST"),
+from financial_modeling_prep.columns import Columns
+from financial_modeling_prep.csv_stream import iter_csv_rows, iter_text
+from financial_modeling_prep.errors import APIError, error_message
+from financial_modeling_prep.instrumentation import (
+    OFF,
+    MetricsCollector,
+    RequestEvent,
+    cache_status,
+    emit,
 )
+from financial_modeling_prep.rate_limit import RateLimiter
+
+if TYPE_CHECKING:
+    from requests_cache import CachedSession
+
+    from financial_modeling_prep.async_client import AsyncFinancialModelingPrep
+    from financial_modeling_prep.async_websockets import AsyncWSClient
+    from financial_modeling_prep.bar_aggregator import BarAggregator
+    from financial_modeling_prep.bar_store import BarStore
+    from financial_modeling_prep.bulk import BulkData
+    from financial_modeling_prep.bulk_store import BulkStore
+    from financial_modeling_prep.cache import LRUCache
+    from financial_modeling_prep.charts import Charts
+    from financial_modeling_prep.coalesce import Coalescer
+    from financial_modeling_prep.commodities import Commodities
+    from financial_modeling_prep.company_info import CompanyInfo
+    from financial_modeling_prep.company_search import CompanySearch
+    from financial_modeling_prep.constituents import Constituents
+    from financial_modeling_prep.crypto import CryptoCurrency
+    from financial_modeling_prep.dividends import Dividends
+    from financial_modeling_prep.earnings import Earnings
+    from financial_modeling_prep.earnings_transcripts import EarningsTranscripts
+    from financial_modeling_prep.economic_data import EconomicData
+    from financial_modeling_prep.esg import ESG
+    from financial_modeling_prep.etf_holdings import ETFHoldings
+    from financial_modeling_prep.fan_out import SymbolResult
+    from financial_modeling_prep.financial_statements import FinancialStatements
+    from financial_modeling_prep.forex import Forex
+    from financial_modeling_prep.fundraising import Fundraising
+    from financial_modeling_prep.insider_trading import InsiderTrading
+    from financial_modeling_prep.institutional_stock_ownership import (
+        InstitutionalStockOwnership,
+    )
+    from financial_modeling_prep.ipo_calendar import IPOCalendar
+    from financial_modeling_prep.market_performance import MarketPerformance
+    from financial_modeling_prep.mergers_and_acquisitions import MergersAndAcquisitions
+    from financial_modeling_prep.mutual_fund_holdings import MutualFundHoldings
+    from financial_modeling_prep.news import News
+    from financial_modeling_prep.price_targets import PriceTargets
+    from financial_modeling_prep.quote import Quote
+    from financial_modeling_prep.quote_book import QuoteBook
+    from financial_modeling_prep.sales_revenue_by_segments import SalesRevenueBySegments
+    from financial_modeling_prep.sec_filings import SECFilings
+    from financial_modeling_prep.senate import Senate
+    from financial_modeling_prep.splits import Splits
+    from financial_modeling_prep.statement_analysis import StatementAnalysis
+    from financial_modeling_prep.stock_list import StockList
+    from financial_modeling_prep.structs import Struct
+    from financial_modeling_prep.technical_indicators import TechnicalIndicators
+    from financial_modeling_prep.tick_log import TickLog, TickRecorder
+    from financial_modeling_prep.ticks import Tick
+    from financial_modeling_prep.ttl import TTLPolicy
+    from financial_modeling_prep.upgrades_downgrades import UpgradesAndDowngrades
+    from financial_modeling_prep.valuation import Valuation
+    from financial_modeling_prep.websockets import (
+        CompanyWSClient,
+        CryptoWSClient,
+        ForexWSClient,
+    )
+
+BASE_URL = "https://financialmodelingprep.com/api/"
+
+# Bytes read from the network at a time while streaming bulk CSV bodies.
+STREAM_CHUNK_SIZE = 1 << 16
+
+# Public names imported from their module on first access, including the
+# endpoint classes the package used to import eagerly.
+LAZY_NAMES = {
+    "AsyncFinancialModelingPrep": "async_client",
+    "AsyncWSClient": "async_websockets",
+    "BarAggregator": "bar_aggregator",
+    "BarStore": "bar_store",
+    "BulkData": "bulk",
+    "BulkStore": "bulk_store",
+    "CachedSession": "cache",
+    "Charts": "charts",
+    "Commodities": "commodities",
+    "CompanyInfo": "company_info",
+    "CompanySearch": "company_search",
+    "CompanyWSClient": "websockets",
+    "Constituents": "constituents",
+    "CryptoCurrency": "crypto",
+    "CryptoWSClient": "websockets",
+    "Dividends": "dividends",
+    "ESG": "esg",
+    "ETFHoldings": "etf_holdings",
+    "Earnings": "earnings",
+    "EarningsTranscripts": "earnings_transcripts",
+    "EconomicData": "economic_data",
+    "FinancialStatements": "financial_statements",
+    "Forex": "forex",
+    "ForexWSClient": "websockets",
+    "Fundraising": "fundraising",
+    "IPOCalendar": "ipo_calendar",
+    "InsiderTrading": "insider_trading",
+    "InstitutionalStockOwnership": "institutional_stock_ownership",
+    "LRUCache": "cache",
+    "MarketPerformance": "market_performance",
+    "MergersAndAcquisitions": "mergers_and_acquisitions",
+    "MutualFundHoldings": "mutual_fund_holdings",
+    "News": "news",
+    "PriceTargets": "price_targets",
+    "Quote": "quote",
+    "QuoteBook": "quote_book",
+    "SECFilings": "sec_filings",
+    "SalesRevenueBySegments": "sales_revenue_by_segments",
+    "Senate": "senate",
+    "Splits": "splits",
+    "StatementAnalysis": "statement_analysis",
+    "StockList": "stock_list",
+    "Struct": "structs",
+    "SymbolResult": "fan_out",
+    "TTLPolicy": "ttl",
+    "TechnicalIndicators": "technical_indicators",
+    "Tick": "ticks",
+    "TickLog": "tick_log",
+    "TickRecorder": "tick_log",
+    "UpgradesAndDowngrades": "upgrades_downgrades",
+    "Valuation": "valuation",
+}
+
+_shared_lock = threading.Lock()
+
+
+def _shared(name, factory):
+    """Returns the module attribute name, setting it to factory() if unset."""
+    value = globals().get(name)
+    if value is None:
+        with _shared_lock:
+            value = globals().get(name)
+            if value is None:
+                value = globals()[name] = factory()
+    return value
+
+
+def default_session():
+    """Returns the cached session shared by clients, created on first use.
+
+    Assigning financial_modeling_prep.session before the first request
+    replaces it.
+
+    Returns:
+        requests.Session
+    """
+
+    def create():
+        # pylint: disable-next=import-outside-toplevel
+        from financial_modeling_prep.cache import create_session
+
+        return create_session()
+
+    return _shared("session", create)
+
+
+def default_stream_session():
+    """Returns the uncached session used to stream bulk downloads.
+
+    Bulk downloads bypass the cache, which would read every body into memory.
+
+    Returns:
+        requests.Session
+    """
+
+    def create():
+        # pylint: disable-next=import-outside-toplevel
+        import requests
+
+        return requests.Session()
+
+    return _shared("stream_session", create)
+
+
+def __getattr__(name):  # pylint: disable=invalid-name
+    """Imports lazy public names, the shared sessions and submodules."""
+    if name == "session":
+        return default_session()
+    if name == "stream_session":
+        return default_stream_session()
+    module = LAZY_NAMES.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+        globals()[name] = value
+        return value
+    try:
+        return importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as error:
+        if error.name != f"{__name__}.{name}":
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():  # pylint: disable=invalid-name
+    """Lists the lazy names along with the loaded ones."""
+    return sorted(set(globals()) | set(LAZY_NAMES) | {"session", "stream_session"})
+
+
+class _SubClient:
+    """An endpoint sub-client of FinancialModelingPrep, created on first access.
+
+    The instance is then stored on the client, so later lookups are plain
+    attribute reads.
+    """
+
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.name = name
+        self.attribute = None
+
+    def __set_name__(self, owner, attribute):
+        self.attribute = attribute
+
+    def __get__(self, api, owner=None):
+        if api is None:
+            return self
+        module = importlib.import_module(f"{__package__}.{self.module}")
+        client = getattr(module, self.name)(api)
+        return api.__dict__.setdefault(self.attribute, client)
+
+
+def _retry_after(response, default: float = 1.0) -> float:
+    """Returns the delay requested by a 429 response's Retry-After header."""
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", default)))
+    except ValueError:
+        return default
 
 
 class FinancialModelingPrep:
     """A class for interacting with the Financial Modeling Prep API.
 
     Methods:
-    - get(endpoint, params=None):
+    - get(endpoint, params=None, as_columns=False, struct=None):
+    - request(endpoint, params=None, struct=None):
+    - stream(endpoint, params=None, typed=True, as_columns=False):
+    - map(method, symbols, workers=8, **kwargs):
+    - batch(method, symbols, **kwargs):
     """
 
-    def __init__(self, api_key):
+    bulk_data = _SubClient("bulk", "BulkData")
+    charts = _SubClient("charts", "Charts")
+    commodities = _SubClient("commodities", "Commodities")
+    company_info = _SubClient("company_info", "CompanyInfo")
+    company_search = _SubClient("company_search", "CompanySearch")
+    constituents = _SubClient("constituents", "Constituents")
+    crypto = _SubClient("crypto", "CryptoCurrency")
+    dividends = _SubClient("dividends", "Dividends")
+    earnings = _SubClient("earnings", "Earnings")
+    earnings_transcripts = _SubClient("earnings_transcripts", "EarningsTranscripts")
+    economic_data = _SubClient("economic_data", "EconomicData")
+    esg = _SubClient("esg", "ESG")
+    etf_holdings = _SubClient("etf_holdings", "ETFHoldings")
+    financial_statements = _SubClient("financial_statements", "FinancialStatements")
+    forex = _SubClient("forex", "Forex")
+    fundraising = _SubClient("fundraising", "Fundraising")
+    insider_trading = _SubClient("insider_trading", "InsiderTrading")
+    institutional_stock_ownership = _SubClient(
+        "institutional_stock_ownership", "InstitutionalStockOwnership"
+    )
+    ipo_calendar = _SubClient("ipo_calendar", "IPOCalendar")
+    market_performance = _SubClient("market_performance", "MarketPerformance")
+    mergers_and_acquisitions = _SubClient(
+        "mergers_and_acquisitions", "MergersAndAcquisitions"
+    )
+    mutual_fund_holdings = _SubClient("mutual_fund_holdings", "MutualFundHoldings")
+    news = _SubClient("news", "News")
+    price_targets = _SubClient("price_targets", "PriceTargets")
+    quote = _SubClient("quote", "Quote")
+    sales_revenue_by_segments = _SubClient(
+        "sales_revenue_by_segments", "SalesRevenueBySegments"
+    )
+    sec_filings = _SubClient("sec_filings", "SECFilings")
+    senate = _SubClient("senate", "Senate")
+    splits = _SubClient("splits", "Splits")
+    statement_analysis = _SubClient("statement_analysis", "StatementAnalysis")
+    stock_list = _SubClient("stock_list", "StockList")
+    technical_indicators = _SubClient("technical_indicators", "TechnicalIndicators")
+    upgrades_and_downgrades = _SubClient("upgrades_downgrades", "UpgradesAndDowngrades")
+    valuation = _SubClient("valuation", "Valuation")
+
+    def __init__(
+        self,
+        api_key,
+        *,
+        plan: str | None = None,
+        rate_limiter: RateLimiter | None = None,
+        max_retries: int = 2,
+        coalesce_window: float | None = None,
+        cache=None,
+        ttl_policy: TTLPolicy | None = None,
+        hooks=None,
+        single_flight: bool = False,
+    ):
         """Initializes the FinancialModelingPrep API client.
 
         Args:
             api_key (str): The API key for FinancialModelingPrep.com.
+            plan (str, optional): The FMP plan tier (basic, starter, premium or
+             ultimate), paces requests just under the plan's quota.
+            rate_limiter (RateLimiter, optional): A limiter to share with other
+             clients, takes precedence over plan.
+            max_retries (int): How many times to retry a request answered
+             with HTTP 429.
+            coalesce_window (float, optional): When set, concurrent
+             single-symbol requests to endpoints accepting comma-separated
+             symbols are gathered for this many seconds and sent as one batch.
+            cache (optional): The response cache of this client, a backend
+             name or requests-cache backend object (see create_session), or
+             False to disable caching. Clients share one SQLite cache by
+             default.
+            ttl_policy (TTLPolicy, optional): How long responses of each
+             endpoint stay cached, the built-in table by default.
+            hooks (list, optional): Callables receiving a RequestEvent after
+             every request, e.g. a MetricsCollector.
+            single_flight (bool): Let concurrent identical requests (same
+             endpoint and params) share one network call and one decoded
+             result, the very same object for every caller.
 
         Returns:
             None
         """
         self.api_key = api_key
-        self.bulk_data = BulkData(self)
-        self.charts = Charts(self)
-        self.commodities = Commodities(self)
-        self.company_info = CompanyInfo(self)
-        self.company_search = CompanySearch(self)
-        self.constituents = Constituents(self)
-        self.crypto = CryptoCurrency(self)
-        self.dividends = Dividends(self)
-        self.earnings = Earnings(self)
-        self.earnings_transcripts = EarningsTranscripts(self)
-        self.economic_data = EconomicData(self)
-        self.esg = ESG(self)
-        self.etf_holdings = ETFHoldings(self)
-        self.financial_statements = FinancialStatements(self)
-        self.forex = Forex(self)
-        self.fundraising = Fundraising(self)
-        self.insider_trading = InsiderTrading(self)
-        self.institutional_stock_ownership = InstitutionalStockOwnership(self)
-        self.ipo_calendar = IPOCalendar(self)
-        self.market_performance = MarketPerformance(self)
-        self.mergers_and_acquisitions = MergersAndAcquisitions(self)
-        self.mutual_fund_holdings = MutualFundHoldings(self)
-        self.news = News(self)
-        self.price_targets = PriceTargets(self)
-        self.quote = Quote(self)
-        self.sales_revenue_by_segments = SalesRevenueBySegments(self)
-        self.sec_filings = SECFilings(self)
-        self.senate = Senate(self)
-        self.splits = Splits(self)
-        self.statement_analysis = StatementAnalysis(self)
-        self.stock_list = StockList(self)
-        self.technical_indicators = TechnicalIndicators(self)
-        self.upgrades_and_downgrades = UpgradesAndDowngrades(self)
-        self.valuation = Valuation(self)
-
-    def get(self, endpoint, params: dict | None = None):
+        self.cache = cache
+        self.base_url = BASE_URL
+        self.coalesce_window = coalesce_window or 0.0
+        self.coalesce = coalesce_window is not None
+        self._session = None
+        self._stream_session = None
+        self._ttl_policy = ttl_policy
+        self._coalescer = None
+        self._lazy_lock = threading.Lock()
+        if rate_limiter is None and plan is not None:
+            rate_limiter = RateLimiter.for_plan(plan)
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.hooks = list(hooks or ())
+        self.single_flight = None
+        if single_flight:
+            # pylint: disable-next=import-outside-toplevel
+            from financial_modeling_prep.single_flight import SingleFlight
+
+            self.single_flight = SingleFlight()
+
+    def _once(self, attribute, factory):
+        """Returns getattr(self, attribute), setting it to factory() if None."""
+        value = getattr(self, attribute)
+        if value is None:
+            with self._lazy_lock:
+                value = getattr(self, attribute)
+                if value is None:
+                    value = factory()
+                    setattr(self, attribute, value)
+        return value
+
+    @property
+    def session(self):
+        """The HTTP session of this client, created on the first request."""
+        return self._once("_session", self._create_session)
+
+    @session.setter
+    def session(self, value):
+        self._session = value
+
+    @property
+    def stream_session(self):
+        """The uncached HTTP session used by stream(), created on first use."""
+        return self._once("_stream_session", self._create_stream_session)
+
+    @property
+    def ttl_policy(self) -> TTLPolicy:
+        """The TTLPolicy of this client, the built-in table by default."""
+
+        def create():
+            # pylint: disable-next=import-outside-toplevel
+            from financial_modeling_prep.ttl import TTLPolicy
+
+            return TTLPolicy()
+
+        return self._once("_ttl_policy", create)
+
+    @ttl_policy.setter
+    def ttl_policy(self, value):
+        self._ttl_policy = value
+
+    @property
+    def coalescer(self) -> Coalescer:
+        """The Coalescer batching requests of this client."""
+
+        def create():
+            # pylint: disable-next=import-outside-toplevel
+            from financial_modeling_prep.coalesce import Coalescer
+
+            return Coalescer(self, window=self.coalesce_window)
+
+        return self._once("_coalescer", create)
+
+    def _create_session(self):
+        if self.cache is None:
+            return default_session()
+        if self.cache is False:
+            # pylint: disable-next=import-outside-toplevel
+            import requests  # Without requests-cache, which is slow to import.
+
+            return requests.Session()
+        # pylint: disable-next=import-outside-toplevel
+        from financial_modeling_prep.cache import create_session
+
+        return create_session(self.cache)
+
+    def _create_stream_session(self):
+        return default_stream_session()
+
+    def get(
+        self,
+        endpoint,
+        params: dict | None = None,
+        as_columns: bool = False,
+        struct: type[Struct] | None = None,
+    ):
         """
         Makes an API request to the specified endpoint with optional parameters.
 
         Args:
             endpoint (str): The API endpoint to request data from.
             params (dict, optional): Additional parameters for the API request.
+            as_columns (bool): Decode the rows into a Columns table.
+            struct (type[Struct], optional): Decode the rows into instances of
+             this Struct subclass, see financial_modeling_prep.structs.
 
         Returns:
-            dict: The json response.
+            dict: The json response, Columns when as_columns is set, or a
+             list of struct when struct is given.
             Invalid API Key: {
                 'Error Message':
                 'Invalid API KEY. Please retry or visit our documentation to
                 create one FREE https://financialmodelingprep.com/developer/docs'
             }
+
+        Raises:
+            ValueError: Both as_columns and struct are given.
         """
+        if as_columns and struct is not None:
+            raise ValueError("Pass either as_columns or struct, not both.")
+        if self.coalesce and not params and not as_columns and struct is None:
+            match = self.coalescer.match(endpoint)
+            if match is not None:
+                return self.coalescer.get(*match)
+        payload = self.request(endpoint, params, struct=struct)
+        if not as_columns and struct is None:
+            return payload
+        message = error_message(payload)
+        if message is not None:
+            raise APIError(message)
+        if struct is not None:
+            return payload
+        return Columns.from_payload(payload)
+
+    def request(
+        self,
+        endpoint,
+        params: dict | None = None,
+        struct: type[Struct] | None = None,
+    ):
+        """Requests the endpoint directly, bypassing request coalescing.
+
+        Args:
+            endpoint (str): The API endpoint to request data from.
+            params (dict, optional): Additional parameters for the API request.
+            struct (type[Struct], optional): Decode the rows into instances of
+             this Struct subclass.
+
+        Returns:
+            dict: The json response, or a list of struct when struct is given
+             and the response is not an error payload.
+        """
+        if self.single_flight is not None:
+            # pylint: disable-next=import-outside-toplevel
+            from financial_modeling_prep.single_flight import request_key
+
+            return self.single_flight.do(
+                request_key(endpoint, params, (struct,)),
+                self._request,
+                endpoint,
+                params,
+                struct,
+            )
+        return self._request(endpoint, params, struct)
+
+    def _request(self, endpoint, params, struct):
+        kwargs = {}
+        if hasattr(self.session, "cache"):
+            kwargs["expire_after"] = self.ttl_policy.expire_after(endpoint, params)
+        if not self.hooks:
+            return self._decode(
+                self._send(self.session, endpoint, params, **kwargs), struct
+            )
+        started = time.perf_counter()
+        response = received = None
+        try:
+            response = self._send(self.session, endpoint, params, **kwargs)
+            received = time.perf_counter()
+            payload = self._decode(response, struct)
+        except Exception as exc:
+            self._emit(endpoint, response, started, received, repr(exc))
+            raise
+        self._emit(endpoint, response, started, received, error_message(payload))
+        return payload
+
+    def _emit(self, endpoint, response, started, received, error, *, size=None):
+        """Sends the RequestEvent of a request to the hooks.
+
+        size is the number of body bytes read from a streamed response, whose
+        content cannot be read again.
+        """
+        finished = time.perf_counter()
+        if received is None:
+            received = finished
+        throttled = getattr(response, "throttled", 0.0)
+        if size is None:
+            size = 0 if response is None else len(response.content)
+        emit(
+            self.hooks,
+            RequestEvent(
+                endpoint=endpoint,
+                template=self.ttl_policy.template(endpoint) or endpoint,
+                status=0 if response is None else response.status_code,
+                network_seconds=received - started - throttled,
+                decode_seconds=finished - received,
+                throttled_seconds=throttled,
+                bytes=size,
+                cache=OFF if response is None else cache_status(response),
+                retries=getattr(response, "retries", 0),
+                error=error,
+            ),
+        )
+
+    @staticmethod
+    def _decode(response, struct):
+        """Returns the decoded body, as rows of struct unless it is an error."""
+        if struct is None:
+            return response.json()
+        # pylint: disable-next=import-outside-toplevel
+        from financial_modeling_prep.ticks import loads
+
+        payload = loads(response.content)
+        if error_message(payload) is not None:
+            return payload
+        return struct.from_payload(payload)
+
+    def stream(
+        self,
+        endpoint,
+        params: dict | None = None,
+        typed: bool = True,
+        as_columns: bool = False,
+    ):
+        """Streams a CSV endpoint, yielding one row at a time.
+
+        The body is read in STREAM_CHUNK_SIZE pieces and never held in memory
+        as a whole, so the largest bulk files can be processed row by row.
+
+        Args:
+            endpoint (str): The API endpoint to request data from.
+            params (dict, optional): Additional parameters for the API request.
+            typed (bool): Convert numeric fields to int/float and empty
+             fields to None.
+            as_columns (bool): Collect the rows into a Columns table instead.
+
+        Returns:
+            Iterator[dict]: The rows, keyed by the CSV header, or Columns
+             when as_columns is set.
+
+        Raises:
+            APIError: The API answered with an error payload.
+        """
+        rows = self._stream_rows(endpoint, params, typed)
+        if as_columns:
+            return Columns.from_rows(rows)
+        return rows
+
+    def _stream_rows(self, endpoint, params, typed):
+        started = time.perf_counter()
+        response = received = error = None
+        size = 0
+
+        def chunks():
+            nonlocal size
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                size += len(chunk)
+                yield chunk
+
+        try:
+            response = self._send(self.stream_session, endpoint, params, stream=True)
+            received = time.perf_counter()
+            with response:
+                content_type = response.headers.get("Content-Type", "")
+                if "json" in content_type:
+                    payload = response.json()
+                    size = len(response.content)
+                    error = error_message(payload) or str(payload)
+                    raise APIError(error)
+                response.raise_for_status()
+                # requests assumes ISO-8859-1 for text/csv without a charset,
+                # the bulk files are UTF-8.
+                encoding = "utf-8"
+                if "charset=" in content_type.lower():
+                    encoding = response.encoding
+                lines = iter_text(chunks(), encoding)
+                yield from iter_csv_rows(lines, typed=typed)
+        except Exception as exc:
+            error = error or repr(exc)
+            raise
+        finally:
+            # Also reached when the caller stops iterating early.
+            if self.hooks:
+                self._emit(endpoint, response, started, received, error, size=size)
+
+    def _send(self, http, endpoint, params: dict | None = None, **kwargs):
+        """Sends the request, pacing and retrying it as configured."""
         if params is None:
             params = {}
         params["apikey"] = self.api_key
 
-        response = session.get(
-            f"https://financialmodelingprep.com/api/{endpoint}",
-            params=params,
-            timeout=5,
-        )
-        return response.json()
+        throttled = 0.0
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter is not None:
+                throttled += self.rate_limiter.acquire()
+            response = http.get(
+                f"{self.base_url}{endpoint}",
+                params=params,
+                timeout=5,
+                **kwargs,
+            )
+            if response.status_code != 429 or attempt == self.max_retries:
+                break
+            response.close()
+            delay = _retry_after(response)
+            if self.rate_limiter is not None:
+                self.rate_limiter.penalize(delay)
+            else:
+                time.sleep(delay)
+                throttled += delay
+        response.retries = attempt
+        response.throttled = throttled
+        return response
+
+    def map(self, method, symbols, workers: int = 8, **kwargs):
+        """Calls a per-symbol endpoint method for many symbols concurrently.
+
+        Args:
+            method: A bound endpoint method of this client taking the symbol
+             first, e.g. api.valuation.discounted_cashflow.
+            symbols: The symbols to request.
+            workers (int): The number of worker threads.
+            **kwargs: Extra keyword arguments for every call.
+
+        Returns:
+            Iterator[SymbolResult]: Results in completion order, see fan_out.
+             AsyncFinancialModelingPrep.map returns an async iterator.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from financial_modeling_prep.fan_out import fan_out
+
+        return fan_out(method, symbols, workers=workers, **kwargs)
+
+    def batch(self, method, symbols, **kwargs) -> dict:
+        """Requests many symbols through a method accepting "AAPL,MSFT,...".
+
+        Symbols are packed into as few URL-length-bounded requests as possible,
+        e.g. api.batch(api.quote.get_full_quote, symbols).
+
+        Args:
+            method: A bound endpoint method of this client taking the symbol
+             first.
+            symbols: The symbols to request.
+            **kwargs: Extra keyword arguments for every call.
+
+        Returns:
+            dict: Symbol to the list of rows returned for it.
+             AsyncFinancialModelingPrep.batch is awaitable.
+        """
+        return self.coalescer.get_many(method, symbols, **kwargs)
 
 
 __all__ = [
+    "APIError",
+    "AsyncFinancialModelingPrep",
+    "AsyncWSClient",
+    "BarAggregator",
+    "BarStore",
+    "BulkStore",
+    "Columns",
     "CompanyWSClient",
     "CryptoWSClient",
     "FinancialModelingPrep",
     "ForexWSClient",
+    "LRUCache",
+    "MetricsCollector",
+    "QuoteBook",
+    "RateLimiter",
+    "RequestEvent",
+    "Struct",
+    "SymbolResult",
+    "TTLPolicy",
+    "Tick",
+    "TickLog",
+    "TickRecorder",
 ]
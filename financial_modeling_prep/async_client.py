@@ -0,0 +1,239 @@
+"""The asyncio client, AsyncFinancialModelingPrep."""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+
+from requests.adapters import HTTPAdapter
+
+from financial_modeling_prep import FinancialModelingPrep
+
+
+class AsyncFinancialModelingPrep(FinancialModelingPrep):
+    """An asyncio counterpart to FinancialModelingPrep.
+
+    Every sub-client (quote, financial_statements, company_info, ...) is the
+    same class used by the synchronous client, their methods simply return
+    the awaitable produced by get().
+
+    Requests are executed on a bounded worker pool over a keep-alive
+    connection pool sized to max_concurrency, so up to max_concurrency
+    requests are in flight at once. The connection pool belongs to the
+    client, the response cache is shared as with FinancialModelingPrep.
+
+    Helpers that make requests on their own while computing, BarStore,
+    BulkStore and TechnicalIndicators.compute_technical_indicator (without
+    bars) or compute_many, need a FinancialModelingPrep and raise TypeError.
+
+    Methods:
+    - get(endpoint, params=None, as_columns=False, struct=None): awaitable
+    - map(method, symbols, workers=8, **kwargs): async iterator
+    - batch(method, symbols, **kwargs): awaitable
+    - close():
+    """
+
+    def __init__(self, api_key, max_concurrency: int = 100, **kwargs):
+        """Initializes the async FinancialModelingPrep API client.
+
+        Args:
+            api_key (str): The API key for FinancialModelingPrep.com.
+            max_concurrency (int): The maximum number of requests in flight.
+            **kwargs: Passed to FinancialModelingPrep, e.g. plan or rate_limiter.
+
+        Returns:
+            None
+        """
+        super().__init__(api_key, **kwargs)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="fmp"
+        )
+        self._semaphore = None
+
+    def _mount(self, session):
+        session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency),
+        )
+        return session
+
+    def _create_session(self):
+        # A session of its own even over the shared cache, so the larger
+        # pool does not change the transport of other clients.
+        if self.cache is None:
+            # pylint: disable-next=import-outside-toplevel
+            from financial_modeling_prep.cache import create_session
+
+            return self._mount(create_session())
+        return self._mount(super()._create_session())
+
+    def _create_stream_session(self):
+        # pylint: disable-next=import-outside-toplevel
+        import requests
+
+        return self._mount(requests.Session())
+
+    async def get(  # pylint: disable=invalid-overridden-method
+        self, endpoint, params: dict | None = None, as_columns=False, struct=None
+    ):
+        """
+        Makes an API request to the specified endpoint with optional parameters.
+
+        Args:
+            endpoint (str): The API endpoint to request data from.
+            params (dict, optional): Additional parameters for the API request.
+            as_columns (bool): Decode the rows into a Columns table.
+            struct (type[Struct], optional): Decode the rows into instances of
+             this Struct subclass.
+
+        Returns:
+            dict: The json response, Columns when as_columns is set, or a
+             list of struct when struct is given.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                partial(
+                    super().get,
+                    endpoint,
+                    params,
+                    as_columns=as_columns,
+                    struct=struct,
+                ),
+            )
+
+    def map(self, method, symbols, workers: int = 8, **kwargs):
+        """Awaits a per-symbol endpoint method for many symbols concurrently.
+
+        Args:
+            method: A bound endpoint method of this client taking the symbol
+             first, e.g. api.valuation.discounted_cashflow.
+            symbols: The symbols to request.
+            workers (int): The most requests awaited at once.
+            **kwargs: Extra keyword arguments for every call.
+
+        Returns:
+            AsyncIterator[SymbolResult]: Results in completion order, see
+             fan_out_async.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from financial_modeling_prep.fan_out import fan_out_async
+
+        return fan_out_async(method, symbols, workers=workers, **kwargs)
+
+    async def batch(  # pylint: disable=invalid-overridden-method
+        self, method, symbols, **kwargs
+    ) -> dict:
+        """Requests many symbols through a method accepting "AAPL,MSFT,...".
+
+        The URL-length-bounded groups of FinancialModelingPrep.batch are
+        requested concurrently.
+
+        Args:
+            method: A bound endpoint method of this client taking the symbol
+             first.
+            symbols: The symbols to request.
+            **kwargs: Extra keyword arguments for every call.
+
+        Returns:
+            dict: Symbol to the list of rows returned for it.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from financial_modeling_prep.coalesce import split_by_symbol
+
+        chunks = self.coalescer.chunks(symbols)
+        payloads = await asyncio.gather(
+            *(method(",".join(chunk), **kwargs) for chunk in chunks)
+        )
+        results = {}
+        for chunk, payload in zip(chunks, payloads):
+            results.update(split_by_symbol(chunk, payload))
+        return results
+
+    def stream(
+        self,
+        endpoint,
+        params: dict | None = None,
+        typed: bool = True,
+        as_columns: bool = False,
+        batch_size: int = 1000,
+    ):
+        """Streams a CSV endpoint, yielding one row at a time.
+
+        Rows are parsed on the worker pool batch_size at a time, so the event
+        loop is never blocked on the download.
+
+        Args:
+            endpoint (str): The API endpoint to request data from.
+            params (dict, optional): Additional parameters for the API request.
+            typed (bool): Convert numeric fields to int/float and empty
+             fields to None.
+            as_columns (bool): Return an awaitable Columns table instead.
+            batch_size (int): Rows parsed per hop to the worker pool.
+
+        Returns:
+            AsyncIterator[dict]: The rows, keyed by the CSV header, or an
+             awaitable of Columns when as_columns is set.
+        """
+        if as_columns:
+            return asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                partial(super().stream, endpoint, params, typed, as_columns=True),
+            )
+        return self._stream_batches(
+            super().stream(endpoint, params, typed=typed), batch_size
+        )
+
+    async def _stream_batches(self, rows, batch_size):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                batch = await loop.run_in_executor(
+                    self._executor, list, islice(rows, batch_size)
+                )
+                if not batch:
+                    return
+                for row in batch:
+                    yield row
+        finally:
+            await loop.run_in_executor(self._executor, rows.close)
+
+    def close(self):
+        """Shuts down the worker pool once pending requests have finished.
+
+        Returns:
+            None
+        """
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        """Returns the client for use as an async context manager."""
+        return self
+
+    async def __aexit__(self, *_):
+        """Closes the client when leaving the async context manager."""
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+def require_sync(api, feature: str):
+    """Raises TypeError when api is an AsyncFinancialModelingPrep.
+
+    Args:
+        api: The client given to feature.
+        feature (str): What needs a synchronous client, for the message.
+
+    Returns:
+        None
+    """
+    if isinstance(api, AsyncFinancialModelingPrep):
+        raise TypeError(
+            f"{feature} needs a FinancialModelingPrep client, not an "
+            "AsyncFinancialModelingPrep."
+        )
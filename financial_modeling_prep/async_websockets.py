@@ -0,0 +1,256 @@
+"""An asyncio WebSocket client for the Company, Crypto and Forex feeds.
+
+One AsyncWSClient holds a connection per feed on the running event loop and
+merges their ticks into a single async iterator. Connections are opened on the
+first subscription to a feed and reopened with backoff when they drop, with
+their subscriptions restored. Requires the websockets package.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+
+try:
+    import websockets
+except ImportError:  # pragma: no cover
+    websockets = None
+
+from financial_modeling_prep.ticks import decode
+from financial_modeling_prep.websockets import (
+    COMPANY_WEBSOCKET_ENDPOINT,
+    CRYPTO_WEBSOCKET_ENDPOINT,
+    FOREX_WEBSOCKET_ENDPOINT,
+    MAX_RECONNECT_DELAY,
+    RECONNECT_DELAY,
+    SUBSCRIBE_BATCH_SIZE,
+    SUBSCRIBE_INTERVAL,
+)
+
+FEEDS = {
+    "company": COMPANY_WEBSOCKET_ENDPOINT,
+    "crypto": CRYPTO_WEBSOCKET_ENDPOINT,
+    "forex": FOREX_WEBSOCKET_ENDPOINT,
+}
+
+_CLOSED = object()
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWSClient:
+    """Streams the ticks of every subscribed feed on one event loop.
+
+    Example:
+        async with AsyncWSClient(api_key) as client:
+            await client.subscribe(["aapl", "msft"])
+            await client.subscribe(["btcusd"], feed="crypto")
+            async for tick in client.stream():
+                ...
+
+    Methods:
+    - subscribe(tickers, feed="company")
+    - unsubscribe(tickers, feed="company")
+    - stream()
+    - close()
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        queue_size: int = 10000,
+        reconnect: bool = True,
+        max_reconnect_delay: float = MAX_RECONNECT_DELAY,
+        on_event=None,
+    ):
+        """Initializes the client.
+
+        Args:
+            api_key (str): The API key for authentication.
+            queue_size (int): The most ticks held for stream(), the oldest are
+             dropped beyond it.
+            reconnect (bool): Reconnect when a connection drops.
+            max_reconnect_delay (float): The longest wait between attempts,
+             in seconds.
+            on_event (function, optional): Called with the messages that are
+             not ticks, such as login and subscription replies.
+
+        Returns:
+            None
+        """
+        if websockets is None:
+            raise ImportError("AsyncWSClient requires the websockets package.")
+        self.api_key = api_key
+        self.reconnect = reconnect
+        self.max_reconnect_delay = max_reconnect_delay
+        self.on_event = on_event
+        self.endpoints = dict(FEEDS)
+        self.subscriptions = {feed: set() for feed in FEEDS}
+        self.dropped = 0
+        self.queue_size = queue_size
+        # Created on first use, inside the running loop: before Python 3.10 a
+        # Queue binds to the loop current when it is created.
+        self._queue = None
+        self._connections = {}
+        self._tasks = {}
+        self._closed = False
+
+    async def __aenter__(self):
+        """Returns the client."""
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Closes every connection."""
+        await self.close()
+
+    def _get_queue(self):
+        """Returns the queue feeding stream(), creating it on first use."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.queue_size)
+        return self._queue
+
+    def _put(self, item):
+        """Queues an item for stream(), dropping the oldest when full."""
+        queue = self._get_queue()
+        if queue.full():
+            queue.get_nowait()
+            self.dropped += 1
+        queue.put_nowait(item)
+
+    async def _send_many(self, connection, event, tickers):
+        """Sends tickers in batched, paced frames."""
+        for start in range(0, len(tickers), SUBSCRIBE_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(SUBSCRIBE_INTERVAL)
+            chunk = tickers[start : start + SUBSCRIBE_BATCH_SIZE]
+            await connection.send(
+                json.dumps(
+                    {
+                        "event": event,
+                        "data": {"ticker": chunk if len(chunk) > 1 else chunk[0]},
+                    }
+                )
+            )
+
+    async def _run(self, feed):
+        """Keeps the connection of a feed open and queues its ticks."""
+        delay = RECONNECT_DELAY
+        try:
+            while not self._closed:
+                try:
+                    async with websockets.connect(self.endpoints[feed]) as connection:
+                        await connection.send(
+                            json.dumps(
+                                {"event": "login", "data": {"apiKey": self.api_key}}
+                            )
+                        )
+                        self._connections[feed] = connection
+                        tickers = sorted(self.subscriptions[feed])
+                        if tickers:
+                            await self._send_many(connection, "subscribe", tickers)
+                        delay = RECONNECT_DELAY
+                        async for message in connection:
+                            try:
+                                ticks, events = decode(message)
+                            except (TypeError, ValueError):
+                                # One bad message does not drop the feed.
+                                logger.warning(
+                                    "Skipped an undecodable %s message: %.200r",
+                                    feed,
+                                    message,
+                                )
+                                continue
+                            for tick in ticks:
+                                self._put(tick)
+                            if self.on_event is not None:
+                                for event in events:
+                                    self.on_event(event)
+                except (OSError, asyncio.TimeoutError, websockets.WebSocketException):
+                    pass
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.exception("The %s feed failed.", feed)
+                finally:
+                    self._connections.pop(feed, None)
+                if self._closed or not self.reconnect:
+                    break
+                await asyncio.sleep(random.uniform(0, delay))
+                delay = min(delay * 2, self.max_reconnect_delay)
+        finally:
+            if self._tasks.get(feed) is asyncio.current_task():
+                del self._tasks[feed]
+            if not self._tasks:
+                self._put(_CLOSED)
+
+    def _feed(self, feed):
+        if feed not in FEEDS:
+            raise ValueError(
+                f"Unknown feed {feed!r}, expected one of {', '.join(FEEDS)}."
+            )
+        return feed
+
+    async def subscribe(self, tickers, feed: str = "company"):
+        """Subscribes to tickers, connecting to the feed if needed.
+
+        Args:
+            tickers (str | list[str]): The ticker symbols.
+            feed (str): company, crypto or forex.
+
+        Returns:
+            None
+        """
+        feed = self._feed(feed)
+        tickers = [tickers] if isinstance(tickers, str) else list(tickers)
+        self.subscriptions[feed].update(tickers)
+        connection = self._connections.get(feed)
+        if connection is not None:
+            await self._send_many(connection, "subscribe", tickers)
+        elif not self._closed and (feed not in self._tasks or self._tasks[feed].done()):
+            # The new connection subscribes to everything once logged in.
+            self._tasks[feed] = asyncio.create_task(self._run(feed))
+
+    async def unsubscribe(self, tickers, feed: str = "company"):
+        """Unsubscribes from tickers.
+
+        Args:
+            tickers (str | list[str]): The ticker symbols.
+            feed (str): company, crypto or forex.
+
+        Returns:
+            None
+        """
+        feed = self._feed(feed)
+        tickers = [tickers] if isinstance(tickers, str) else list(tickers)
+        self.subscriptions[feed].difference_update(tickers)
+        connection = self._connections.get(feed)
+        if connection is not None:
+            await self._send_many(connection, "unsubscribe", tickers)
+
+    async def stream(self):
+        """Yields the ticks of every feed as they arrive.
+
+        Ends once the client is closed.
+
+        Yields:
+            Tick
+        """
+        queue = self._get_queue()
+        while True:
+            tick = await queue.get()
+            if tick is _CLOSED:
+                return
+            yield tick
+
+    async def close(self):
+        """Closes every connection and ends stream().
+
+        Returns:
+            None
+        """
+        self._closed = True
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._put(_CLOSED)
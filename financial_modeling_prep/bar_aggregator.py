@@ -0,0 +1,179 @@
+"""OHLCV bars built live from WebSocket trade ticks.
+
+Each symbol keeps one open bar that every trade updates in constant time. A
+bar is emitted when a trade of a later interval arrives or when flush() finds
+its interval over. Emitted bars have the shape Charts.get_intraday_chart
+returns, plus the volume weighted average price, so live and historical bars
+can be mixed.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from financial_modeling_prep.ticks import TRADE, Tick
+
+
+def to_seconds(timestamp) -> float:
+    """Converts a feed timestamp in s, ms, us or ns to epoch seconds."""
+    timestamp = float(timestamp)
+    # Epoch seconds stay below 1e11 until the year 5138.
+    while timestamp >= 1e11:
+        timestamp /= 1000
+    return timestamp
+
+
+class BarAggregator:
+    """Aggregates trade ticks into OHLCV/VWAP bars per symbol.
+
+    Methods:
+    - update(tick)
+    - add(ticks)
+    - flush(now=None)
+    - current(symbol)
+    """
+
+    def __init__(
+        self,
+        interval: float = 60,
+        callback=None,
+        timezone: str = "America/New_York",
+    ):
+        """Initializes the aggregator.
+
+        Args:
+            interval (float): The bar length in seconds, e.g. 1 or 60.
+            callback (function, optional): Called with the symbol and each
+             completed bar.
+            timezone (str): The timezone of the bar dates, the one of the
+             intraday charts by default.
+
+        Returns:
+            None
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive.")
+        self.interval = interval
+        self.callback = callback
+        self.zone = ZoneInfo(timezone)
+        self.late = 0
+        # Symbol to [start, open, high, low, close, volume, price x volume].
+        self._bars = {}
+        # Symbol to the start of its bar last emitted by flush().
+        self._flushed = {}
+        self._lock = threading.Lock()
+
+    def _bar(self, start, state) -> dict:
+        """Returns a bar in the shape of the intraday chart rows."""
+        _, open_, high, low, close, volume, turnover = state
+        return {
+            "date": datetime.fromtimestamp(start, self.zone).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            ),
+            "open": open_,
+            "low": low,
+            "high": high,
+            "close": close,
+            "volume": volume,
+            "vwap": turnover / volume if volume else close,
+        }
+
+    def update(self, tick):
+        """Adds one tick, trades only, other ticks are ignored.
+
+        Args:
+            tick (Tick | dict): A decoded tick or feed message.
+
+        Returns:
+            dict | None: The bar the tick completed, if any.
+        """
+        if not isinstance(tick, Tick):
+            tick = Tick.from_message(tick)
+        price = tick.last_price
+        if tick.type != TRADE or price is None:
+            return None
+        size = tick.last_size or 0
+        seconds = to_seconds(tick.timestamp)
+        start = seconds - seconds % self.interval
+        completed = None
+        with self._lock:
+            state = self._bars.get(tick.symbol)
+            if state is None and start <= self._flushed.get(tick.symbol, -1):
+                self.late += 1
+                return None
+            if state is None or start > state[0]:
+                if state is not None:
+                    completed = self._bar(state[0], state)
+                self._bars[tick.symbol] = [
+                    start,
+                    price,
+                    price,
+                    price,
+                    price,
+                    size,
+                    price * size,
+                ]
+            elif start < state[0]:
+                self.late += 1
+                return None
+            else:
+                if price > state[2]:
+                    state[2] = price
+                elif price < state[3]:
+                    state[3] = price
+                state[4] = price
+                state[5] += size
+                state[6] += price * size
+        if completed is not None and self.callback is not None:
+            self.callback(tick.symbol, completed)
+        return completed
+
+    def add(self, ticks):
+        """Adds ticks in arrival order, e.g. as a decoded WebSocket callback.
+
+        Args:
+            ticks (list[Tick]): The ticks.
+
+        Returns:
+            None
+        """
+        for tick in ticks:
+            self.update(tick)
+
+    def flush(self, now=None) -> dict:
+        """Emits the bars whose interval is over, for symbols gone quiet.
+
+        Args:
+            now (float, optional): Epoch seconds, the current time by default.
+
+        Returns:
+            dict: Symbol to the bar emitted.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            done = {
+                symbol: self._bar(state[0], state)
+                for symbol, state in self._bars.items()
+                if state[0] + self.interval <= now
+            }
+            for symbol in done:
+                self._flushed[symbol] = self._bars.pop(symbol)[0]
+        if self.callback is not None:
+            for symbol, bar in done.items():
+                self.callback(symbol, bar)
+        return done
+
+    def current(self, symbol: str):
+        """Returns the bar still being formed for a symbol.
+
+        Args:
+            symbol (str): The ticker symbol.
+
+        Returns:
+            dict | None
+        """
+        with self._lock:
+            state = self._bars.get(symbol)
+            return None if state is None else self._bar(state[0], state)
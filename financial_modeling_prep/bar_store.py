@@ -0,0 +1,245 @@
+"""A local store of chart bars that only downloads the dates it lacks.
+
+Bars are kept per (symbol, timeframe) in SQLite together with the date
+ranges already downloaded. A request for any range is answered from the
+store after fetching just the missing gaps through Charts. Today is never
+marked as held, its bars are still being formed.
+"""
+from __future__ import annotations
+
+import datetime
+import json
+import sqlite3
+import threading
+
+from financial_modeling_prep.columns import Columns
+from financial_modeling_prep.errors import APIError, error_message
+
+DAILY = "1day"
+
+# The longest range requested from the API at once for each timeframe.
+MAX_SPAN_DAYS = {
+    "1min": 5,
+    "5min": 30,
+    "15min": 60,
+    "30min": 90,
+    "1hour": 180,
+    "4hour": 365,
+    DAILY: 5 * 365,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    symbol TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    date TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (symbol, timeframe, date)
+);
+CREATE TABLE IF NOT EXISTS coverage (
+    symbol TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    start TEXT NOT NULL,
+    end TEXT NOT NULL
+);
+"""
+
+_ONE_DAY = datetime.timedelta(days=1)
+
+
+def _to_date(value) -> datetime.date:
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(str(value)[:10])
+
+
+def merge_ranges(ranges) -> list:
+    """Merges overlapping or adjacent inclusive date ranges.
+
+    Args:
+        ranges: An iterable of (start, end) dates.
+
+    Returns:
+        list[tuple[datetime.date, datetime.date]]: Sorted, disjoint ranges.
+    """
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + _ONE_DAY:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def missing_ranges(start, end, held) -> list:
+    """Returns the parts of [start, end] not covered by the held ranges.
+
+    Args:
+        start (datetime.date): The first date wanted.
+        end (datetime.date): The last date wanted.
+        held: Sorted, disjoint (start, end) ranges.
+
+    Returns:
+        list[tuple[datetime.date, datetime.date]]
+    """
+    gaps = []
+    cursor = start
+    for held_start, held_end in held:
+        if held_end < cursor:
+            continue
+        if held_start > end:
+            break
+        if held_start > cursor:
+            gaps.append((cursor, held_start - _ONE_DAY))
+        cursor = max(cursor, held_end + _ONE_DAY)
+        if cursor > end:
+            return gaps
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class BarStore:
+    """Serves chart bars for any date range, downloading only missing dates.
+
+    Methods:
+    - get_bars(symbol, timeframe, from_date, to_date, as_columns=False)
+    - held_ranges(symbol, timeframe)
+    - invalidate(symbol, timeframe=None)
+    """
+
+    def __init__(self, api, path: str = ":memory:"):
+        """Initializes the store.
+
+        Args:
+            api: The FinancialModelingPrep client used to download bars.
+            path (str): The SQLite database file, in memory by default.
+
+        Returns:
+            None
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from financial_modeling_prep.async_client import require_sync
+
+        require_sync(api, "BarStore")
+        self.api = api
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def held_ranges(self, symbol: str, timeframe: str) -> list:
+        """Returns the date ranges already held for a symbol and timeframe.
+
+        Args:
+            symbol (str): The ticker symbol.
+            timeframe (str): 1min, 5min, 15min, 30min, 1hour, 4hour or 1day.
+
+        Returns:
+            list[tuple[datetime.date, datetime.date]]
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT start, end FROM coverage WHERE symbol = ? AND timeframe = ?",
+                (symbol, timeframe),
+            ).fetchall()
+        return merge_ranges((_to_date(start), _to_date(end)) for start, end in rows)
+
+    def _fetch(self, symbol, timeframe, start, end):
+        if timeframe == DAILY:
+            payload = self.api.charts.get_daily_chart_eod(
+                symbol, start.isoformat(), end.isoformat(), None
+            )
+        else:
+            payload = self.api.charts.get_intraday_chart(
+                timeframe, symbol, start.isoformat(), end.isoformat()
+            )
+        message = error_message(payload)
+        if message is not None:
+            raise APIError(message)
+        if isinstance(payload, dict):
+            payload = payload.get("historical", [])
+        return payload if isinstance(payload, list) else []
+
+    def _store(self, symbol, timeframe, bars, start, end):
+        final_end = min(end, datetime.date.today() - _ONE_DAY)
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?)",
+                (
+                    (symbol, timeframe, bar["date"], json.dumps(bar))
+                    for bar in bars
+                    if "date" in bar
+                ),
+            )
+            if start > final_end:
+                return
+            held = self._db.execute(
+                "SELECT start, end FROM coverage WHERE symbol = ? AND timeframe = ?",
+                (symbol, timeframe),
+            ).fetchall()
+            merged = merge_ranges(
+                [(_to_date(s), _to_date(e)) for s, e in held] + [(start, final_end)]
+            )
+            self._db.execute(
+                "DELETE FROM coverage WHERE symbol = ? AND timeframe = ?",
+                (symbol, timeframe),
+            )
+            self._db.executemany(
+                "INSERT INTO coverage VALUES (?, ?, ?, ?)",
+                ((symbol, timeframe, s.isoformat(), e.isoformat()) for s, e in merged),
+            )
+
+    def get_bars(self, symbol, timeframe, from_date, to_date, as_columns: bool = False):
+        """Returns the bars of a date range, fetching only the missing dates.
+
+        Args:
+            symbol (str): The ticker symbol.
+            timeframe (str): 1min, 5min, 15min, 30min, 1hour, 4hour or 1day.
+            from_date: The first date, YYYY-MM-DD or a date.
+            to_date: The last date, YYYY-MM-DD or a date.
+            as_columns (bool): Return the bars as a Columns table.
+
+        Returns:
+            list[dict]: The bars newest first, as Charts returns them, or
+             Columns when as_columns is set.
+        """
+        if timeframe not in MAX_SPAN_DAYS:
+            raise ValueError(f"Unknown timeframe {timeframe!r}.")
+        start, end = _to_date(from_date), _to_date(to_date)
+        span = datetime.timedelta(days=MAX_SPAN_DAYS[timeframe] - 1)
+        for gap_start, gap_end in missing_ranges(
+            start, end, self.held_ranges(symbol, timeframe)
+        ):
+            while gap_start <= gap_end:
+                chunk_end = min(gap_end, gap_start + span)
+                bars = self._fetch(symbol, timeframe, gap_start, chunk_end)
+                self._store(symbol, timeframe, bars, gap_start, chunk_end)
+                gap_start = chunk_end + _ONE_DAY
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT data FROM bars WHERE symbol = ? AND timeframe = ?"
+                " AND date >= ? AND date < ? ORDER BY date DESC",
+                (symbol, timeframe, start.isoformat(), (end + _ONE_DAY).isoformat()),
+            ).fetchall()
+        bars = [json.loads(data) for data, in rows]
+        if as_columns:
+            return Columns.from_rows(bars, {"symbol": symbol})
+        return bars
+
+    def invalidate(self, symbol: str, timeframe: str | None = None):
+        """Drops the stored bars of a symbol, e.g. after a split adjustment.
+
+        Args:
+            symbol (str): The ticker symbol.
+            timeframe (str, optional): Only drop this timeframe.
+
+        Returns:
+            None
+        """
+        clause, args = "symbol = ?", (symbol,)
+        if timeframe is not None:
+            clause, args = "symbol = ? AND timeframe = ?", (symbol, timeframe)
+        with self._lock, self._db:
+            self._db.execute(f"DELETE FROM bars WHERE {clause}", args)
+            self._db.execute(f"DELETE FROM coverage WHERE {clause}", args)
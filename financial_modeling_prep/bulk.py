@@ -27,6 +27,9 @@ class BulkData:
 
     Including financial statements, ratios, key metrics, stock splits,
         stock dividends, and various other relevant information.
+
+    The bulk endpoints answer with large CSV files, every method streams the
+    body and yields typed rows as they are read instead of loading it whole.
     """
 
     def __init__(self, api):
@@ -41,148 +44,187 @@ class BulkData:
         """
         self.api = api
 
-    def batch_eod_prices(self, date: str):
+    def batch_eod_prices(self, date: str, as_columns: bool = False):
         """Batch request that contains all end of day prices for specific date.
 
         :param date: (required) The date for which to return end of day prices.
             The date must be a valid trading day and in the format YYYY-MM-DD.
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(BATCH_EOD_PRICES_ENDPOINT, {"date": date})
+        return self.api.stream(
+            BATCH_EOD_PRICES_ENDPOINT, {"date": date}, as_columns=as_columns
+        )
 
-    def bulk_income_statements(self, year: int, period: str):
+    def bulk_income_statements(self, year: int, period: str, as_columns: bool = False):
         """All quarter or annual Income Statements for specific year.
 
         :param year: (required) The year for which to return income statements.
             The year must be a valid year in the format YYYY.
         :param period: (required) The period for which to return income statements.
             The period must be either 'annual' or 'quarterly'.
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(
-            BULK_INCOME_STATEMENTS_ENDPOINT, {"year": year, "period": period}
+        return self.api.stream(
+            BULK_INCOME_STATEMENTS_ENDPOINT,
+            {"year": year, "period": period},
+            as_columns=as_columns,
         )
 
-    def bulk_balance_sheets(self, year: int, period: str):
+    def bulk_balance_sheets(self, year: int, period: str, as_columns: bool = False):
         """All quarter or annual Balance Sheets for specific year.
 
         :param year: (required) The year for which to return balance sheets.
             The year must be a valid year in the format YYYY.
         :param period: (required) The period for which to return balance sheets.
             The period must be either 'annual' or 'quarterly'.
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(
-            BULK_BALANCE_SHEETS_ENDPOINT, {"year": year, "period": period}
+        return self.api.stream(
+            BULK_BALANCE_SHEETS_ENDPOINT,
+            {"year": year, "period": period},
+            as_columns=as_columns,
         )
 
-    def bulk_cash_flow_statements(self, year: int, period: str):
+    def bulk_cash_flow_statements(
+        self, year: int, period: str, as_columns: bool = False
+    ):
         """All quarter or annual Cash Flow Statements for specific year.
 
         :param year: (required) The year for which to return cash flow statements.
             The year must be a valid year in the format YYYY.
         :param period: (required) The period for which to return cash flow statements.
             The period must be either 'annual' or 'quarterly'.
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(
-            BULK_CASH_FLOW_STATEMENTS_ENDPOINT, {"year": year, "period": period}
+        return self.api.stream(
+            BULK_CASH_FLOW_STATEMENTS_ENDPOINT,
+            {"year": year, "period": period},
+            as_columns=as_columns,
         )
 
-    def bulk_ratios(self, year: int, period: str):
+    def bulk_ratios(self, year: int, period: str, as_columns: bool = False):
         """All quarter or annual Ratios for specific year.
 
         :param year: (required) The year for which to return ratios.
             The year must be a valid year in the format YYYY.
         :param period: (required) The period for which to return ratios.
             The period must be either 'annual' or 'quarterly'.
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(BULK_RATIOS_ENDPOINT, {"year": year, "period": period})
+        return self.api.stream(
+            BULK_RATIOS_ENDPOINT,
+            {"year": year, "period": period},
+            as_columns=as_columns,
+        )
 
-    def bulk_key_metrics(self, year: int, period: str):
+    def bulk_key_metrics(self, year: int, period: str, as_columns: bool = False):
         """All quarter or annual Key Metrics for specific year.
 
         :param year: (required) The year for which to return key metrics.
             The year must be a valid year in the format YYYY.
         :param period: (required) The period for which to return key metrics.
             The period must be either 'annual' or 'quarterly'.
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(BULK_KEY_METRICS_ENDPOINT, {"year": year, "period": period})
+        return self.api.stream(
+            BULK_KEY_METRICS_ENDPOINT,
+            {"year": year, "period": period},
+            as_columns=as_columns,
+        )
 
-    def bulk_earnings_surprises(self, year: int):
+    def bulk_earnings_surprises(self, year: int, as_columns: bool = False):
         """All Earnings Surprises for specific year.
 
         :param year: (required) The year for which to return earnings surprises.
             The year must be a valid year in the format YYYY.
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(BULK_EARNING_SURPRISES_ENDPOINT, {"year": year})
+        return self.api.stream(
+            BULK_EARNING_SURPRISES_ENDPOINT, {"year": year}, as_columns=as_columns
+        )
 
-    def bulk_profiles(self):
+    def bulk_profiles(self, as_columns: bool = False):
         """All profiles from our API in one CSV file.
 
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(BULK_PROFILES_ENDPOINT)
+        return self.api.stream(BULK_PROFILES_ENDPOINT, as_columns=as_columns)
 
-    def bulk_stock_peers(self):
+    def bulk_stock_peers(self, as_columns: bool = False):
         """Stock peers for all symbols with profile.
 
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(BULK_STOCK_PEERS_ENDPOINT)
+        return self.api.stream(BULK_STOCK_PEERS_ENDPOINT, as_columns=as_columns)
 
-    def bulk_ratings(self):
+    def bulk_ratings(self, as_columns: bool = False):
         """All latest company ratings.
 
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(BULK_RATINGS_ENDPOINT)
+        return self.api.stream(BULK_RATINGS_ENDPOINT, as_columns=as_columns)
 
-    def bulk_latest_dcf(self):
+    def bulk_latest_dcf(self, as_columns: bool = False):
         """All latest DCF values.
 
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(ALL_LATEST_DCF_ENDPOINT)
+        return self.api.stream(ALL_LATEST_DCF_ENDPOINT, as_columns=as_columns)
 
-    def bulk_key_metrics_ttm(self):
+    def bulk_key_metrics_ttm(self, as_columns: bool = False):
         """Key Metrics TTM for every stock.
 
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(BULK_KEY_METRICS_TTM_ENDPOINT)
+        return self.api.stream(BULK_KEY_METRICS_TTM_ENDPOINT, as_columns=as_columns)
 
-    def bulk_ratios_ttm(self):
+    def bulk_ratios_ttm(self, as_columns: bool = False):
         """Ratios TTM for every stock.
 
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(BULK_RATIO_TTM_ENDPOINT)
+        return self.api.stream(BULK_RATIO_TTM_ENDPOINT, as_columns=as_columns)
 
-    def bulk_scores(self):
+    def bulk_scores(self, as_columns: bool = False):
         """All stock financial scores.
 
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(BULK_SCORES_ENDPOINT)
+        return self.api.stream(BULK_SCORES_ENDPOINT, as_columns=as_columns)
 
-    def bulk_financial_growth(self, year: int, period: str):
+    def bulk_financial_growth(self, year: int, period: str, as_columns: bool = False):
         """All quarter or annual growth entries for specific year.
 
         :param year: (required) The year for which to return growth entries.
             The year must be a valid year in the format YYYY.
         :param period: (required) The period for which to return growth entries.
             The period must be either 'annual' or 'quarterly'.
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(
-            BULK_FINANCIAL_GROWTH_ENDPOINT, {"year": year, "period": period}
+        return self.api.stream(
+            BULK_FINANCIAL_GROWTH_ENDPOINT,
+            {"year": year, "period": period},
+            as_columns=as_columns,
         )
 
-    def bulk_income_statements_growth(self, year: int, period: str):
+    def bulk_income_statements_growth(
+        self, year: int, period: str, as_columns: bool = False
+    ):
         """All quarter or annual Income Statement Growth for specific year.
 
         Args:
@@ -190,26 +232,36 @@ class BulkData:
               The year must be a valid year in the format YYYY.
             period: (required) The period for which to return income statement growth.
               The period must be either 'annual' or 'quarterly'.
-        :return:
+            as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(
-            BULK_INCOME_STATEMENTS_GROWTH_ENDPOINT, {"year": year, "period": period}
+        return self.api.stream(
+            BULK_INCOME_STATEMENTS_GROWTH_ENDPOINT,
+            {"year": year, "period": period},
+            as_columns=as_columns,
         )
 
-    def bulk_balance_sheets_growth(self, year: int, period: str):
+    def bulk_balance_sheets_growth(
+        self, year: int, period: str, as_columns: bool = False
+    ):
         """All quarter or annual Balance Sheet Growth for specific year.
 
         :param year: (required) The year for which to return balance sheet growth.
             The year must be a valid year in the format YYYY.
         :param period: (required) The period for which to return balance sheet growth.
             The period must be either 'annual' or 'quarterly'.
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(
-            BULK_BALANCE_SHEETS_GROWTH_ENDPOINT, {"year": year, "period": period}
+        return self.api.stream(
+            BULK_BALANCE_SHEETS_GROWTH_ENDPOINT,
+            {"year": year, "period": period},
+            as_columns=as_columns,
         )
 
-    def bulk_cash_flow_statements_growth(self, year: int, period: str):
+    def bulk_cash_flow_statements_growth(
+        self, year: int, period: str, as_columns: bool = False
+    ):
         """All quarter or annual Cash Flow Statement Growth for specific year.
 
         Args:
@@ -217,29 +269,39 @@ class BulkData:
               The year must be a valid year in the format YYYY.
             period: (required) The period to return cash flow statement growth.
               The period must be either 'annual' or 'quarterly'.
-        :return:
+            as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(
-            BULK_CASH_FLOW_STATEMENTS_GROWTH_ENDPOINT, {"year": year, "period": period}
+        return self.api.stream(
+            BULK_CASH_FLOW_STATEMENTS_GROWTH_ENDPOINT,
+            {"year": year, "period": period},
+            as_columns=as_columns,
         )
 
-    def bulk_price_target_summary(self):
+    def bulk_price_target_summary(self, as_columns: bool = False):
         """All price target summaries.
 
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(BULK_PRICE_TARGET_SUMMARY_ENDPOINT)
+        return self.api.stream(
+            BULK_PRICE_TARGET_SUMMARY_ENDPOINT, as_columns=as_columns
+        )
 
-    def bulk_upgrades_downgrades_consensus(self):
+    def bulk_upgrades_downgrades_consensus(self, as_columns: bool = False):
         """All upgrades downgrades consensus.
 
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(BULK_UPGRADES_DOWNGRADES_CONSENSUS_ENDPOINT)
+        return self.api.stream(
+            BULK_UPGRADES_DOWNGRADES_CONSENSUS_ENDPOINT, as_columns=as_columns
+        )
 
-    def bulk_etf_holdings(self):
+    def bulk_etf_holdings(self, as_columns: bool = False):
         """Latest ETF Holders in bulk.
 
-        :return:
+        :param as_columns: Collect the rows into a Columns table instead.
+        :return: An iterator of dicts, one per CSV row.
         """
-        return self.api.get(BULK_ETF_HOLDERS_ENDPOINT)
+        return self.api.stream(BULK_ETF_HOLDERS_ENDPOINT, as_columns=as_columns)
@@ -0,0 +1,201 @@
+"""A local Parquet store kept in sync with the yearly bulk datasets.
+
+Each dataset is written as one Parquet file per year and period:
+
+    <root>/<dataset>/year=<year>/period=<period>/part.parquet
+
+A manifest records every partition fetched, so a sync only downloads
+partitions that are missing or recent enough to still change. Requires
+pyarrow.
+"""
+from __future__ import annotations
+
+import datetime
+import json
+import os
+
+# Dataset name to the BulkData method serving it, all take (year, period).
+DATASETS = {
+    "income_statements": "bulk_income_statements",
+    "balance_sheets": "bulk_balance_sheets",
+    "cash_flow_statements": "bulk_cash_flow_statements",
+    "ratios": "bulk_ratios",
+    "key_metrics": "bulk_key_metrics",
+    "financial_growth": "bulk_financial_growth",
+    "income_statements_growth": "bulk_income_statements_growth",
+    "balance_sheets_growth": "bulk_balance_sheets_growth",
+    "cash_flow_statements_growth": "bulk_cash_flow_statements_growth",
+}
+
+PERIODS = ("annual", "quarter")
+
+# Fiscal years are filed and restated well into the following year, so the
+# current and previous year are re-fetched on every sync.
+MUTABLE_YEARS = 2
+
+MANIFEST = "_manifest.json"
+
+
+def _pyarrow():
+    try:
+        # pylint: disable=import-outside-toplevel
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as exc:
+        raise ImportError("BulkStore requires pyarrow.") from exc
+    return pyarrow
+
+
+class BulkStore:
+    """Materializes bulk datasets into a partitioned local Parquet store.
+
+    Methods:
+    - is_stale(dataset, year, period)
+    - sync(datasets=None, years=None, periods=PERIODS)
+    - partitions(dataset)
+    - query(dataset, columns=None, years=None, periods=None)
+    """
+
+    def __init__(self, api, root, mutable_years: int = MUTABLE_YEARS):
+        """Initializes the store.
+
+        Args:
+            api: The FinancialModelingPrep client used to download partitions.
+            root (str): The directory holding the store.
+            mutable_years (int): How many of the most recent years are
+             re-fetched on every sync.
+
+        Returns:
+            None
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from financial_modeling_prep.async_client import require_sync
+
+        require_sync(api, "BulkStore")
+        self.api = api
+        self.root = os.fspath(root)
+        self.mutable_years = mutable_years
+        self._manifest = self._load_manifest()
+
+    def _load_manifest(self) -> dict:
+        try:
+            with open(os.path.join(self.root, MANIFEST), encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def _save_manifest(self):
+        os.makedirs(self.root, exist_ok=True)
+        path = os.path.join(self.root, MANIFEST)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(self._manifest, file, indent=2, sort_keys=True)
+        os.replace(f"{path}.tmp", path)
+
+    def _path(self, dataset, year, period):
+        return os.path.join(
+            self.root, dataset, f"year={year}", f"period={period}", "part.parquet"
+        )
+
+    def is_stale(self, dataset: str, year: int, period: str) -> bool:
+        """Returns True when a partition is missing or may still change.
+
+        Args:
+            dataset (str): A key of DATASETS.
+            year (int): The fiscal year.
+            period (str): annual or quarter.
+
+        Returns:
+            bool
+        """
+        if f"{dataset}/{year}/{period}" not in self._manifest:
+            return True
+        return year > datetime.date.today().year - self.mutable_years
+
+    def sync(self, datasets=None, years=None, periods=PERIODS) -> list:
+        """Downloads every stale partition of the requested datasets.
+
+        Args:
+            datasets: Dataset names, all of DATASETS by default.
+            years: The years to keep, the last ten years by default.
+            periods: The periods to keep.
+
+        Returns:
+            list[tuple[str, int, str]]: The partitions fetched.
+        """
+        pyarrow = _pyarrow()
+        if datasets is None:
+            datasets = list(DATASETS)
+        if years is None:
+            current = datetime.date.today().year
+            years = range(current - 9, current + 1)
+        fetched = []
+        for dataset in datasets:
+            method = getattr(self.api.bulk_data, DATASETS[dataset])
+            for year in years:
+                for period in periods:
+                    if not self.is_stale(dataset, year, period):
+                        continue
+                    table = method(year, period, as_columns=True).to_arrow()
+                    path = self._path(dataset, year, period)
+                    if table.num_rows:
+                        os.makedirs(os.path.dirname(path), exist_ok=True)
+                        pyarrow.parquet.write_table(table, f"{path}.tmp")
+                        os.replace(f"{path}.tmp", path)
+                    self._manifest[f"{dataset}/{year}/{period}"] = {
+                        "rows": table.num_rows,
+                        "fetched_at": datetime.datetime.now(
+                            datetime.timezone.utc
+                        ).isoformat(),
+                    }
+                    self._save_manifest()
+                    fetched.append((dataset, year, period))
+        return fetched
+
+    def partitions(self, dataset: str) -> list:
+        """Returns the (year, period) partitions stored for a dataset.
+
+        Args:
+            dataset (str): A key of DATASETS.
+
+        Returns:
+            list[tuple[int, str]]
+        """
+        stored = []
+        for key in sorted(self._manifest):
+            name, year, period = key.split("/")
+            if name == dataset:
+                stored.append((int(year), period))
+        return stored
+
+    def query(self, dataset: str, columns=None, years=None, periods=None):
+        """Reads a dataset, touching only the requested partitions and columns.
+
+        Args:
+            dataset (str): A key of DATASETS.
+            columns: The columns to read, all by default.
+            years: The years to read, all stored years by default.
+            periods: The periods to read, all stored periods by default.
+
+        Returns:
+            pyarrow.Table: The rows with year and period columns appended.
+        """
+        pyarrow = _pyarrow()
+        tables = []
+        for year, period in self.partitions(dataset):
+            if years is not None and year not in years:
+                continue
+            if periods is not None and period not in periods:
+                continue
+            path = self._path(dataset, year, period)
+            if not os.path.exists(path):
+                continue
+            table = pyarrow.parquet.read_table(path, columns=columns)
+            table = table.append_column(
+                "year", pyarrow.array([year] * table.num_rows, pyarrow.int32())
+            ).append_column(
+                "period", pyarrow.array([period] * table.num_rows, pyarrow.string())
+            )
+            tables.append(table)
+        if not tables:
+            return pyarrow.table({})
+        return pyarrow.concat_tables(tables, promote_options="permissive")
@@ -0,0 +1,96 @@
+"""Response cache backends for the API client.
+
+Any requests-cache backend can be given to FinancialModelingPrep, either by
+name or as a backend object:
+
+- "sqlite" (default): one SQLite file in the user cache directory.
+- "filesystem": one file per response, safe for many worker processes.
+- "redis": RedisCache, pass RedisCache(connection=...) to share a server or a
+  redis-compatible stand-in such as fakeredis.
+- "memory" / LRUCache(max_entries): private to the process.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+import requests
+from requests_cache import BaseCache, CachedSession
+from requests_cache.backends.base import DictStorage
+
+DEFAULT_CACHE_NAME = "fmp_cache"
+DEFAULT_EXPIRE_AFTER = 300
+
+
+class _LRUStorage(DictStorage):
+    """A DictStorage evicting its least recently used entries."""
+
+    def __init__(self, max_entries: int):
+        super().__init__()
+        self.data = OrderedDict()
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            item = super().__getitem__(key)
+            self.data.move_to_end(key)
+        return item
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while len(self.data) > self.max_entries:
+                self.data.popitem(last=False)
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self.data[key]
+
+
+class LRUCache(BaseCache):
+    """An in-memory cache holding at most max_entries responses."""
+
+    def __init__(self, max_entries: int = 1024, **kwargs):
+        """Initializes the cache.
+
+        Args:
+            max_entries (int): The number of responses kept.
+            **kwargs: Passed to requests_cache.BaseCache.
+
+        Returns:
+            None
+        """
+        super().__init__(cache_name="fmp_lru", **kwargs)
+        self.responses = _LRUStorage(max_entries)
+        self.redirects = _LRUStorage(max_entries)
+
+
+def create_session(cache=None, expire_after=DEFAULT_EXPIRE_AFTER):
+    """Builds the HTTP session used by a client.
+
+    Args:
+        cache: A backend name ("sqlite", "filesystem", "redis", "memory" or
+         "lru"), a requests-cache backend object, or False to disable caching.
+         Defaults to "sqlite".
+        expire_after: The default time to live of cached responses.
+
+    Returns:
+        requests.Session
+    """
+    if cache is False:
+        return requests.Session()
+    if cache is None:
+        cache = "sqlite"
+    elif cache == "lru":
+        cache = LRUCache()
+    return CachedSession(
+        DEFAULT_CACHE_NAME,
+        backend=cache,
+        ignored_parameters=["apikey"],
+        use_cache_dir=True,
+        cache_control=True,
+        expire_after=expire_after,
+        allowable_methods=("GET", "POST"),
+    )
@@ -1,4 +1,6 @@
 """Charts module for the FMP API wrapper."""
+from financial_modeling_prep.structs import Bar, DailyBar
+
 INTRADAY_CHART_ENDPOINT = "v3/historical-chart/{timeframe}/{symbol}"
 DAILY_CHART_EOD_ENDPOINT = "v3/historical-price-full/{symbol}"
 
@@ -8,10 +10,14 @@ class Charts:
     A class to retrieve intraday and daily stock charts for companies.
 
     Methods:
-        get_intraday_chart(timeframe, symbol, from_date, to_date):
+        get_intraday_chart(
+            timeframe, symbol, from_date, to_date, *, as_columns=False, as_structs=False
+        ):
             Retrieves an intraday chart for a company within a specified time interval.
 
-        get_daily_chart_eod(symbol, from_date, to_date, serietype):
+        get_daily_chart_eod(
+            symbol, from_date, to_date, serietype, *, as_columns=False, as_structs=False
+        ):
             Retrieves a daily chart for a company within a specified date range.
     """
 
@@ -27,7 +33,16 @@ class Charts:
         """
         self.api = api
 
-    def get_intraday_chart(self, timeframe, symbol, from_date, to_date):
+    def get_intraday_chart(
+        self,
+        timeframe,
+        symbol,
+        from_date,
+        to_date,
+        *,
+        as_columns: bool = False,
+        as_structs: bool = False,
+    ):
         """Provides an intraday chart for a given company.
 
          The chart displays the stock price of the company at
@@ -38,6 +53,8 @@ class Charts:
         :param symbol: The stock symbol of the company.
         :param from_date: The start date of the chart in the format YYYY-MM-DD.
         :param to_date: The end date of the chart in the format YYYY-MM-DD.
+        :param as_columns: Return the bars as a Columns table.
+        :param as_structs: Return the bars as a list of Bar.
         :return: [
             {
                 "date": "2023-03-02 16:00:00",
@@ -52,9 +69,20 @@ class Charts:
         return self.api.get(
             INTRADAY_CHART_ENDPOINT.format(timeframe=timeframe, symbol=symbol),
             params={"from": from_date, "to": to_date},
+            as_columns=as_columns,
+            struct=Bar if as_structs else None,
         )
 
-    def get_daily_chart_eod(self, symbol, from_date, to_date, serietype):
+    def get_daily_chart_eod(
+        self,
+        symbol,
+        from_date,
+        to_date,
+        serietype,
+        *,
+        as_columns: bool = False,
+        as_structs: bool = False,
+    ):
         """The FMP Daily Chart endpoint provides a daily chart for a given company.
 
          The chart displays the opening price, high price, low price,
@@ -68,6 +96,9 @@ class Charts:
         :param from_date: The start date of the chart in the format YYYY-MM-DD.
         :param to_date: The end date of the chart in the format YYYY-MM-DD.
         :param serietype: The type of series. The user can specify 'line' or 'candle'.
+        :param as_columns: Return the historical bars as a Columns table,
+            with the symbol kept in its meta.
+        :param as_structs: Return the historical bars as a list of DailyBar.
         :return: {
             "symbol": "AAPL",
             "historical": [
@@ -107,4 +138,6 @@ class Charts:
         return self.api.get(
             DAILY_CHART_EOD_ENDPOINT.format(symbol=symbol),
             params={"from": from_date, "to": to_date, "serietype": serietype},
+            as_columns=as_columns,
+            struct=DailyBar if as_structs else None,
         )
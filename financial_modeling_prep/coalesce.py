@@ -0,0 +1,226 @@
+"""Coalesces single-symbol requests into comma-separated batch requests."""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+
+from financial_modeling_prep.company_info import (
+    COMPANY_PROFILE_ENDPOINT,
+    MARKET_CAPITALIZATION_ENDPOINT,
+)
+from financial_modeling_prep.quote import (
+    BATCH_QUOTE_ENDPOINT,
+    BATCH_TRADE_ENDPOINT,
+    FULL_QUOTE_ENDPOINT,
+    SIMPLE_QUOTE,
+    STOCK_PRICE_CHANGE_ENDPOINT,
+)
+
+# Endpoints that accept "AAPL,MSFT,..." in place of {symbol} and answer with a
+# list of rows carrying a "symbol" field.
+COALESCABLE_ENDPOINTS = (
+    BATCH_QUOTE_ENDPOINT,
+    BATCH_TRADE_ENDPOINT,
+    COMPANY_PROFILE_ENDPOINT,
+    FULL_QUOTE_ENDPOINT,
+    MARKET_CAPITALIZATION_ENDPOINT,
+    SIMPLE_QUOTE,
+    STOCK_PRICE_CHANGE_ENDPOINT,
+)
+
+# Longest URL sent to the API, well inside what servers and proxies accept.
+MAX_URL_LENGTH = 2000
+
+# Room left in the URL budget for the path when batching an arbitrary method.
+_METHOD_PATH_ALLOWANCE = 64
+
+
+def split_by_symbol(symbols, rows) -> dict:
+    """Splits a batch response into the rows of each requested symbol.
+
+    Args:
+        symbols: The requested symbols.
+        rows: The decoded batch response.
+
+    Returns:
+        dict: Symbol to list of rows, symbols missing from the response get an
+         empty list. An error payload is returned to every symbol unchanged.
+    """
+    if not isinstance(rows, list):
+        return {symbol: rows for symbol in symbols}
+    by_key = {}
+    for row in rows:
+        if isinstance(row, dict):
+            by_key.setdefault(str(row.get("symbol", "")).upper(), []).append(row)
+    return {symbol: by_key.get(symbol.upper(), []) for symbol in symbols}
+
+
+def chunk_symbols(symbols, budget: int):
+    """Packs symbols into comma-joined groups no longer than budget characters.
+
+    Args:
+        symbols: The symbols to pack.
+        budget (int): The maximum length of a joined group.
+
+    Returns:
+        list[list[str]]
+    """
+    chunks, chunk, length = [], [], 0
+    for symbol in dict.fromkeys(symbols):
+        extra = len(symbol) + (1 if chunk else 0)
+        if chunk and length + extra > budget:
+            chunks.append(chunk)
+            chunk, length = [], 0
+            extra = len(symbol)
+        chunk.append(symbol)
+        length += extra
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+class _Batch:
+    """Symbols waiting to be requested together from one endpoint."""
+
+    def __init__(self, prefix):
+        self.prefix = prefix
+        self.futures = {}
+        self.length = 0
+
+
+class Coalescer:
+    """Gathers concurrent single-symbol requests into batch requests.
+
+    A request for a coalescable endpoint waits up to window seconds for other
+    threads asking the same endpoint for other symbols, then one request is
+    made for all of them and every caller gets its own rows back. A batch is
+    sent early once another symbol would push the URL past max_url_length.
+
+    Methods:
+    - match(endpoint)
+    - get(prefix, symbol)
+    - chunks(symbols)
+    - get_many(method, symbols, **kwargs)
+    """
+
+    def __init__(self, api, window: float = 0.01, max_url_length: int = MAX_URL_LENGTH):
+        """Initializes the coalescer.
+
+        Args:
+            api: The FinancialModelingPrep client making the batch requests.
+            window (float): Seconds to wait for more symbols before sending.
+            max_url_length (int): The longest URL to send.
+
+        Returns:
+            None
+        """
+        self.api = api
+        self.window = window
+        self.max_url_length = max_url_length
+        self._prefixes = tuple(
+            endpoint.partition("{symbol}")[0] for endpoint in COALESCABLE_ENDPOINTS
+        )
+        self._batches = {}
+        self._lock = threading.Lock()
+
+    def _budget(self, path_length: int) -> int:
+        overhead = len(self.api.base_url) + len("?apikey=") + len(self.api.api_key)
+        return self.max_url_length - overhead - path_length
+
+    def match(self, endpoint: str):
+        """Returns (prefix, symbol) for a single-symbol coalescable endpoint.
+
+        Args:
+            endpoint (str): A formatted endpoint such as v3/quote/AAPL.
+
+        Returns:
+            tuple[str, str] | None
+        """
+        for prefix in self._prefixes:
+            if endpoint.startswith(prefix):
+                symbol = endpoint[len(prefix) :]
+                if symbol and "," not in symbol and "/" not in symbol:
+                    return prefix, symbol
+        return None
+
+    def get(self, prefix: str, symbol: str):
+        """Requests one symbol as part of the next batch for the endpoint.
+
+        Args:
+            prefix (str): The endpoint path before the symbol.
+            symbol (str): The symbol to request.
+
+        Returns:
+            list: The rows for symbol, as an unbatched request would return.
+        """
+        budget = self._budget(len(prefix))
+        with self._lock:
+            batch = self._batches.get(prefix)
+            if batch is not None and symbol not in batch.futures:
+                if batch.length + len(symbol) + 1 > budget:
+                    self._detach(batch)
+                    threading.Thread(
+                        target=self._request, args=(batch,), daemon=True
+                    ).start()
+                    batch = None
+            if batch is None:
+                batch = self._batches[prefix] = _Batch(prefix)
+                timer = threading.Timer(self.window, self._flush, (batch,))
+                timer.daemon = True
+                timer.start()
+            future = batch.futures.get(symbol)
+            if future is None:
+                future = batch.futures[symbol] = Future()
+                batch.length += len(symbol) + (1 if batch.length else 0)
+        return future.result()
+
+    def _detach(self, batch):
+        """Stops a batch from taking more symbols, the lock must be held."""
+        if self._batches.get(batch.prefix) is batch:
+            del self._batches[batch.prefix]
+            return True
+        return False
+
+    def _flush(self, batch):
+        with self._lock:
+            if not self._detach(batch):
+                return
+        self._request(batch)
+
+    def _request(self, batch):
+        symbols = list(batch.futures)
+        try:
+            rows = self.api.request(batch.prefix + ",".join(symbols))
+        except Exception as exc:  # pylint: disable=broad-except
+            for future in batch.futures.values():
+                future.set_exception(exc)
+            return
+        for symbol, symbol_rows in split_by_symbol(symbols, rows).items():
+            batch.futures[symbol].set_result(symbol_rows)
+
+    def chunks(self, symbols) -> list:
+        """Packs symbols into the groups get_many() requests together.
+
+        Args:
+            symbols: The symbols to request.
+
+        Returns:
+            list[list[str]]
+        """
+        return chunk_symbols(symbols, self._budget(_METHOD_PATH_ALLOWANCE))
+
+    def get_many(self, method, symbols, **kwargs) -> dict:
+        """Calls a method accepting comma-separated symbols in as few requests as fit.
+
+        Args:
+            method: A bound endpoint method such as api.quote.get_full_quote.
+            symbols: The symbols to request.
+            **kwargs: Extra keyword arguments for every call.
+
+        Returns:
+            dict: Symbol to list of rows.
+        """
+        results = {}
+        for chunk in self.chunks(symbols):
+            results.update(split_by_symbol(chunk, method(",".join(chunk), **kwargs)))
+        return results
@@ -1,4 +1,6 @@
 """Company Info API endpoints."""
+from financial_modeling_prep.structs import CompanyProfile
+
 COMPANY_PROFILE_ENDPOINT = "v3/profile/{symbol}"
 EXECUTIVE_COMPENSATION_ENDPOINT = "v4/governance/executive_compensation"
 COMPENSATION_BENCHMARK_ENDPOINT = "v4/executive-compensation-benchmark"
@@ -60,7 +62,7 @@ class CompanyInfo:
         """
         self.api = api
 
-    def get_company_profile(self, symbol: str) -> dict:
+    def get_company_profile(self, symbol: str, as_structs: bool = False) -> dict:
         """Get a comprehensive overview of a company with our Company Profile endpoint.
 
          This endpoint provides key information such as price, beta,
@@ -68,6 +70,7 @@ class CompanyInfo:
 
         Args:
             symbol: str - The stock symbol of the company.
+            as_structs: bool - Return a list of CompanyProfile.
 
         Returns:[
             {
@@ -110,7 +113,10 @@ class CompanyInfo:
             }
         ]
         """
-        return self.api.get(COMPANY_PROFILE_ENDPOINT.format(symbol=symbol))
+        return self.api.get(
+            COMPANY_PROFILE_ENDPOINT.format(symbol=symbol),
+            struct=CompanyProfile if as_structs else None,
+        )
 
     def get_executive_compensation(self, symbol: str) -> dict:
         """Get the compensation of the company's executives.
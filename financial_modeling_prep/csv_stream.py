@@ -0,0 +1,76 @@
+"""Incremental parsing of the CSV bodies returned by the v4 bulk endpoints."""
+import codecs
+import csv
+
+
+def parse_value(value: str):
+    """Converts a CSV field to int, float or None where it looks like one.
+
+    Args:
+        value (str): The raw field.
+
+    Returns:
+        int | float | str | None
+    """
+    if value == "":
+        return None
+    first = value[0]
+    if first == "0" and len(value) > 1 and value[1] != ".":
+        # Zero-padded identifiers such as CIKs keep their padding.
+        return value
+    if first.isdigit() or (first in "-+." and len(value) > 1):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return value
+
+
+def iter_text(chunks, encoding: str = "utf-8"):
+    """Decodes a stream of byte chunks into text lines, keeping line endings.
+
+    Args:
+        chunks: An iterable of bytes, e.g. response.iter_content(chunk_size).
+        encoding (str): The body encoding.
+
+    Returns:
+        Iterator[str]
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    tail = ""
+    for chunk in chunks:
+        lines = (tail + decoder.decode(chunk)).split("\n")
+        tail = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def iter_csv_rows(lines, typed: bool = True):
+    """Parses CSV lines into dicts keyed by the header row.
+
+    Args:
+        lines: An iterable of text lines, the first being the header.
+        typed (bool): Convert numeric fields and empty fields to numbers/None.
+
+    Returns:
+        Iterator[dict]
+    """
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    if header and header[0].startswith("\ufeff"):
+        header[0] = header[0][1:]
+    for row in reader:
+        if not row:
+            continue
+        if typed:
+            row = [parse_value(value) for value in row]
+        yield dict(zip(header, row))
@@ -0,0 +1,25 @@
+"""Errors raised for Financial Modeling Prep API error payloads."""
+
+
+class APIError(Exception):
+    """The API answered with an error payload instead of data.
+
+    FMP reports invalid keys, exceeded quotas and bad parameters as a JSON
+    object such as {"Error Message": "..."} rather than an HTTP error.
+    """
+
+
+def error_message(payload):
+    """Returns the message of an FMP error payload, or None for data.
+
+    Args:
+        payload: A decoded JSON response.
+
+    Returns:
+        str | None
+    """
+    if isinstance(payload, dict) and len(payload) == 1:
+        for key in ("Error Message", "error", "message"):
+            if key in payload:
+                return str(payload[key])
+    return None
@@ -0,0 +1,144 @@
+"""Runs a per-symbol endpoint method for many symbols concurrently.
+
+fan_out uses a thread pool, fan_out_async the running event loop.
+"""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, NamedTuple
+
+from financial_modeling_prep.errors import APIError, error_message
+
+
+class SymbolResult(NamedTuple):
+    """The outcome of one call made by fan_out.
+
+    Exactly one of result and error is set.
+    """
+
+    symbol: str
+    result: Any = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        """True when the call returned data."""
+        return self.error is None
+
+
+def _result(symbol, result):
+    message = error_message(result)
+    if message is not None:
+        return SymbolResult(symbol, error=APIError(message))
+    return SymbolResult(symbol, result)
+
+
+def _call(method, symbol, kwargs):
+    try:
+        result = method(symbol, **kwargs)
+    except Exception as exc:  # pylint: disable=broad-except
+        return SymbolResult(symbol, error=exc)
+    return _result(symbol, result)
+
+
+async def _call_async(method, symbol, kwargs):
+    try:
+        result = await method(symbol, **kwargs)
+    except Exception as exc:  # pylint: disable=broad-except
+        return SymbolResult(symbol, error=exc)
+    return _result(symbol, result)
+
+
+def fan_out(
+    method: Callable,
+    symbols: Iterable[str],
+    workers: int = 8,
+    **kwargs,
+) -> Iterator[SymbolResult]:
+    """Calls method(symbol, **kwargs) for every symbol on a bounded thread pool.
+
+    Results are yielded as they complete, not in input order. Symbols are
+    consumed lazily and at most 2 * workers calls are queued at any time, so
+    memory stays flat for arbitrarily long symbol lists. Requests still go
+    through the client's rate limiter.
+
+    Args:
+        method: A bound endpoint method taking the symbol first, e.g.
+         api.company_info.get_company_profile.
+        symbols: The symbols to request.
+        workers (int): The number of worker threads.
+        **kwargs: Extra keyword arguments for every call.
+
+    Returns:
+        Iterator[SymbolResult]: One result per symbol, failures carry the
+         exception (APIError for error payloads) in error.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+    symbols = iter(symbols)
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fmp-map")
+    pending = set()
+    try:
+        for symbol in symbols:
+            pending.add(executor.submit(_call, method, symbol, kwargs))
+            if len(pending) < 2 * workers:
+                continue
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def fan_out_async(
+    method: Callable,
+    symbols: Iterable[str],
+    workers: int = 8,
+    **kwargs,
+) -> AsyncIterator[SymbolResult]:
+    """Awaits method(symbol, **kwargs) for every symbol, workers at a time.
+
+    The asyncio counterpart of fan_out, for the methods of an
+    AsyncFinancialModelingPrep. Results are yielded as they complete.
+
+    Args:
+        method: A bound endpoint method returning an awaitable, e.g.
+         api.company_info.get_company_profile of an async client.
+        symbols: The symbols to request.
+        workers (int): The most calls awaited at once.
+        **kwargs: Extra keyword arguments for every call.
+
+    Yields:
+        SymbolResult: One result per symbol, failures carry the exception
+         (APIError for error payloads) in error.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import asyncio  # Only for async clients, keeps fan_out cheap to import.
+
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+    pending = set()
+    try:
+        for symbol in symbols:
+            pending.add(asyncio.ensure_future(_call_async(method, symbol, kwargs)))
+            if len(pending) < workers:
+                continue
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                yield future.result()
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
@@ -4,6 +4,11 @@ Including balance sheet, income statement,
 and cash flow statement available in annual and
 quarterly format sourced from SEC filings
 """
+from financial_modeling_prep.structs import (
+    BalanceSheet,
+    CashFlowStatement,
+    IncomeStatement,
+)
 
 INCOME_STATEMENT_ENDPOINT_SYMBOL = "v3/income-statement/{symbol}"
 INCOME_STATEMENT_ENDPOINT_CIK = "v3/income-statement/{cik}"
@@ -34,27 +39,33 @@ class FinancialStatements:
     Methods:
     - get_income_statement_by_symbol(
         symbol: str, period: str = "annual,quarter",
-        datatype: str = "json", limit: int = 100
+        datatype: str = "json", limit: int = 100,
+        as_structs: bool = False
     ) -> dict
     - get_income_statement_by_cik(
         cik: str, period: str = "annual,quarter",
-        datatype: str = "json", limit: int = 100
+        datatype: str = "json", limit: int = 100,
+        as_structs: bool = False
     ) -> dict
     - get_balance_sheet_statement_by_symbol(
         symbol: str, period: str = "annual,quarter",
-        datatype: str = "json", limit: int = 100
+        datatype: str = "json", limit: int = 100,
+        as_structs: bool = False
     ) -> dict
     - get_balance_sheet_statement_by_cik(
         cik: str, period: str = "annual,quarter",
-        datatype: str = "json", limit: int = 100
+        datatype: str = "json", limit: int = 100,
+        as_structs: bool = False
     ) -> dict
     - get_cashflow_statement_by_symbol(
         symbol: str, period: str = "annual,quarter",
-        datatype: str = "json", limit: int = 100
+        datatype: str = "json", limit: int = 100,
+        as_structs: bool = False
     ) -> dict
     - get_cashflow_statement_by_cik(
         cik: str, period: str = "annual,quarter",
-        datatype: str = "json", limit: int = 100
+        datatype: str = "json", limit: int = 100,
+        as_structs: bool = False
     ) -> dict
     - get_income_statement_as_reported(
         symbol: str, period: str = "annual",
@@ -104,6 +115,7 @@ class FinancialStatements:
         period: str = "annual,quarter",
         datatype: str = "json",
         limit: int = 100,
+        as_structs: bool = False,
     ) -> dict:
         """Get the income statement for a company by its symbol.
 
@@ -115,6 +127,7 @@ class FinancialStatements:
             period (str, optional): Period. Defaults to 'annual,quarter'.
             datatype (str, optional): Datatype. Defaults to 'json'.
             limit (int, optional): Limit. Defaults to 100.
+            as_structs (bool, optional): Return a list of IncomeStatement.
 
         Returns: [
             {
@@ -162,6 +175,7 @@ class FinancialStatements:
         return self.api.get(
             INCOME_STATEMENT_ENDPOINT_SYMBOL.format(symbol=symbol),
             params={"period": period, "datatype": datatype, "limit": limit},
+            struct=IncomeStatement if as_structs else None,
         )
 
     def get_income_statement_by_cik(
@@ -170,6 +184,7 @@ class FinancialStatements:
         period: str = "annual,quarter",
         datatype: str = "json",
         limit: int = 100,
+        as_structs: bool = False,
     ) -> dict:
         """Get the income statement for a company by its CIK.
 
@@ -181,6 +196,7 @@ class FinancialStatements:
             period (str, optional): Period. Defaults to 'annual,quarter'.
             datatype (str, optional): Datatype. Defaults to 'json'.
             limit (int, optional): Limit. Defaults to 100.
+            as_structs (bool, optional): Return a list of IncomeStatement.
 
         Returns: [
             {
@@ -228,6 +244,7 @@ class FinancialStatements:
         return self.api.get(
             INCOME_STATEMENT_ENDPOINT_CIK.format(cik=cik),
             params={"period": period, "datatype": datatype, "limit": limit},
+            struct=IncomeStatement if as_structs else None,
         )
 
     def get_balance_sheet_statement_by_symbol(
@@ -236,6 +253,7 @@ class FinancialStatements:
         period: str = "annual,quarter",
         datatype: str = "json",
         limit: int = 100,
+        as_structs: bool = False,
     ) -> dict:
         """Get the balance sheet for a company by its symbol.
 
@@ -247,6 +265,7 @@ class FinancialStatements:
             period (str, optional): Period. Defaults to 'annual,quarter'.
             datatype (str, optional): Datatype. Defaults to 'json'.
             limit (int, optional): Limit. Defaults to 100.
+            as_structs (bool, optional): Return a list of BalanceSheet.
 
         Returns: [
             {
@@ -310,6 +329,7 @@ class FinancialStatements:
         return self.api.get(
             BALANCE_SHEET_STATEMENTS_SYMBOL.format(symbol=symbol),
             params={"period": period, "datatype": datatype, "limit": limit},
+            struct=BalanceSheet if as_structs else None,
         )
 
     def get_balance_sheet_statement_by_cik(
@@ -318,6 +338,7 @@ class FinancialStatements:
         period: str = "annual,quarter",
         datatype: str = "json",
         limit: int = 100,
+        as_structs: bool = False,
     ) -> dict:
         """Get the balance sheet for a company by its symbol.
 
@@ -329,6 +350,7 @@ class FinancialStatements:
             period (str, optional): Period. Defaults to 'annual,quarter'.
             datatype (str, optional): Datatype. Defaults to 'json'.
             limit (int, optional): Limit. Defaults to 100.
+            as_structs (bool, optional): Return a list of BalanceSheet.
 
         Returns: [
             {
@@ -392,6 +414,7 @@ class FinancialStatements:
         return self.api.get(
             BALANCE_SHEET_STATEMENTS_CIK.format(cik=cik),
             params={"period": period, "datatype": datatype, "limit": limit},
+            struct=BalanceSheet if as_structs else None,
         )
 
     def get_cashflow_statement_by_symbol(
@@ -400,6 +423,7 @@ class FinancialStatements:
         period: str = "annual,quarter",
         datatype: str = "json",
         limit: int = 100,
+        as_structs: bool = False,
     ) -> dict:
         """Get the cash flow statement for a company by its CIK.
 
@@ -411,6 +435,7 @@ class FinancialStatements:
             period (str, optional): Period. Defaults to 'annual,quarter'.
             datatype (str, optional): Datatype. Defaults to 'json'.
             limit (int, optional): Limit. Defaults to 100.
+            as_structs (bool, optional): Return a list of CashFlowStatement.
 
         Returns: [
             {
@@ -460,6 +485,7 @@ class FinancialStatements:
         return self.api.get(
             CASHFLOW_STATEMENT_ENDPOINT_SYMBOL.format(symbol=symbol),
             params={"period": period, "datatype": datatype, "limit": limit},
+            struct=CashFlowStatement if as_structs else None,
         )
 
     def get_cashflow_statement_by_cik(
@@ -468,6 +494,7 @@ class FinancialStatements:
         period: str = "annual,quarter",
         datatype: str = "json",
         limit: int = 100,
+        as_structs: bool = False,
     ) -> dict:
         """Get the cash flow statement for a company by its CIK.
 
@@ -479,6 +506,7 @@ class FinancialStatements:
             period (str, optional): Period. Defaults to 'annual,quarter'.
             datatype (str, optional): Datatype. Defaults to 'json'.
             limit (int, optional): Limit. Defaults to 100.
+            as_structs (bool, optional): Return a list of CashFlowStatement.
 
         Returns: [
             {
@@ -528,6 +556,7 @@ class FinancialStatements:
         return self.api.get(
             CASHFLOW_STATEMENT_ENDPOINT_CIK.format(cik=cik),
             params={"period": period, "datatype": datatype, "limit": limit},
+            struct=CashFlowStatement if as_structs else None,
         )
 
     def get_income_statement_as_reported(
@@ -0,0 +1,288 @@
+"""Technical indicators for a whole universe at once, on symbol x time arrays.
+
+Bars of every symbol are aligned on the union of their dates into 2-D NumPy
+arrays (missing bars are NaN). Each indicator runs on the bars each symbol
+actually has, packed to the left of a compact array, and its values are then
+put back on the union dates, so a missing bar is skipped rather than breaking
+a window or restarting a recursion. Window indicators are fully vectorized,
+recursive ones (EMA family, RSI, ADX) step through time once with every
+symbol updated per step. Values match indicators.py. Requires numpy.
+"""
+from __future__ import annotations
+
+try:
+    import numpy
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from financial_modeling_prep.columns import Columns
+
+
+def _require_numpy():
+    if numpy is None:
+        raise ImportError("compute_many() requires numpy.")
+
+
+def _rolling_sum(values, period):
+    """Sums of the last period values, NaN until period valid values exist."""
+    valid = ~numpy.isnan(values)
+    sums = numpy.cumsum(numpy.where(valid, values, 0.0), axis=1)
+    counts = numpy.cumsum(valid, axis=1)
+    sums[:, period:] = sums[:, period:] - sums[:, :-period]
+    counts[:, period:] = counts[:, period:] - counts[:, :-period]
+    return numpy.where(counts == period, sums, numpy.nan)
+
+
+def _windows(values, period):
+    """The trailing windows of every position, NaN-padded at the start."""
+    padded = numpy.pad(values, ((0, 0), (period - 1, 0)), constant_values=numpy.nan)
+    return sliding_window_view(padded, period, axis=1)
+
+
+def _smooth(values, period, alpha):
+    """Exponential smoothing seeded with the mean of the first period values."""
+    seed = _rolling_sum(values, period) / period
+    out = numpy.full_like(values, numpy.nan)
+    state = numpy.full(values.shape[0], numpy.nan)
+    for index in range(values.shape[1]):
+        seeded = ~numpy.isnan(state)
+        state = numpy.where(
+            seeded, state + alpha * (values[:, index] - state), seed[:, index]
+        )
+        out[:, index] = state
+    return out
+
+
+def sma(unused_high, unused_low, close, period):
+    """Simple moving average of the close."""
+    return _rolling_sum(close, period) / period
+
+
+def ema(unused_high, unused_low, close, period):
+    """Exponential moving average of the close, seeded with the SMA."""
+    return _smooth(close, period, 2.0 / (period + 1))
+
+
+def wma(unused_high, unused_low, close, period):
+    """Linearly weighted moving average of the close."""
+    weights = numpy.arange(1, period + 1, dtype=float)
+    return _windows(close, period) @ weights / weights.sum()
+
+
+def dema(unused_high, unused_low, close, period):
+    """Double exponential moving average."""
+    first = ema(None, None, close, period)
+    return 2 * first - ema(None, None, first, period)
+
+
+def tema(unused_high, unused_low, close, period):
+    """Triple exponential moving average."""
+    first = ema(None, None, close, period)
+    second = ema(None, None, first, period)
+    third = ema(None, None, second, period)
+    return 3 * first - 3 * second + third
+
+
+def williams(high, low, close, period):
+    """Williams %R over the high/low range of the period."""
+    highest = _windows(high, period).max(axis=-1)
+    lowest = _windows(low, period).min(axis=-1)
+    spread = highest - lowest
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        value = (highest - close) / spread * -100
+    return numpy.where(spread == 0, 0.0, value)
+
+
+def _previous(values):
+    return numpy.pad(values[:, :-1], ((0, 0), (1, 0)), constant_values=numpy.nan)
+
+
+def rsi(unused_high, unused_low, close, period):
+    """Relative strength index with Wilder smoothing."""
+    change = close - _previous(close)
+    gain = numpy.where(numpy.isnan(change), numpy.nan, numpy.maximum(change, 0.0))
+    loss = numpy.where(numpy.isnan(change), numpy.nan, numpy.maximum(-change, 0.0))
+    average_gain = _smooth(gain, period, 1.0 / period)
+    average_loss = _smooth(loss, period, 1.0 / period)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        value = 100 - 100 / (1 + average_gain / average_loss)
+    return numpy.where(average_loss == 0, 100.0, value)
+
+
+def adx(high, low, close, period):
+    """Average directional index with Wilder smoothing."""
+    previous_high, previous_low = _previous(high), _previous(low)
+    previous_close = _previous(close)
+    true_range = numpy.fmax(
+        high - low,
+        numpy.fmax(abs(high - previous_close), abs(low - previous_close)),
+    )
+    true_range[numpy.isnan(previous_close)] = numpy.nan
+    up, down = high - previous_high, previous_low - low
+    plus = numpy.where((up > down) & (up > 0), up, 0.0)
+    minus = numpy.where((down > up) & (down > 0), down, 0.0)
+    plus[numpy.isnan(up)] = numpy.nan
+    minus[numpy.isnan(down)] = numpy.nan
+    alpha = 1.0 / period
+    range_average = _smooth(true_range, period, alpha)
+    plus_di = _smooth(plus, period, alpha) / range_average
+    minus_di = _smooth(minus, period, alpha) / range_average
+    total = plus_di + minus_di
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        dx = abs(plus_di - minus_di) / total * 100
+    dx = numpy.where((range_average == 0) | (total == 0), 0.0, dx)
+    return _smooth(dx, period, alpha)
+
+
+def standarddeviation(unused_high, unused_low, close, period):
+    """Population standard deviation of the close over the period."""
+    # Per window rather than from running sums of squares, which cancel
+    # badly over long histories.
+    return _windows(close, period).std(axis=-1)
+
+
+FUNCTIONS = {
+    "sma": sma,
+    "ema": ema,
+    "wma": wma,
+    "dema": dema,
+    "tema": tema,
+    "williams": williams,
+    "rsi": rsi,
+    "adx": adx,
+    "standarddeviation": standarddeviation,
+}
+
+
+class IndicatorMatrix:
+    """Indicator values for many symbols, one (symbol x date) array each.
+
+    Attributes:
+        symbols: The row labels.
+        dates: The column labels, ascending.
+        values: Indicator name (e.g. "ema_20") to numpy array.
+        errors: Symbol to the exception raised while fetching its bars.
+
+    Methods:
+    - latest(name)
+    - to_columns()
+    """
+
+    def __init__(self, symbols, dates, values, errors=None):
+        """Initializes the matrix.
+
+        Args:
+            symbols: The row labels.
+            dates: The column labels, ascending.
+            values (dict): Indicator name to (symbols x dates) array.
+            errors (dict, optional): Symbol to fetch exception.
+
+        Returns:
+            None
+        """
+        self.symbols = list(symbols)
+        self.dates = list(dates)
+        self.values = values
+        self.errors = errors or {}
+
+    def __getitem__(self, name):
+        """Returns the (symbols x dates) array of an indicator."""
+        return self.values[name]
+
+    def latest(self, name: str) -> dict:
+        """Returns the last available value of an indicator for every symbol.
+
+        Args:
+            name (str): The indicator name, e.g. "rsi_14".
+
+        Returns:
+            dict: Symbol to value, None when the symbol has no value.
+        """
+        values = self.values[name]
+        latest = {}
+        for row, symbol in enumerate(self.symbols):
+            valid = numpy.flatnonzero(~numpy.isnan(values[row]))
+            latest[symbol] = float(values[row, valid[-1]]) if valid.size else None
+        return latest
+
+    def to_columns(self) -> Columns:
+        """Returns the matrix as a long Columns table.
+
+        One row per symbol and date, with one column per indicator.
+
+        Returns:
+            Columns
+        """
+        table = Columns()
+        names = list(self.values)
+        for row, symbol in enumerate(self.symbols):
+            for column, date in enumerate(self.dates):
+                record = {"symbol": symbol, "date": date}
+                for name in names:
+                    value = self.values[name][row, column]
+                    record[name] = None if numpy.isnan(value) else float(value)
+                table.append(record)
+        return table
+
+
+def align(bars_by_symbol: dict):
+    """Aligns the bars of many symbols on the union of their dates.
+
+    Args:
+        bars_by_symbol (dict): Symbol to chart bars in any date order.
+
+    Returns:
+        tuple: symbols, dates, and the high, low and close arrays.
+    """
+    _require_numpy()
+    symbols = list(bars_by_symbol)
+    dates = sorted({bar["date"] for bars in bars_by_symbol.values() for bar in bars})
+    position = {date: index for index, date in enumerate(dates)}
+    shape = (len(symbols), len(dates))
+    high, low, close = (numpy.full(shape, numpy.nan) for _ in range(3))
+    for row, symbol in enumerate(symbols):
+        for bar in bars_by_symbol[symbol]:
+            column = position[bar["date"]]
+            high[row, column] = bar["high"]
+            low[row, column] = bar["low"]
+            close[row, column] = bar["close"]
+    return symbols, dates, high, low, close
+
+
+def _pack(present):
+    """Returns the positions that move each row's bars to its start."""
+    order = numpy.argsort(~present, axis=1, kind="stable")
+    width = int(present.sum(axis=1).max(initial=0))
+    return order[:, :width]
+
+
+def compute_matrix(bars_by_symbol: dict, specs, errors=None) -> IndicatorMatrix:
+    """Computes every (indicator_type, period) spec for every symbol.
+
+    Args:
+        bars_by_symbol (dict): Symbol to chart bars.
+        specs: (indicator_type, period) pairs, e.g. [("ema", 20), ("rsi", 14)].
+        errors (dict, optional): Symbol to fetch exception, kept on the result.
+
+    Returns:
+        IndicatorMatrix: Values named "<indicator_type>_<period>".
+    """
+    symbols, dates, high, low, close = align(bars_by_symbol)
+    present = ~numpy.isnan(close)
+    order = _pack(present)
+    packed = [numpy.take_along_axis(a, order, axis=1) for a in (high, low, close)]
+    packed_present = numpy.take_along_axis(present, order, axis=1)
+    values = {}
+    for indicator_type, period in specs:
+        try:
+            function = FUNCTIONS[indicator_type.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown indicator {indicator_type!r}.") from None
+        if period < 1:
+            raise ValueError("period must be at least 1.")
+        value = numpy.full(close.shape, numpy.nan)
+        if order.shape[1]:
+            value[present] = function(*packed, period)[packed_present]
+        values[f"{indicator_type.lower()}_{period}"] = value
+    return IndicatorMatrix(symbols, dates, values, errors)
@@ -0,0 +1,381 @@
+"""Technical indicators computed locally from chart bars.
+
+Every indicator is a small state machine fed one bar at a time, so a whole
+history costs one pass and each new bar costs O(1) work, or O(period) for
+the standard deviation, computed from each window for precision. The rows
+produced have the shape of the technical_indicator endpoint: the bar fields
+plus one key named after the indicator.
+"""
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+
+BAR_FIELDS = ("date", "open", "high", "low", "close", "volume")
+
+
+class _Indicator(ABC):
+    """Base class, update() returns the value or None while warming up."""
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError("period must be at least 1.")
+        self.period = period
+
+    @abstractmethod
+    def update(self, high: float, low: float, close: float):
+        """Adds the next bar, returns the value or None while warming up."""
+
+
+class SMA(_Indicator):
+    """Simple moving average of the close."""
+
+    def __init__(self, period: int):
+        """Initializes the indicator over the given number of bars."""
+        super().__init__(period)
+        self._window = deque()
+        self._sum = 0.0
+
+    def update(self, high, low, close):
+        """Adds the next bar, returns the value or None while warming up."""
+        self._window.append(close)
+        self._sum += close
+        if len(self._window) > self.period:
+            self._sum -= self._window.popleft()
+        if len(self._window) < self.period:
+            return None
+        return self._sum / self.period
+
+
+class EMA(_Indicator):
+    """Exponential moving average of the close, seeded with the SMA."""
+
+    def __init__(self, period: int):
+        """Initializes the indicator over the given number of bars."""
+        super().__init__(period)
+        self._alpha = 2.0 / (period + 1)
+        self._seed = SMA(period)
+        self.value = None
+
+    def update(self, high, low, close):
+        """Adds the next bar, returns the value or None while warming up."""
+        if self.value is None:
+            self.value = self._seed.update(high, low, close)
+        else:
+            self.value += self._alpha * (close - self.value)
+        return self.value
+
+
+class WMA(_Indicator):
+    """Linearly weighted moving average of the close."""
+
+    def __init__(self, period: int):
+        """Initializes the indicator over the given number of bars."""
+        super().__init__(period)
+        self._window = deque()
+        self._sum = 0.0
+        self._weighted = 0.0
+        self._divisor = period * (period + 1) / 2
+
+    def update(self, high, low, close):
+        """Adds the next bar, returns the value or None while warming up."""
+        if len(self._window) == self.period:
+            # Every weight drops by one and the oldest value leaves.
+            self._weighted -= self._sum
+            self._sum -= self._window.popleft()
+        self._window.append(close)
+        self._sum += close
+        self._weighted += len(self._window) * close
+        if len(self._window) < self.period:
+            return None
+        return self._weighted / self._divisor
+
+
+class DEMA(_Indicator):
+    """Double exponential moving average: 2 * EMA - EMA(EMA)."""
+
+    def __init__(self, period: int):
+        """Initializes the indicator over the given number of bars."""
+        super().__init__(period)
+        self._ema = EMA(period)
+        self._ema_of_ema = EMA(period)
+
+    def update(self, high, low, close):
+        """Adds the next bar, returns the value or None while warming up."""
+        ema = self._ema.update(high, low, close)
+        if ema is None:
+            return None
+        ema_of_ema = self._ema_of_ema.update(ema, ema, ema)
+        if ema_of_ema is None:
+            return None
+        return 2 * ema - ema_of_ema
+
+
+class TEMA(_Indicator):
+    """Triple exponential moving average: 3 * E1 - 3 * E2 + E3."""
+
+    def __init__(self, period: int):
+        """Initializes the indicator over the given number of bars."""
+        super().__init__(period)
+        self._emas = (EMA(period), EMA(period), EMA(period))
+
+    def update(self, high, low, close):
+        """Adds the next bar, returns the value or None while warming up."""
+        values = []
+        value = close
+        for ema in self._emas:
+            value = ema.update(value, value, value)
+            if value is None:
+                return None
+            values.append(value)
+        return 3 * values[0] - 3 * values[1] + values[2]
+
+
+class _RollingExtreme:
+    """The max (or min) of the last period values in amortized O(1)."""
+
+    def __init__(self, period: int, largest: bool):
+        self.period = period
+        self.largest = largest
+        self._values = deque()
+        self._index = 0
+
+    def update(self, value):
+        values = self._values
+        if self.largest:
+            while values and values[-1][1] <= value:
+                values.pop()
+        else:
+            while values and values[-1][1] >= value:
+                values.pop()
+        values.append((self._index, value))
+        if values[0][0] <= self._index - self.period:
+            values.popleft()
+        self._index += 1
+        return values[0][1]
+
+
+class Williams(_Indicator):
+    """Williams %R over the high/low range of the period."""
+
+    def __init__(self, period: int):
+        """Initializes the indicator over the given number of bars."""
+        super().__init__(period)
+        self._highest = _RollingExtreme(period, largest=True)
+        self._lowest = _RollingExtreme(period, largest=False)
+        self._count = 0
+
+    def update(self, high, low, close):
+        """Adds the next bar, returns the value or None while warming up."""
+        highest = self._highest.update(high)
+        lowest = self._lowest.update(low)
+        self._count += 1
+        if self._count < self.period:
+            return None
+        if highest == lowest:
+            return 0.0
+        return (highest - close) / (highest - lowest) * -100
+
+
+class RSI(_Indicator):
+    """Relative strength index with Wilder smoothing."""
+
+    def __init__(self, period: int):
+        """Initializes the indicator over the given number of bars."""
+        super().__init__(period)
+        self._previous = None
+        self._gain = 0.0
+        self._loss = 0.0
+        self._count = 0
+
+    def update(self, high, low, close):
+        """Adds the next bar, returns the value or None while warming up."""
+        if self._previous is None:
+            self._previous = close
+            return None
+        change = close - self._previous
+        self._previous = close
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+        self._count += 1
+        if self._count <= self.period:
+            self._gain += gain / self.period
+            self._loss += loss / self.period
+            if self._count < self.period:
+                return None
+        else:
+            self._gain += (gain - self._gain) / self.period
+            self._loss += (loss - self._loss) / self.period
+        if self._loss == 0:
+            return 100.0
+        return 100 - 100 / (1 + self._gain / self._loss)
+
+
+class ADX(_Indicator):
+    """Average directional index with Wilder smoothing."""
+
+    def __init__(self, period: int):
+        """Initializes the indicator over the given number of bars."""
+        super().__init__(period)
+        self._previous = None
+        self._tr = self._plus = self._minus = 0.0
+        self._count = 0
+        self._dx_sum = 0.0
+        self._dx_count = 0
+        self.value = None
+
+    def update(self, high, low, close):
+        """Adds the next bar, returns the value or None while warming up."""
+        if self._previous is None:
+            self._previous = (high, low, close)
+            return None
+        previous_high, previous_low, previous_close = self._previous
+        self._previous = (high, low, close)
+        true_range = max(
+            high - low, abs(high - previous_close), abs(low - previous_close)
+        )
+        up, down = high - previous_high, previous_low - low
+        plus = up if up > down and up > 0 else 0.0
+        minus = down if down > up and down > 0 else 0.0
+        self._count += 1
+        if self._count <= self.period:
+            self._tr += true_range
+            self._plus += plus
+            self._minus += minus
+            if self._count < self.period:
+                return None
+        else:
+            self._tr += true_range - self._tr / self.period
+            self._plus += plus - self._plus / self.period
+            self._minus += minus - self._minus / self.period
+        if self._tr == 0:
+            dx = 0.0
+        else:
+            plus_di = self._plus / self._tr
+            minus_di = self._minus / self._tr
+            total = plus_di + minus_di
+            dx = 0.0 if total == 0 else abs(plus_di - minus_di) / total * 100
+        if self.value is None:
+            self._dx_sum += dx
+            self._dx_count += 1
+            if self._dx_count == self.period:
+                self.value = self._dx_sum / self.period
+        else:
+            self.value += (dx - self.value) / self.period
+        return self.value
+
+
+class StandardDeviation(_Indicator):
+    """Population standard deviation of the close over the period."""
+
+    def __init__(self, period: int):
+        """Initializes the indicator over the given number of bars."""
+        super().__init__(period)
+        self._window = deque()
+
+    def update(self, high, low, close):
+        """Adds the next bar, returns the value or None while warming up."""
+        self._window.append(close)
+        if len(self._window) > self.period:
+            self._window.popleft()
+        if len(self._window) < self.period:
+            return None
+        # From the window's own mean: running sums of squares cancel badly
+        # at price levels far above the spread, e.g. crypto pairs.
+        mean = math.fsum(self._window) / self.period
+        return math.sqrt(
+            math.fsum((value - mean) ** 2 for value in self._window) / self.period
+        )
+
+
+INDICATORS = {
+    "sma": SMA,
+    "ema": EMA,
+    "wma": WMA,
+    "dema": DEMA,
+    "tema": TEMA,
+    "williams": Williams,
+    "rsi": RSI,
+    "adx": ADX,
+    "standarddeviation": StandardDeviation,
+}
+
+
+def create(indicator_type: str, period: int) -> _Indicator:
+    """Returns a fresh indicator.
+
+    Args:
+        indicator_type (str): sma, ema, wma, dema, tema, williams, rsi, adx or
+         standarddeviation.
+        period (int): Number of bars used for each value.
+
+    Returns:
+        An object whose update(high, low, close) returns the next value.
+    """
+    try:
+        return INDICATORS[indicator_type.lower()](period)
+    except KeyError:
+        raise ValueError(
+            f"Unknown indicator {indicator_type!r}, expected one of "
+            f"{', '.join(INDICATORS)}."
+        ) from None
+
+
+class IndicatorStream:
+    """Keeps an indicator current as bars arrive one at a time.
+
+    Methods:
+    - update(bar)
+    """
+
+    def __init__(self, indicator_type: str, period: int):
+        """Initializes the stream.
+
+        Args:
+            indicator_type (str): The indicator, see create().
+            period (int): Number of bars used for each value.
+
+        Returns:
+            None
+        """
+        self.indicator_type = indicator_type.lower()
+        self._indicator = create(indicator_type, period)
+
+    def update(self, bar: dict):
+        """Adds the next bar, in date order.
+
+        Args:
+            bar (dict): A chart bar with high, low and close.
+
+        Returns:
+            dict | None: The bar fields plus the indicator value, or None
+             while the indicator is warming up.
+        """
+        value = self._indicator.update(bar["high"], bar["low"], bar["close"])
+        if value is None:
+            return None
+        row = {field: bar[field] for field in BAR_FIELDS if field in bar}
+        row[self.indicator_type] = value
+        return row
+
+
+def compute(bars, indicator_type: str, period: int) -> list:
+    """Computes an indicator over a chart history.
+
+    Args:
+        bars: Chart bars in any date order, e.g. as Charts returns them.
+        indicator_type (str): The indicator, see create().
+        period (int): Number of bars used for each value.
+
+    Returns:
+        list[dict]: Rows newest first, as the technical_indicator endpoint
+         returns them, starting once the indicator has warmed up.
+    """
+    stream = IndicatorStream(indicator_type, period)
+    rows = []
+    for bar in sorted(bars, key=lambda bar: bar["date"]):
+        row = stream.update(bar)
+        if row is not None:
+            rows.append(row)
+    rows.reverse()
+    return rows
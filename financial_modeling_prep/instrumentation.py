@@ -0,0 +1,295 @@
+"""Instrumentation of the requests made by a client.
+
+Every hook given to FinancialModelingPrep(hooks=[...]) is called with a
+RequestEvent after each request, including those that raised. A hook that
+raises is logged and never fails the request. MetricsCollector is a ready-made hook that
+aggregates the events per endpoint template into latency histograms and
+counters, exported as a dict or in the Prometheus text format.
+"""
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import NamedTuple
+
+# Upper bounds of the latency histogram buckets, in seconds.
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+HIT = "hit"
+MISS = "miss"
+STALE = "stale"
+OFF = "off"
+
+
+class RequestEvent(NamedTuple):
+    """What happened during one request.
+
+    network_seconds excludes the time spent waiting on the rate limiter or
+    before retries, which is reported as throttled_seconds. error holds the
+    message of an error payload, or the exception raised by the request or
+    its decoding; status is 0 when no response was received. For streamed
+    CSV downloads decode_seconds covers reading and parsing the body.
+    """
+
+    endpoint: str
+    template: str
+    status: int
+    network_seconds: float
+    decode_seconds: float
+    throttled_seconds: float
+    bytes: int
+    cache: str
+    retries: int
+    error: str | None
+
+
+def emit(hooks, event: RequestEvent):
+    """Calls every hook with event, logging the hooks that raise.
+
+    Args:
+        hooks (list): The hooks of a client.
+        event (RequestEvent): The request.
+
+    Returns:
+        None
+    """
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # pylint: disable-next=import-outside-toplevel
+            import logging  # Only when a hook fails, logging is slow to import.
+
+            logging.getLogger(__name__).exception("Request hook %r failed.", hook)
+
+
+def cache_status(response) -> str:
+    """Returns hit, miss, stale or off for a response.
+
+    Args:
+        response: A requests or requests-cache response.
+
+    Returns:
+        str
+    """
+    from_cache = getattr(response, "from_cache", None)
+    if from_cache is None:
+        return OFF
+    if not from_cache:
+        return MISS
+    if getattr(response, "is_expired", False):
+        return STALE
+    return HIT
+
+
+class _Histogram:
+    """Cumulative-on-export histogram of durations."""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, buckets):
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, buckets, value):
+        self.counts[bisect_left(buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class _EndpointStats:
+    """The histograms and counters of one endpoint template."""
+
+    __slots__ = (
+        "network",
+        "decode",
+        "bytes",
+        "cache",
+        "statuses",
+        "retries",
+        "throttled",
+        "errors",
+    )
+
+    def __init__(self, buckets):
+        self.network = _Histogram(buckets)
+        self.decode = _Histogram(buckets)
+        self.bytes = 0
+        self.cache = {HIT: 0, MISS: 0, STALE: 0, OFF: 0}
+        self.statuses = {}
+        self.retries = 0
+        self.throttled = 0.0
+        self.errors = 0
+
+
+def _label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsCollector:
+    """Aggregates RequestEvents per endpoint template.
+
+    Methods:
+    - __call__(event)
+    - snapshot()
+    - to_prometheus(prefix="fmp")
+    - reset()
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """Initializes the collector.
+
+        Args:
+            buckets: Ascending upper bounds of the latency buckets, seconds.
+
+        Returns:
+            None
+        """
+        self.buckets = tuple(buckets)
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent):
+        """Records an event, the hook interface.
+
+        Args:
+            event (RequestEvent): The request.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            stats = self._stats.get(event.template)
+            if stats is None:
+                stats = self._stats[event.template] = _EndpointStats(self.buckets)
+            stats.network.observe(self.buckets, event.network_seconds)
+            stats.decode.observe(self.buckets, event.decode_seconds)
+            stats.bytes += event.bytes
+            stats.cache[event.cache] += 1
+            stats.statuses[event.status] = stats.statuses.get(event.status, 0) + 1
+            stats.retries += event.retries
+            stats.throttled += event.throttled_seconds
+            if event.error is not None:
+                stats.errors += 1
+
+    def reset(self):
+        """Forgets everything recorded.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._stats.clear()
+
+    def snapshot(self) -> dict:
+        """Returns the metrics of every endpoint template.
+
+        Returns:
+            dict: Template to requests, statuses, bytes, cache counts,
+             retries, throttled_seconds, errors and, for the network and
+             decode phases, count, sum, mean and the bucket counts keyed by
+             upper bound (inf for the last).
+        """
+
+        def histogram(values):
+            bounds = self.buckets + (float("inf"),)
+            return {
+                "count": values.count,
+                "sum": values.total,
+                "mean": values.total / values.count if values.count else 0.0,
+                "buckets": dict(zip(bounds, values.counts)),
+            }
+
+        with self._lock:
+            return {
+                template: {
+                    "requests": stats.network.count,
+                    "statuses": dict(stats.statuses),
+                    "bytes": stats.bytes,
+                    "cache": dict(stats.cache),
+                    "retries": stats.retries,
+                    "throttled_seconds": stats.throttled,
+                    "errors": stats.errors,
+                    "network": histogram(stats.network),
+                    "decode": histogram(stats.decode),
+                }
+                for template, stats in self._stats.items()
+            }
+
+    def to_prometheus(self, prefix: str = "fmp") -> str:
+        """Returns the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): Prepended to every metric name.
+
+        Returns:
+            str
+        """
+        lines = [
+            f"# HELP {prefix}_request_duration_seconds Request latency by phase.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        counters = {
+            "requests_total": [],
+            "response_bytes_total": [],
+            "cache_total": [],
+            "retries_total": [],
+            "throttled_seconds_total": [],
+            "errors_total": [],
+        }
+        with self._lock:
+            for template, stats in sorted(self._stats.items()):
+                endpoint = f'endpoint="{_label(template)}"'
+                for phase, values in (
+                    ("network", stats.network),
+                    ("decode", stats.decode),
+                ):
+                    labels = f'{endpoint},phase="{phase}"'
+                    cumulative = 0
+                    for bound, count in zip(self.buckets + ("+Inf",), values.counts):
+                        cumulative += count
+                        lines.append(
+                            f"{prefix}_request_duration_seconds_bucket"
+                            f'{{{labels},le="{bound}"}} {cumulative}'
+                        )
+                    lines.append(
+                        f"{prefix}_request_duration_seconds_sum{{{labels}}} "
+                        f"{values.total}"
+                    )
+                    lines.append(
+                        f"{prefix}_request_duration_seconds_count{{{labels}}} "
+                        f"{values.count}"
+                    )
+                for status, count in sorted(stats.statuses.items()):
+                    counters["requests_total"].append(
+                        f'{{{endpoint},status="{status}"}} {count}'
+                    )
+                counters["response_bytes_total"].append(f"{{{endpoint}}} {stats.bytes}")
+                for result, count in stats.cache.items():
+                    counters["cache_total"].append(
+                        f'{{{endpoint},result="{result}"}} {count}'
+                    )
+                counters["retries_total"].append(f"{{{endpoint}}} {stats.retries}")
+                counters["throttled_seconds_total"].append(
+                    f"{{{endpoint}}} {stats.throttled}"
+                )
+                counters["errors_total"].append(f"{{{endpoint}}} {stats.errors}")
+        for name, samples in counters.items():
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            lines.extend(f"{prefix}_{name}{sample}" for sample in samples)
+        return "\n".join(lines) + "\n"
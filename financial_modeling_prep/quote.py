@@ -1,4 +1,6 @@
 """This module contains the Quote class."""
+from financial_modeling_prep.structs import StockQuote
+
 FULL_QUOTE_ENDPOINT = "v3/quote/{symbol}"
 QUOTE_ORDER_ENDPOINT = "v3/quote-order/{symbol}"
 SIMPLE_QUOTE = "v3/quote-short/{symbol}"
@@ -23,11 +25,11 @@ class Quote:
     """Quote class.
 
     Methods:
-    - get_full_quote(symbol)
+    - get_full_quote(symbol, as_structs=False)
     - get_quote_order(symbol)
     - get_simple_quote(symbol)
     - get_otc_quote(symbol)
-    - get_exchange_prices(exchange)
+    - get_exchange_prices(exchange, as_structs=False)
     - get_stock_price_change(symbol)
     - get_aftermarket_trade(symbol)
     - get_aftermarket_quote(symbol)
@@ -55,13 +57,14 @@ class Quote:
         """
         self.api = api
 
-    def get_full_quote(self, symbol):
+    def get_full_quote(self, symbol, as_structs: bool = False):
         """This endpoint gives you the latest bid and ask prices for a stock.
 
          As well as the volume and last trade price in real time.
 
         Args:
             symbol: the stock symbol
+            as_structs: return a list of StockQuote
 
         Returns: [
             {
@@ -90,7 +93,10 @@ class Quote:
             }
         ]
         """
-        return self.api.get(FULL_QUOTE_ENDPOINT.format(symbol=symbol))
+        return self.api.get(
+            FULL_QUOTE_ENDPOINT.format(symbol=symbol),
+            struct=StockQuote if as_structs else None,
+        )
 
     def get_quote_order(self, symbol):
         """This endpoint gives you the latest bid and ask prices for a stock.
@@ -171,11 +177,12 @@ class Quote:
         """
         return self.api.get(OTC_QUOTE_ENDPOINT.format(symbol=symbol))
 
-    def get_exchange_prices(self, exchange):
+    def get_exchange_prices(self, exchange, as_structs: bool = False):
         """This endpoint gives you a list of all exchange prices for a given stock.
 
         Args:
             exchange: the stock exchange
+            as_structs: return a list of StockQuote
 
         Returns: [
             {
@@ -204,7 +211,10 @@ class Quote:
             }
         ]
         """
-        return self.api.get(EXCHANGE_PRICES_ENDPOINT.format(exchange=exchange))
+        return self.api.get(
+            EXCHANGE_PRICES_ENDPOINT.format(exchange=exchange),
+            struct=StockQuote if as_structs else None,
+        )
 
     def get_stock_price_change(self, symbol):
         """Change in a stock's price over a given period of time.
@@ -0,0 +1,200 @@
+"""The latest top-of-book quote of every symbol, kept in flat arrays.
+
+Each symbol gets a fixed id, its row in one array per field. Quote ticks
+overwrite the row in place. Readers take snapshots without blocking the
+writers: a sequence counter, odd while a write is in progress, tells them to
+retry when a copy overlapped an update, so a snapshot never mixes two quotes.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from array import array
+
+from financial_modeling_prep.ticks import QUOTE, Tick
+
+FIELDS = ("bid_price", "bid_size", "ask_price", "ask_size", "timestamp")
+# Doubles for prices and sizes, int64 for the nanosecond timestamps, which a
+# double cannot hold exactly.
+TYPECODES = ("d", "d", "d", "d", "q")
+
+_NAN = float("nan")
+
+
+class BookSnapshot:
+    """A consistent copy of a QuoteBook.
+
+    Attributes:
+        symbols: The symbols, in id order.
+        bid_price, bid_size, ask_price, ask_size: array("d") of the same
+         length, NaN where no quote was received.
+        timestamp: array("q") of nanoseconds, 0 where no quote was received.
+
+    Methods:
+    - get(symbol)
+    - rows()
+    """
+
+    def __init__(self, symbols, ids, columns):
+        """Initializes the snapshot from copied arrays."""
+        self.symbols = symbols
+        self._ids = ids
+        for field, column in zip(FIELDS, columns):
+            setattr(self, field, column)
+
+    def __len__(self):
+        """Returns the number of symbols."""
+        return len(self.symbols)
+
+    def get(self, symbol: str):
+        """Returns the quote of a symbol.
+
+        Args:
+            symbol (str): The ticker symbol.
+
+        Returns:
+            dict | None
+        """
+        index = self._ids.get(symbol)
+        if index is None or index >= len(self.symbols):
+            return None
+        return {field: getattr(self, field)[index] for field in FIELDS}
+
+    def rows(self) -> list:
+        """Returns one dict per symbol, with symbol and the quote fields."""
+        columns = [getattr(self, field) for field in FIELDS]
+        return [
+            dict(zip(("symbol",) + FIELDS, (symbol, *values)))
+            for symbol, *values in zip(self.symbols, *columns)
+        ]
+
+
+class QuoteBook:
+    """The latest bid and ask of every symbol seen, updated in place.
+
+    Methods:
+    - update(tick)
+    - add(ticks)
+    - symbol_id(symbol)
+    - get(symbol)
+    - snapshot()
+    """
+
+    def __init__(self):
+        """Initializes an empty book.
+
+        Returns:
+            None
+        """
+        self._ids = {}
+        self._symbols = []
+        self._columns = tuple(array(typecode) for typecode in TYPECODES)
+        self._sequence = 0
+        self._write_lock = threading.Lock()
+
+    def __len__(self):
+        """Returns the number of symbols."""
+        return len(self._symbols)
+
+    def symbol_id(self, symbol: str) -> int:
+        """Returns the row of a symbol, adding it when new.
+
+        Args:
+            symbol (str): The ticker symbol.
+
+        Returns:
+            int
+        """
+        index = self._ids.get(symbol)
+        if index is None:
+            with self._write_lock:
+                index = self._ids.get(symbol)
+                if index is None:
+                    self._sequence += 1
+                    for column in self._columns:
+                        column.append(_NAN if column.typecode == "d" else 0)
+                    index = len(self._symbols)
+                    self._symbols.append(symbol)
+                    self._ids[symbol] = index
+                    self._sequence += 1
+        return index
+
+    def update(self, tick) -> bool:
+        """Applies a quote tick, other ticks are ignored.
+
+        Args:
+            tick (Tick | dict): A decoded tick or feed message.
+
+        Returns:
+            bool: True when the book changed.
+        """
+        if not isinstance(tick, Tick):
+            tick = Tick.from_message(tick)
+        if tick.type != QUOTE:
+            return False
+        index = self.symbol_id(tick.symbol)
+        bid_price, bid_size, ask_price, ask_size, timestamp = self._columns
+        with self._write_lock:
+            self._sequence += 1
+            if tick.bid_price is not None:
+                bid_price[index] = tick.bid_price
+            if tick.bid_size is not None:
+                bid_size[index] = tick.bid_size
+            if tick.ask_price is not None:
+                ask_price[index] = tick.ask_price
+            if tick.ask_size is not None:
+                ask_size[index] = tick.ask_size
+            if tick.timestamp is not None:
+                timestamp[index] = int(tick.timestamp)
+            self._sequence += 1
+        return True
+
+    def add(self, ticks):
+        """Applies ticks in arrival order, e.g. as a decoded WebSocket callback.
+
+        Args:
+            ticks (list[Tick]): The ticks.
+
+        Returns:
+            None
+        """
+        for tick in ticks:
+            self.update(tick)
+
+    def get(self, symbol: str):
+        """Returns the latest quote of a symbol.
+
+        Args:
+            symbol (str): The ticker symbol.
+
+        Returns:
+            dict | None: bid_price, bid_size, ask_price, ask_size and
+             timestamp, or None for a symbol never quoted.
+        """
+        index = self._ids.get(symbol)
+        if index is None:
+            return None
+        while True:
+            sequence = self._sequence
+            if sequence % 2 == 0:
+                quote = {
+                    field: column[index] for field, column in zip(FIELDS, self._columns)
+                }
+                if self._sequence == sequence:
+                    return quote
+            time.sleep(0)
+
+    def snapshot(self) -> BookSnapshot:
+        """Copies the whole book without blocking writers.
+
+        Returns:
+            BookSnapshot
+        """
+        while True:
+            sequence = self._sequence
+            if sequence % 2 == 0:
+                symbols = self._symbols[:]
+                columns = [column[: len(symbols)] for column in self._columns]
+                if self._sequence == sequence:
+                    return BookSnapshot(symbols, self._ids, columns)
+            time.sleep(0)
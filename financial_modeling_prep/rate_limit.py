@@ -0,0 +1,136 @@
+"""Client-side rate limiting for the Financial Modeling Prep API."""
+import threading
+import time
+
+# Requests allowed per period for each FMP plan tier, as (requests, seconds).
+PLAN_LIMITS = {
+    "basic": (250, 86400),
+    "starter": (300, 60),
+    "premium": (750, 60),
+    "ultimate": (3000, 60),
+}
+
+# Quota periods at least this long, in seconds, allow their whole quota as
+# a burst.
+DAILY_PERIOD = 86400
+
+# Fraction of the plan limit to pace at, so requests stay just under the quota.
+DEFAULT_HEADROOM = 0.95
+
+
+class RateLimiter:
+    """A thread-safe token bucket.
+
+    Tokens refill continuously at rate per second up to burst. Every request
+    takes one token, waiting for a refill when the bucket is empty. A single
+    instance can be shared by any number of clients and threads, including the
+    worker threads used by AsyncFinancialModelingPrep.
+
+    Methods:
+    - for_plan(plan, headroom=DEFAULT_HEADROOM): classmethod
+    - acquire(tokens=1)
+    - penalize(seconds)
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initializes the token bucket.
+
+        Args:
+            rate (float): Tokens added per second.
+            burst (int): The maximum number of tokens held at once.
+
+        Returns:
+            None
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        if burst < 1:
+            raise ValueError("burst must be at least 1.")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_plan(cls, plan: str, headroom: float = DEFAULT_HEADROOM):
+        """Builds a limiter paced just under the quota of an FMP plan.
+
+        Args:
+            plan (str): basic, starter, premium or ultimate.
+            headroom (float): Fraction of the plan quota to use.
+
+        Returns:
+            RateLimiter
+        """
+        try:
+            requests, seconds = PLAN_LIMITS[plan.lower()]
+        except KeyError:
+            raise ValueError(
+                f"Unknown plan {plan!r}, expected one of {', '.join(PLAN_LIMITS)}."
+            ) from None
+        allowed = max(1, int(requests * headroom))
+        if seconds >= DAILY_PERIOD:
+            # The whole daily quota is usable at once and refills over the day,
+            # rather than one request every few minutes.
+            burst = allowed
+        else:
+            # Allow a burst of about one second's worth of requests.
+            burst = max(1, min(allowed, int(allowed / seconds) or 1))
+        return cls(allowed / seconds, burst)
+
+    def _refill(self, now):
+        # Nothing refills while penalized.
+        elapsed = now - max(self._updated, self._blocked_until)
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: int = 1):
+        """Takes tokens from the bucket, sleeping until they are available.
+
+        Args:
+            tokens (int): The number of tokens to take.
+
+        Returns:
+            float: The number of seconds spent waiting.
+
+        Raises:
+            ValueError: tokens exceeds burst, the bucket never holds that many.
+        """
+        if tokens > self.burst:
+            raise ValueError(
+                f"Cannot acquire {tokens} tokens at once, burst is {self.burst}."
+            )
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                blocked = max(self._blocked_until - now, 0.0)
+                if not blocked and self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = blocked + max(tokens - self._tokens, 0.0) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def penalize(self, seconds: float):
+        """Empties the bucket and holds every caller back for the given time.
+
+        Used when the server reports that the quota was exceeded anyway.
+        Penalties reported at once by several threads overlap rather than
+        add up.
+
+        Args:
+            seconds (float): How long to pause every caller.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = 0.0
+            self._blocked_until = max(self._blocked_until, now + seconds)
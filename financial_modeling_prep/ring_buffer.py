@@ -0,0 +1,175 @@
+"""A bounded buffer between a WebSocket receive thread and its consumers.
+
+The receive thread only appends, so a slow consumer can no longer stall the
+socket. When the buffer is full the overflow policy decides what gives:
+
+- DROP_OLDEST: the oldest item is discarded.
+- COALESCE: an item replaces the newest pending item of the same key (e.g.
+  the symbol and tick type), so a symbol keeps its latest update rather than
+  a stale one. Items without a key, or whose key has no pending item,
+  discard the oldest instead. Below capacity nothing is coalesced.
+- BLOCK: the receive thread waits for room, pushing back on the socket.
+"""
+from __future__ import annotations
+
+import threading
+from collections import deque
+
+DROP_OLDEST = "drop_oldest"
+COALESCE = "coalesce"
+BLOCK = "block"
+OVERFLOW_POLICIES = (DROP_OLDEST, COALESCE, BLOCK)
+
+
+class RingBuffer:
+    """A bounded FIFO of items with an overflow policy and counters.
+
+    Methods:
+    - put(item, key=None)
+    - get_many(max_items, timeout=None)
+    - close()
+    - reopen()
+    - stats()
+    """
+
+    def __init__(self, capacity: int = 10000, overflow: str = DROP_OLDEST):
+        """Initializes the buffer.
+
+        Args:
+            capacity (int): The most items held at once.
+            overflow (str): DROP_OLDEST, COALESCE or BLOCK.
+
+        Returns:
+            None
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy {overflow!r}, expected one of "
+                f"{', '.join(OVERFLOW_POLICIES)}."
+            )
+        self.capacity = capacity
+        self.overflow = overflow
+        self.closed = False
+        # [key, item] entries in arrival order, and the newest entry of
+        # every key.
+        self._entries = deque()
+        self._newest = {}
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self.received = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+
+    def __len__(self):
+        """Returns the number of items waiting."""
+        return len(self._entries)
+
+    def put(self, item, key=None) -> bool:
+        """Adds an item.
+
+        Args:
+            item: The item.
+            key (optional): Under COALESCE and when the buffer is full, the
+             item replaces the newest pending item of the same key. None
+             never coalesces.
+
+        Returns:
+            bool: False when the buffer is closed and the item was discarded.
+        """
+        with self._lock:
+            if self.closed:
+                return False
+            self.received += 1
+            if self.overflow != COALESCE:
+                key = None
+            while len(self._entries) >= self.capacity:
+                if self.overflow == BLOCK:
+                    self._not_full.wait()
+                    if self.closed:
+                        return False
+                elif key is not None and key in self._newest:
+                    self._newest[key][1] = item
+                    self.coalesced += 1
+                    return True
+                else:
+                    self._pop()
+                    self.dropped += 1
+            entry = [key, item]
+            self._entries.append(entry)
+            if key is not None:
+                self._newest[key] = entry
+            self.max_depth = max(self.max_depth, len(self._entries))
+            self._not_empty.notify()
+            return True
+
+    def _pop(self):
+        """Removes the oldest entry, returns its item."""
+        key, item = entry = self._entries.popleft()
+        if key is not None and self._newest.get(key) is entry:
+            del self._newest[key]
+        return item
+
+    def get_many(self, max_items: int, timeout=None) -> list:
+        """Takes up to max_items, waiting for at least one.
+
+        Args:
+            max_items (int): The most items returned.
+            timeout (float, optional): The longest wait, in seconds.
+
+        Returns:
+            list: The oldest items, empty on timeout or once closed and empty.
+        """
+        with self._lock:
+            if not self._entries and not self.closed:
+                self._not_empty.wait(timeout)
+            items = []
+            while self._entries and len(items) < max_items:
+                items.append(self._pop())
+            self.delivered += len(items)
+            if items:
+                self._not_full.notify_all()
+            return items
+
+    def close(self):
+        """Stops accepting items and wakes every waiting thread.
+
+        Items already held can still be taken.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self.closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def reopen(self):
+        """Accepts items again after close().
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self.closed = False
+
+    def stats(self) -> dict:
+        """Returns the counters.
+
+        Returns:
+            dict: depth, max_depth, received, delivered, dropped and
+             coalesced.
+        """
+        with self._lock:
+            return {
+                "depth": len(self._entries),
+                "max_depth": self.max_depth,
+                "received": self.received,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+                "coalesced": self.coalesced,
+            }
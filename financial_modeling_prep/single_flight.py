@@ -0,0 +1,104 @@
+"""Single-flight deduplication of identical concurrent requests.
+
+While a request is in flight, other threads asking for the same endpoint and
+params wait for it instead of sending their own, and every one of them gets
+its decoded result, or its exception. The key is forgotten as soon as the
+request completes, so later requests reach the network or the cache as usual.
+"""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+
+
+def request_key(endpoint: str, params: dict | None = None, options=()) -> tuple:
+    """Returns the key of a request, ignoring its apikey param.
+
+    Args:
+        endpoint (str): A formatted endpoint such as v3/quote/AAPL.
+        params (dict, optional): The request params.
+        options (tuple): Anything else changing the result, e.g. the decode
+         struct.
+
+    Returns:
+        tuple
+    """
+    items = tuple(
+        sorted(
+            (str(name), str(value))
+            for name, value in (params or {}).items()
+            if name != "apikey"
+        )
+    )
+    return (endpoint, items, *options)
+
+
+class SingleFlight:
+    """Runs one call per key at a time, sharing its outcome with waiting callers.
+
+    Methods:
+    - do(key, function, *args, **kwargs)
+    - stats()
+    """
+
+    def __init__(self):
+        """Initializes the group with no call in flight.
+
+        Returns:
+            None
+        """
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._started = 0
+        self._shared = 0
+
+    def do(self, key, function, *args, **kwargs):
+        """Calls function, or waits for the call already running for key.
+
+        Args:
+            key: A hashable identifying the call, see request_key.
+            function: The call to make.
+            *args: Passed to function.
+            **kwargs: Passed to function.
+
+        Returns:
+            The result of the call, the same object for every caller.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is None:
+                future = self._calls[key] = Future()
+                self._started += 1
+                leader = True
+            else:
+                self._shared += 1
+                leader = False
+        if not leader:
+            return future.result()
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as exc:
+            self._forget(key)
+            future.set_exception(exc)
+            raise
+        self._forget(key)
+        future.set_result(result)
+        return result
+
+    def _forget(self, key):
+        with self._lock:
+            del self._calls[key]
+
+    def stats(self) -> dict:
+        """Returns how many calls were made, shared and are in flight.
+
+        Returns:
+            dict: calls, shared (callers served by another caller's call) and
+             in_flight.
+        """
+        with self._lock:
+            return {
+                "calls": self._started,
+                "shared": self._shared,
+                "in_flight": len(self._calls),
+            }
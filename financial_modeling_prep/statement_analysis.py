@@ -1,4 +1,6 @@
 """Statement Analysis module for the package."""
+from financial_modeling_prep.structs import FinancialRatios
+
 KEY_METRICS_ENDPOINT = "v3/key-metrics/{symbol}"
 KEY_METRICS_TTM_ENDPOINT = "v3/key-metrics-ttm/{symbol}"
 RATIOS_ENDPOINT = "v3/ratios/{symbol}"
@@ -283,7 +285,9 @@ class StatementAnalysis:
             params={"symbol": symbol, "period": period, "limit": limit},
         )
 
-    def get_ratios(self, symbol, period="annual", limit=140):
+    def get_ratios(
+        self, symbol, period="annual", limit=140, as_columns=False, as_structs=False
+    ):
         """Get financial ratios for a company, such as the P/B ratio and the ROE.
 
         Assess a company's financial health and compare it to its competitors.
@@ -292,6 +296,8 @@ class StatementAnalysis:
             symbol (str): The company’s ticker symbol.
             period (str, optional): "annual" or "quarterly". Default is "annual".
             limit (int, optional): The number of results to return. Default is 140
+            as_columns (bool, optional): Return the ratios as a Columns table.
+            as_structs (bool, optional): Return a list of FinancialRatios.
 
         Returns: [
             {
@@ -357,7 +363,10 @@ class StatementAnalysis:
         ]
         """
         return self.api.get(
-            RATIOS_ENDPOINT, params={"symbol": symbol, "period": period, "limit": limit}
+            RATIOS_ENDPOINT.format(symbol=symbol),
+            params={"period": period, "limit": limit},
+            as_columns=as_columns,
+            struct=FinancialRatios if as_structs else None,
         )
 
     def get_ratios_ttm(self, symbol):
@@ -0,0 +1,516 @@
+"""Typed rows decoded from JSON responses into compact __slots__ objects.
+
+A Struct subclass declares the schema of one kind of row as FIELDS, the JSON
+keys mapped to str, int, float or bool. Each key becomes a __slots__ attribute
+named in snake_case (changesPercentage -> changes_percentage), and a row
+constructor is generated for the schema, so a row costs one small object
+instead of a dict and decoding is a straight run of attribute stores.
+
+Bodies are parsed with orjson when it is installed. Keys missing from the
+schema are ignored, missing keys are None, and values of another JSON type are
+converted, e.g. the string fullTimeEmployees of a profile to an int, or None
+when they cannot be.
+"""
+from __future__ import annotations
+
+import keyword
+import math
+import re
+
+from financial_modeling_prep.errors import APIError, error_message
+
+_WORD_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+
+
+def attribute_name(key: str) -> str:
+    """Returns the snake_case attribute of a JSON key, e.g. price_avg50."""
+    name = _WORD_BOUNDARY.sub("_", key).lower()
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        number = _to_float(value)
+        if number is None or not math.isfinite(number):
+            return None
+        return int(number)
+
+
+def _to_bool(value):
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "1", "yes")
+    return bool(value)
+
+
+_CONVERTERS = {str: str, int: _to_int, float: _to_float, bool: _to_bool}
+
+
+def _row_constructor(cls):
+    """Compiles the function building an instance of cls from a row dict."""
+    lines = ["def from_row(row):", "    get = row.get", "    self = new(cls)"]
+    namespace = {"new": object.__new__, "cls": cls}
+    for index, ((key, kind), attribute) in enumerate(
+        zip(cls.FIELDS.items(), cls.__slots__)
+    ):
+        if kind not in _CONVERTERS:
+            raise TypeError(f"{cls.__name__}.{key} must be str, int, float or bool.")
+        namespace[f"kind{index}"] = kind
+        namespace[f"convert{index}"] = _CONVERTERS[kind]
+        lines.append(f"    value = get({key!r})")
+        lines.append(
+            f"    self.{attribute} = value if value is None or "
+            f"value.__class__ is kind{index} else convert{index}(value)"
+        )
+    lines.append("    return self")
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    return namespace["from_row"]
+
+
+class _StructMeta(type):
+    """Turns the FIELDS of a Struct subclass into __slots__ and a constructor."""
+
+    def __new__(mcs, name, bases, namespace):
+        fields = namespace.get("FIELDS")
+        if fields is not None:
+            slots = tuple(attribute_name(key) for key in fields)
+            namespace["__slots__"] = slots
+            namespace["KEYS"] = dict(zip(slots, fields))
+        cls = super().__new__(mcs, name, bases, namespace)
+        if fields is not None:
+            cls._from_row = staticmethod(_row_constructor(cls))
+        return cls
+
+
+class Struct(metaclass=_StructMeta):
+    """The base of typed rows, subclass it directly with a FIELDS schema.
+
+    Methods:
+    - from_row(row): classmethod
+    - from_payload(payload): classmethod
+    - decode(body): classmethod
+    - to_dict()
+    """
+
+    __slots__ = ()
+    FIELDS: dict = {}
+    KEYS: dict = {}
+
+    def __init__(self, **values):
+        """Initializes a row from attribute values, the others are None."""
+        unknown = set(values) - set(self.__slots__)
+        if unknown:
+            raise TypeError(f"Unknown fields: {', '.join(sorted(unknown))}.")
+        for attribute in self.__slots__:
+            setattr(self, attribute, values.get(attribute))
+
+    @classmethod
+    def from_row(cls, row: dict):
+        """Builds a row from a decoded JSON object.
+
+        Args:
+            row (dict): The object, keyed like FIELDS.
+
+        Returns:
+            Struct
+        """
+        return cls._from_row(row)
+
+    @classmethod
+    def from_payload(cls, payload) -> list:
+        """Builds the rows of a decoded JSON response.
+
+        Accepts a list of objects, or an object carrying them under
+        "historical" (daily charts). An empty object, as sent for unknown
+        symbols, gives no rows.
+
+        Args:
+            payload: The decoded JSON response.
+
+        Returns:
+            list
+
+        Raises:
+            APIError: The payload is an FMP error.
+        """
+        if isinstance(payload, dict):
+            message = error_message(payload)
+            if message is not None:
+                raise APIError(message)
+            if not payload:
+                return []
+            payload = payload.get("historical")
+        if not isinstance(payload, list):
+            raise TypeError(f"Cannot build {cls.__name__} rows from the response.")
+        return list(map(cls._from_row, payload))
+
+    @classmethod
+    def decode(cls, body) -> list:
+        """Parses a response body into rows.
+
+        Args:
+            body (bytes | str): The raw JSON body.
+
+        Returns:
+            list
+        """
+        # Imported here so endpoint modules can import structs cheaply.
+        # pylint: disable-next=import-outside-toplevel
+        from financial_modeling_prep.ticks import loads
+
+        return cls.from_payload(loads(body))
+
+    def to_dict(self) -> dict:
+        """Returns the row keyed by its JSON keys, as the API sent it."""
+        return {key: getattr(self, attribute) for attribute, key in self.KEYS.items()}
+
+    def __eq__(self, other):
+        """Rows are equal when of the same class with equal values."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(
+            getattr(self, attribute) == getattr(other, attribute)
+            for attribute in self.__slots__
+        )
+
+    __hash__ = None
+
+    def __repr__(self):
+        """Shows the class and the values that are set."""
+        values = ", ".join(
+            f"{attribute}={getattr(self, attribute)!r}"
+            for attribute in self.__slots__
+            if getattr(self, attribute) is not None
+        )
+        return f"{type(self).__name__}({values})"
+
+
+class StockQuote(Struct):
+    """A row of Quote.get_full_quote and Quote.get_exchange_prices."""
+
+    FIELDS = {
+        "symbol": str,
+        "name": str,
+        "price": float,
+        "changesPercentage": float,
+        "change": float,
+        "dayLow": float,
+        "dayHigh": float,
+        "yearHigh": float,
+        "yearLow": float,
+        "marketCap": int,
+        "priceAvg50": float,
+        "priceAvg200": float,
+        "exchange": str,
+        "volume": int,
+        "avgVolume": int,
+        "open": float,
+        "previousClose": float,
+        "eps": float,
+        "pe": float,
+        "earningsAnnouncement": str,
+        "sharesOutstanding": int,
+        "timestamp": int,
+    }
+
+
+class Bar(Struct):
+    """An intraday bar of Charts.get_intraday_chart."""
+
+    FIELDS = {
+        "date": str,
+        "open": float,
+        "low": float,
+        "high": float,
+        "close": float,
+        "volume": int,
+    }
+
+
+class DailyBar(Struct):
+    """A daily bar of Charts.get_daily_chart_eod."""
+
+    FIELDS = {
+        "date": str,
+        "open": float,
+        "high": float,
+        "low": float,
+        "close": float,
+        "adjClose": float,
+        "volume": int,
+        "unadjustedVolume": int,
+        "change": float,
+        "changePercent": float,
+        "vwap": float,
+        "label": str,
+        "changeOverTime": float,
+    }
+
+
+class IncomeStatement(Struct):
+    """A row of FinancialStatements.get_income_statement_by_symbol/_by_cik."""
+
+    FIELDS = {
+        "date": str,
+        "symbol": str,
+        "reportedCurrency": str,
+        "cik": str,
+        "fillingDate": str,
+        "acceptedDate": str,
+        "calendarYear": str,
+        "period": str,
+        "revenue": int,
+        "costOfRevenue": int,
+        "grossProfit": int,
+        "grossProfitRatio": float,
+        "researchAndDevelopmentExpenses": int,
+        "generalAndAdministrativeExpenses": int,
+        "sellingAndMarketingExpenses": int,
+        "sellingGeneralAndAdministrativeExpenses": int,
+        "otherExpenses": int,
+        "operatingExpenses": int,
+        "costAndExpenses": int,
+        "interestIncome": int,
+        "interestExpense": int,
+        "depreciationAndAmortization": int,
+        "ebitda": int,
+        "ebitdaratio": float,
+        "operatingIncome": int,
+        "operatingIncomeRatio": float,
+        "totalOtherIncomeExpensesNet": int,
+        "incomeBeforeTax": int,
+        "incomeBeforeTaxRatio": float,
+        "incomeTaxExpense": int,
+        "netIncome": int,
+        "netIncomeRatio": float,
+        "eps": float,
+        "epsdiluted": float,
+        "weightedAverageShsOut": int,
+        "weightedAverageShsOutDil": int,
+        "link": str,
+        "finalLink": str,
+    }
+
+
+class BalanceSheet(Struct):
+    """A row of FinancialStatements.get_balance_sheet_statement_by_symbol/_by_cik."""
+
+    FIELDS = {
+        "date": str,
+        "symbol": str,
+        "reportedCurrency": str,
+        "cik": str,
+        "fillingDate": str,
+        "acceptedDate": str,
+        "calendarYear": str,
+        "period": str,
+        "cashAndCashEquivalents": int,
+        "shortTermInvestments": int,
+        "cashAndShortTermInvestments": int,
+        "netReceivables": int,
+        "inventory": int,
+        "otherCurrentAssets": int,
+        "totalCurrentAssets": int,
+        "propertyPlantEquipmentNet": int,
+        "goodwill": int,
+        "intangibleAssets": int,
+        "goodwillAndIntangibleAssets": int,
+        "longTermInvestments": int,
+        "taxAssets": int,
+        "otherNonCurrentAssets": int,
+        "totalNonCurrentAssets": int,
+        "otherAssets": int,
+        "totalAssets": int,
+        "accountPayables": int,
+        "shortTermDebt": int,
+        "taxPayables": int,
+        "deferredRevenue": int,
+        "otherCurrentLiabilities": int,
+        "totalCurrentLiabilities": int,
+        "longTermDebt": int,
+        "deferredRevenueNonCurrent": int,
+        "deferredTaxLiabilitiesNonCurrent": int,
+        "otherNonCurrentLiabilities": int,
+        "totalNonCurrentLiabilities": int,
+        "otherLiabilities": int,
+        "capitalLeaseObligations": int,
+        "totalLiabilities": int,
+        "preferredStock": int,
+        "commonStock": int,
+        "retainedEarnings": int,
+        "accumulatedOtherComprehensiveIncomeLoss": int,
+        "othertotalStockholdersEquity": int,
+        "totalStockholdersEquity": int,
+        "totalEquity": int,
+        "totalLiabilitiesAndStockholdersEquity": int,
+        "minorityInterest": int,
+        "totalLiabilitiesAndTotalEquity": int,
+        "totalInvestments": int,
+        "totalDebt": int,
+        "netDebt": int,
+        "link": str,
+        "finalLink": str,
+    }
+
+
+class CashFlowStatement(Struct):
+    """A row of FinancialStatements.get_cashflow_statement_by_symbol/_by_cik."""
+
+    FIELDS = {
+        "date": str,
+        "symbol": str,
+        "reportedCurrency": str,
+        "cik": str,
+        "fillingDate": str,
+        "acceptedDate": str,
+        "calendarYear": str,
+        "period": str,
+        "netIncome": int,
+        "depreciationAndAmortization": int,
+        "deferredIncomeTax": int,
+        "stockBasedCompensation": int,
+        "changeInWorkingCapital": int,
+        "accountsReceivables": int,
+        "inventory": int,
+        "accountsPayables": int,
+        "otherWorkingCapital": int,
+        "otherNonCashItems": int,
+        "netCashProvidedByOperatingActivities": int,
+        "investmentsInPropertyPlantAndEquipment": int,
+        "acquisitionsNet": int,
+        "purchasesOfInvestments": int,
+        "salesMaturitiesOfInvestments": int,
+        "otherInvestingActivites": int,
+        "netCashUsedForInvestingActivites": int,
+        "debtRepayment": int,
+        "commonStockIssued": int,
+        "commonStockRepurchased": int,
+        "dividendsPaid": int,
+        "otherFinancingActivites": int,
+        "netCashUsedProvidedByFinancingActivities": int,
+        "effectOfForexChangesOnCash": int,
+        "netChangeInCash": int,
+        "cashAtEndOfPeriod": int,
+        "cashAtBeginningOfPeriod": int,
+        "operatingCashFlow": int,
+        "capitalExpenditure": int,
+        "freeCashFlow": int,
+        "link": str,
+        "finalLink": str,
+    }
+
+
+class FinancialRatios(Struct):
+    """A row of StatementAnalysis.get_ratios."""
+
+    FIELDS = {
+        "symbol": str,
+        "date": str,
+        "calendarYear": str,
+        "period": str,
+        "currentRatio": float,
+        "quickRatio": float,
+        "cashRatio": float,
+        "daysOfSalesOutstanding": float,
+        "daysOfInventoryOutstanding": float,
+        "operatingCycle": float,
+        "daysOfPayablesOutstanding": float,
+        "cashConversionCycle": float,
+        "grossProfitMargin": float,
+        "operatingProfitMargin": float,
+        "pretaxProfitMargin": float,
+        "netProfitMargin": float,
+        "effectiveTaxRate": float,
+        "returnOnAssets": float,
+        "returnOnEquity": float,
+        "returnOnCapitalEmployed": float,
+        "netIncomePerEBT": float,
+        "ebtPerEbit": float,
+        "ebitPerRevenue": float,
+        "debtRatio": float,
+        "debtEquityRatio": float,
+        "longTermDebtToCapitalization": float,
+        "totalDebtToCapitalization": float,
+        "interestCoverage": float,
+        "cashFlowToDebtRatio": float,
+        "companyEquityMultiplier": float,
+        "receivablesTurnover": float,
+        "payablesTurnover": float,
+        "inventoryTurnover": float,
+        "fixedAssetTurnover": float,
+        "assetTurnover": float,
+        "operatingCashFlowPerShare": float,
+        "freeCashFlowPerShare": float,
+        "cashPerShare": float,
+        "payoutRatio": float,
+        "operatingCashFlowSalesRatio": float,
+        "freeCashFlowOperatingCashFlowRatio": float,
+        "cashFlowCoverageRatios": float,
+        "shortTermCoverageRatios": float,
+        "capitalExpenditureCoverageRatio": float,
+        "dividendPaidAndCapexCoverageRatio": float,
+        "dividendPayoutRatio": float,
+        "priceBookValueRatio": float,
+        "priceToBookRatio": float,
+        "priceToSalesRatio": float,
+        "priceEarningsRatio": float,
+        "priceToFreeCashFlowsRatio": float,
+        "priceToOperatingCashFlowsRatio": float,
+        "priceCashFlowRatio": float,
+        "priceEarningsToGrowthRatio": float,
+        "priceSalesRatio": float,
+        "dividendYield": float,
+        "enterpriseValueMultiple": float,
+        "priceFairValue": float,
+    }
+
+
+class CompanyProfile(Struct):
+    """A row of CompanyInfo.get_company_profile."""
+
+    FIELDS = {
+        "symbol": str,
+        "price": float,
+        "beta": float,
+        "volAvg": int,
+        "mktCap": int,
+        "lastDiv": float,
+        "range": str,
+        "changes": float,
+        "companyName": str,
+        "currency": str,
+        "cik": str,
+        "isin": str,
+        "cusip": str,
+        "exchange": str,
+        "exchangeShortName": str,
+        "industry": str,
+        "website": str,
+        "description": str,
+        "ceo": str,
+        "sector": str,
+        "country": str,
+        "fullTimeEmployees": int,
+        "phone": str,
+        "address": str,
+        "city": str,
+        "state": str,
+        "zip": str,
+        "dcfDiff": float,
+        "dcf": float,
+        "image": str,
+        "ipoDate": str,
+        "defaultImage": bool,
+        "isEtf": bool,
+        "isActivelyTrading": bool,
+        "isAdr": bool,
+        "isFund": bool,
+    }
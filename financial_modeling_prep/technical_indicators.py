@@ -1,4 +1,8 @@
 """Provides the technical indicator values for a given stock symbol."""
+from financial_modeling_prep import indicators
+from financial_modeling_prep.errors import APIError, error_message
+from financial_modeling_prep.fan_out import fan_out
+
 TECHNICAL_INDICATOR_ENDPOINT = "v3/technical_indicator/{timeframe}/{symbol}"
 
 
@@ -8,6 +12,12 @@ class TechnicalIndicators:
     Methods:
     - `get_technical_indicator(timeframe, symbol, indicator_type, period)`:
     Provides the technical indicator values for a given stock symbol.
+    - `compute_technical_indicator(timeframe, symbol, indicator_type, period, *,
+      from_date=None, to_date=None, bars=None)`:
+    Computes the same values locally from chart bars.
+    - `compute_many(symbols, timeframe, specs, *, from_date=None, to_date=None,
+      workers=8)`:
+    Computes several indicators for many symbols at once.
 
     """
 
@@ -49,3 +59,106 @@ class TechnicalIndicators:
             TECHNICAL_INDICATOR_ENDPOINT.format(timeframe=timeframe, symbol=symbol),
             params={"type": indicator_type, "period": period},
         )
+
+    def compute_technical_indicator(
+        self,
+        timeframe,
+        symbol,
+        indicator_type,
+        period,
+        *,
+        from_date=None,
+        to_date=None,
+        bars=None,
+    ):
+        # pylint: disable=line-too-long
+        """Computes technical indicator values locally from chart bars.
+
+        The bars are fetched once through Charts (or passed in, e.g. from a
+        BarStore) and any number of indicators can then be computed from them
+        without further requests. Use indicators.IndicatorStream to keep an
+        indicator current as new bars arrive.
+
+        Args:
+            timeframe (str): 1min, 5min, 15min, 30min, 1hour, 4hour, 1day
+            symbol (str): Ticker symbol
+            indicator_type (str): sma, ema, wma, dema, tema, williams, rsi, adx, standarddeviation
+            period (int): Number of data points used to calculate each moving average value
+            from_date (str, optional): The first date of the bars to fetch, YYYY-MM-DD.
+            to_date (str, optional): The last date of the bars to fetch, YYYY-MM-DD.
+            bars (list, optional): Chart bars to use instead of fetching them.
+
+        Returns: The rows of get_technical_indicator, newest first.
+        """  # noqa: E501
+        if bars is None:
+            bars = self._fetch_bars(timeframe, symbol, from_date, to_date)
+        return indicators.compute(bars, indicator_type, period)
+
+    def _fetch_bars(self, timeframe, symbol, from_date, to_date):
+        # pylint: disable-next=import-outside-toplevel
+        from financial_modeling_prep.async_client import require_sync
+
+        require_sync(self.api, "compute_technical_indicator() without bars")
+        if timeframe == "1day":
+            payload = self.api.charts.get_daily_chart_eod(
+                symbol, from_date, to_date, None
+            )
+        else:
+            payload = self.api.charts.get_intraday_chart(
+                timeframe, symbol, from_date, to_date
+            )
+        message = error_message(payload)
+        if message is not None:
+            raise APIError(message)
+        if isinstance(payload, dict):
+            payload = payload.get("historical", [])
+        return payload if isinstance(payload, list) else []
+
+    def compute_many(
+        self,
+        symbols,
+        timeframe,
+        specs=(("ema", 20), ("rsi", 14)),
+        *,
+        from_date=None,
+        to_date=None,
+        workers=8,
+    ):
+        # pylint: disable=line-too-long
+        """Computes several indicators for many symbols at once.
+
+        The bars of every symbol are fetched concurrently, one request each,
+        aligned by date into symbol x date arrays and every indicator is
+        computed for all symbols together. Symbols whose bars could not be
+        fetched are left out and reported in the result's errors. Requires
+        numpy.
+
+        Args:
+            symbols (Iterable[str]): Ticker symbols
+            timeframe (str): 1min, 5min, 15min, 30min, 1hour, 4hour, 1day
+            specs (list): (indicator_type, period) pairs, e.g. [("ema", 20), ("rsi", 14)]
+            from_date (str, optional): The first date of the bars to fetch, YYYY-MM-DD.
+            to_date (str, optional): The last date of the bars to fetch, YYYY-MM-DD.
+            workers (int): Requests in flight at once.
+
+        Returns: An IndicatorMatrix with one array per spec, named e.g. "ema_20".
+        """  # noqa: E501
+        # pylint: disable-next=import-outside-toplevel
+        from financial_modeling_prep.async_client import require_sync
+        # pylint: disable-next=import-outside-toplevel
+        from financial_modeling_prep.indicator_matrix import compute_matrix
+
+        require_sync(self.api, "compute_many()")
+        symbols = list(symbols)  # Iterated twice, once to fetch, once to order.
+        bars_by_symbol, errors = {}, {}
+        for symbol, bars, error in fan_out(
+            lambda symbol: self._fetch_bars(timeframe, symbol, from_date, to_date),
+            symbols,
+            workers=workers,
+        ):
+            if error is not None:
+                errors[symbol] = error
+            else:
+                bars_by_symbol[symbol] = bars
+        ordered = {s: bars_by_symbol[s] for s in symbols if s in bars_by_symbol}
+        return compute_matrix(ordered, specs, errors)
@@ -0,0 +1,302 @@
+"""A compact binary log of WebSocket ticks, and its replay.
+
+The log starts with MAGIC and holds two kinds of little-endian records:
+
+- a string definition: kind 1, uint32 id, uint16 length, UTF-8 bytes. Symbols
+  and exchanges are written once and referred to by id afterwards.
+- a tick: kind 0, int64 receive time (ns), uint64 feed timestamp, uint32
+  symbol id, uint32 exchange id, the type byte, a presence bitmask and six
+  doubles (ap, as, bp, bs, lp, ls).
+
+Logs are read through mmap, and replay() feeds their ticks to a callback at
+the recorded pace, faster, or as fast as it can.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+
+from financial_modeling_prep.ticks import Tick, decode
+
+MAGIC = b"FMPTICK1"
+
+_TICK = 0
+_STRING = 1
+_NONE = 0xFFFFFFFF
+_TICK_RECORD = struct.Struct("<BqQIIcB6d")
+_STRING_HEADER = struct.Struct("<BIH")
+_VALUES = ("ask_price", "ask_size", "bid_price", "bid_size", "last_price", "last_size")
+
+
+class TickRecorder:
+    """Appends ticks to a log file.
+
+    Methods:
+    - record(ticks, received=None)
+    - record_message(message)
+    - flush()
+    - close()
+    """
+
+    def __init__(self, path: str):
+        """Opens the log, appending to it if it exists.
+
+        A record cut short by a crash is truncated away first, so new records
+        start on a record boundary.
+
+        Args:
+            path (str): The log file.
+
+        Returns:
+            None
+        """
+        self.path = path
+        self._strings = {}
+        end = 0
+        if _exists(path):
+            end = len(MAGIC)
+            for data, kind, offset, end in _records(path):
+                if kind == _STRING:
+                    string_id, value = _string(data, offset)
+                    self._strings[value] = string_id
+        self._file = open(path, "ab")  # pylint: disable=consider-using-with
+        if self._file.tell() > end:
+            self._file.truncate(end)
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def __enter__(self):
+        """Returns the recorder."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Closes the log."""
+        self.close()
+
+    def _string_id(self, value):
+        if value is None:
+            return _NONE
+        string_id = self._strings.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings[value] = string_id
+            data = str(value).encode()
+            self._file.write(_STRING_HEADER.pack(_STRING, string_id, len(data)))
+            self._file.write(data)
+        return string_id
+
+    def record(self, ticks, received=None):
+        """Appends ticks, e.g. as a decoded WebSocket callback.
+
+        Args:
+            ticks (list[Tick]): The ticks.
+            received (int, optional): The receive time in ns, now by default.
+
+        Returns:
+            None
+        """
+        received = time.time_ns() if received is None else received
+        pack = _TICK_RECORD.pack
+        with self._lock:
+            for tick in ticks:
+                flags = 0
+                values = []
+                for bit, field in enumerate(_VALUES):
+                    value = getattr(tick, field)
+                    if value is None:
+                        values.append(0.0)
+                    else:
+                        flags |= 1 << bit
+                        values.append(value)
+                self._file.write(
+                    pack(
+                        _TICK,
+                        received,
+                        int(tick.timestamp or 0),
+                        self._string_id(tick.symbol),
+                        self._string_id(tick.exchange),
+                        (tick.type or "?").encode()[:1],
+                        flags,
+                        *values,
+                    )
+                )
+            self.count += len(ticks)
+
+    def record_message(self, message):
+        """Decodes a raw feed message and appends its ticks.
+
+        Args:
+            message (str | bytes): The raw message.
+
+        Returns:
+            None
+        """
+        self.record(decode(message)[0])
+
+    def flush(self):
+        """Writes buffered records to the file.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._file.flush()
+
+    def close(self):
+        """Flushes and closes the log.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._file.close()
+
+
+def _exists(path):
+    try:
+        with open(path, "rb") as file:
+            return bool(file.read(1))
+    except FileNotFoundError:
+        return False
+
+
+def _records(path):
+    """Yields (data, kind, offset, end) of every complete record of a log."""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return  # Created, nothing recorded yet.
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[: len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} is not a tick log.")
+            offset, size = len(MAGIC), len(data)
+            while offset < size:
+                kind = data[offset]
+                if kind == _TICK:
+                    end = offset + _TICK_RECORD.size
+                else:
+                    if offset + _STRING_HEADER.size > size:
+                        return
+                    length = _STRING_HEADER.unpack_from(data, offset)[2]
+                    end = offset + _STRING_HEADER.size + length
+                if end > size:
+                    return  # Cut short while being written.
+                yield data, kind, offset, end
+                offset = end
+
+
+def _string(data, offset):
+    """Returns the (id, string) of the definition at offset."""
+    _, string_id, length = _STRING_HEADER.unpack_from(data, offset)
+    start = offset + _STRING_HEADER.size
+    return string_id, bytes(data[start : start + length]).decode()
+
+
+class TickLog:
+    """Reads a log written by TickRecorder.
+
+    Methods:
+    - __iter__(), yielding (received_ns, Tick)
+    - strings()
+    """
+
+    def __init__(self, path: str):
+        """Initializes the reader.
+
+        Args:
+            path (str): The log file.
+
+        Returns:
+            None
+        """
+        self.path = path
+
+    def strings(self):
+        """Yields the (id, string) definitions.
+
+        Yields:
+            tuple[int, str]
+        """
+        for data, kind, offset, _ in _records(self.path):
+            if kind == _STRING:
+                yield _string(data, offset)
+
+    def __iter__(self):
+        """Yields (received_ns, Tick) in recorded order."""
+        strings = {_NONE: None}
+        unpack = _TICK_RECORD.unpack_from
+        for data, kind, offset, _ in _records(self.path):
+            if kind == _STRING:
+                string_id, value = _string(data, offset)
+                strings[string_id] = value
+                continue
+            (
+                _,
+                received,
+                timestamp,
+                symbol,
+                exchange,
+                tick_type,
+                flags,
+                *values,
+            ) = unpack(data, offset)
+            for bit in range(len(_VALUES)):
+                if not flags & (1 << bit):
+                    values[bit] = None
+            yield received, Tick(
+                strings[symbol],
+                timestamp,
+                tick_type.decode(),
+                *values,
+                exchange=strings[exchange],
+            )
+
+
+def replay(path: str, callback, speed=1.0, decoded=True, batch_size=1000) -> int:
+    """Feeds a recorded log to a callback, as a WebSocket client would.
+
+    Args:
+        path (str): The log file.
+        callback: Receives lists of Tick, or raw JSON messages when decoded
+         is False, like the callback of a WebSocket client.
+        speed (float, optional): 1 replays at the recorded pace, 10 ten times
+         faster, None as fast as possible.
+        decoded (bool): Deliver lists of Tick rather than JSON strings.
+        batch_size (int): The most ticks per call when decoded.
+
+    Returns:
+        int: The number of ticks replayed.
+    """
+    count = 0
+    batch = []
+    started = first = None
+
+    def deliver():
+        if decoded:
+            callback(batch[:])
+        else:
+            for tick in batch:
+                callback(json.dumps(tick.to_message()))
+        batch.clear()
+
+    for received, tick in TickLog(path):
+        if speed:
+            if first is None:
+                started, first = time.monotonic(), received
+            delay = started + (received - first) / 1e9 / speed - time.monotonic()
+            if delay > 0:
+                if batch:
+                    deliver()
+                time.sleep(delay)
+        batch.append(tick)
+        count += 1
+        if len(batch) >= batch_size or not decoded:
+            deliver()
+    if batch:
+        deliver()
+    return count
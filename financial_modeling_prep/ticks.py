@@ -0,0 +1,253 @@
+"""Decoding of WebSocket feed messages into compact tick records.
+
+Messages are parsed with orjson when it is installed and the json module
+otherwise. Each price update becomes a Tick, a __slots__ record, and ticks can
+be handed to a callback in micro-batches rather than one call per message.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+TRADE = "T"
+QUOTE = "Q"
+BREAK = "B"
+
+
+def loads(message):
+    """Parses a JSON message, str or bytes, with the fastest parser available."""
+    if orjson is not None:
+        return orjson.loads(message)
+    return json.loads(message)
+
+
+class Tick:
+    """One price update of a WebSocket feed.
+
+    Attributes:
+        symbol: s, the ticker.
+        timestamp: t, as sent by the server.
+        type: T for trades, Q for top-of-book updates, B for trade breaks.
+        ask_price: ap, quotes only.
+        ask_size: as, quotes only.
+        bid_price: bp, quotes only.
+        bid_size: bs, quotes only.
+        last_price: lp, trades and breaks only.
+        last_size: ls, trades and breaks only.
+        exchange: e, crypto only.
+    """
+
+    __slots__ = (
+        "symbol",
+        "timestamp",
+        "type",
+        "ask_price",
+        "ask_size",
+        "bid_price",
+        "bid_size",
+        "last_price",
+        "last_size",
+        "exchange",
+    )
+
+    # Message keys, in __slots__ order.
+    KEYS = ("s", "t", "type", "ap", "as", "bp", "bs", "lp", "ls", "e")
+
+    # Positional in KEYS order, as decoding and the tick log build them.
+    def __init__(  # pylint: disable=too-many-positional-arguments
+        self,
+        symbol,
+        timestamp,
+        type,  # pylint: disable=redefined-builtin
+        ask_price=None,
+        ask_size=None,
+        bid_price=None,
+        bid_size=None,
+        last_price=None,
+        last_size=None,
+        exchange=None,
+    ):
+        """Initializes the tick from its message fields."""
+        self.symbol = symbol
+        self.timestamp = timestamp
+        self.type = type
+        self.ask_price = ask_price
+        self.ask_size = ask_size
+        self.bid_price = bid_price
+        self.bid_size = bid_size
+        self.last_price = last_price
+        self.last_size = last_size
+        self.exchange = exchange
+
+    @classmethod
+    def from_message(cls, message: dict) -> Tick:
+        """Builds a tick from a decoded message, ignoring unknown keys."""
+        get = message.get
+        return cls(
+            get("s"),
+            get("t"),
+            get("type"),
+            get("ap"),
+            get("as"),
+            get("bp"),
+            get("bs"),
+            get("lp"),
+            get("ls"),
+            get("e"),
+        )
+
+    def to_message(self) -> dict:
+        """Returns the tick with the message keys, omitting empty fields."""
+        return {
+            key: getattr(self, slot)
+            for key, slot in zip(self.KEYS, self.__slots__)
+            if getattr(self, slot) is not None
+        }
+
+    def __repr__(self):
+        """Returns the fields that are set."""
+        return f"Tick({self.to_message()!r})"
+
+    def __eq__(self, other):
+        """Ticks are equal when all their fields are."""
+        if not isinstance(other, Tick):
+            return NotImplemented
+        return all(
+            getattr(self, slot) == getattr(other, slot) for slot in self.__slots__
+        )
+
+
+def decode(message):
+    """Decodes a raw feed message.
+
+    A message holds one object or a list of them. Objects with a type are
+    price updates, anything else (login replies, subscription acks, errors)
+    is returned as an event dict.
+
+    Args:
+        message (str | bytes): The raw message.
+
+    Returns:
+        tuple[list[Tick], list[dict]]: The ticks and the other events.
+    """
+    payload = loads(message)
+    if isinstance(payload, dict):
+        payload = (payload,)
+    ticks, events = [], []
+    from_message = Tick.from_message
+    for item in payload:
+        if isinstance(item, dict) and "type" in item and "s" in item:
+            ticks.append(from_message(item))
+        else:
+            events.append(item)
+    return ticks, events
+
+
+class TickBatcher:
+    """Collects ticks and hands them to a callback as lists.
+
+    A batch is delivered once it holds batch_size ticks or its oldest tick is
+    batch_interval seconds old, whichever comes first. Batches are delivered
+    in order, from the thread adding ticks or from a timer thread.
+
+    Methods:
+    - add(ticks)
+    - flush()
+    - close()
+    """
+
+    def __init__(self, callback, batch_size: int = 1000, batch_interval=0.05):
+        """Initializes the batcher.
+
+        Args:
+            callback: Called with each list of Tick.
+            batch_size (int): The most ticks delivered at once.
+            batch_interval (float, optional): The longest a tick waits, in
+             seconds. None delivers full batches only, until flush().
+
+        Returns:
+            None
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        self.callback = callback
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self._batch = []
+        self._started = None
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def add(self, ticks):
+        """Adds ticks, delivering every batch that fills up.
+
+        Args:
+            ticks (list[Tick]): The ticks, in arrival order.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if not self._batch:
+                self._started = time.monotonic()
+            self._batch.extend(ticks)
+            while len(self._batch) >= self.batch_size:
+                batch = self._batch
+                self._batch = batch[self.batch_size :]
+                self._deliver(batch[: self.batch_size])
+            if not self._batch:
+                self._disarm()
+            elif (
+                self.batch_interval is not None
+                and time.monotonic() - self._started >= self.batch_interval
+            ):
+                self._flush()
+            elif self._timer is None:
+                self._arm()
+
+    def _arm(self):
+        if self.batch_interval is None:
+            return
+        delay = self._started + self.batch_interval - time.monotonic()
+        self._timer = threading.Timer(max(delay, 0.0), self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _disarm(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _deliver(self, batch):
+        # Called with the lock held, so batches never overtake each other.
+        self._started = time.monotonic()
+        self.callback(batch)
+
+    def _flush(self):
+        self._disarm()
+        batch, self._batch = self._batch, []
+        if batch:
+            self._deliver(batch)
+
+    def flush(self):
+        """Delivers the pending ticks now.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        """Delivers the pending ticks and stops the timer.
+
+        Returns:
+            None
+        """
+        self.flush()
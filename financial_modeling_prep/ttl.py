@@ -0,0 +1,498 @@
+"""Time to live of cached responses, per endpoint.
+
+The policy is keyed by the endpoint constants of the endpoint modules, e.g.
+FULL_QUOTE_ENDPOINT or BULK_PROFILES_ENDPOINT. Every endpoint gets the
+default of its module, a few are overridden, and intraday charts of a closed
+period never expire. Bulk downloads are streamed past the cache, so their
+TTL never applies. A TTL is a number of seconds, NEVER_EXPIRE, or a
+callable taking the request params and returning one of those.
+"""
+from __future__ import annotations
+
+import datetime
+
+from requests_cache import NEVER_EXPIRE
+
+from financial_modeling_prep.cache import DEFAULT_EXPIRE_AFTER
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+
+def past_is_final(ttl):
+    """Returns a TTL that never expires once the requested period has closed.
+
+    A request is for a closed period when its year param is before the
+    current year, or its to param is a date before today.
+
+    Args:
+        ttl: The TTL used while the period is still open.
+
+    Returns:
+        Callable[[dict], int]
+    """
+
+    def expire_after(params):
+        today = datetime.date.today()
+        try:
+            closed = int(params.get("year", today.year)) < today.year
+        except (TypeError, ValueError):
+            closed = False
+        to_date = params.get("to")
+        if closed or (to_date and str(to_date)[:10] < today.isoformat()):
+            return NEVER_EXPIRE
+        return ttl
+
+    return expire_after
+
+
+# The endpoint constants of each module, copied here so that looking up a TTL
+# imports no endpoint module. Keep in step when adding an endpoint.
+MODULE_TEMPLATES = {
+    "commodities": (
+        "v3/symbol/available-commodities",
+        "v3/quotes/commodity",
+        "v3/quote/{symbol}",
+        "v3/historical-chart/{timeframe}/{symbol}",
+        "v3/historical-price-full/{symbol}",
+    ),
+    "crypto": (
+        "v3/symbol/available-crpytocurrencies",
+        "v3/quotes/crypto",
+        "v3/quote/{symbol}",
+        "v3/historical-chart/{timeframe}/{symbol}",
+        "v3/historical-price-full/{symbol}",
+    ),
+    "forex": (
+        "v3/symbol/available-forex-currency-pairs",
+        "v3/quotes/forex",
+        "v3/quote/{symbol}",
+        "v3/historical-chart/{timeframe}/{symbol}",
+        "v3/historical-price-full/{symbol}",
+    ),
+    "bulk": (
+        "v4/batch-request-end-of-day-prices",
+        "v4/income-statement-bulk",
+        "v4/balance-sheet-statement-bulk",
+        "v4/cash-flow-statement-bulk",
+        "v4/ratios-bulk",
+        "v4/key-metrics-bulk",
+        "v4/earnings-surprises-bulk",
+        "v4/profile/all",
+        "v4/stock_peers_bulk",
+        "v4/rating-bulk",
+        "v4/dcf-bulk",
+        "v4/key-metrics-ttm-bulk",
+        "v4/ratios-ttm-bulk",
+        "v4/scores-bulk",
+        "v4/financial-growth-bulk",
+        "v4/income-statement-growth-bulk",
+        "v4/balance-sheet-statement-growth-bulk",
+        "v4/cash-flow-statement-growth-bulk",
+        "v4/price-target-summary-bulk",
+        "v4/upgrades-downgrades-consensus-bulk",
+        "v4/etf-holder-bulk",
+    ),
+    "charts": (
+        "v3/historical-chart/{timeframe}/{symbol}",
+        "v3/historical-price-full/{symbol}",
+    ),
+    "company_info": (
+        "v3/profile/{symbol}",
+        "v4/governance/executive_compensation",
+        "v4/executive-compensation-benchmark",
+        "v4/company-notes",
+        "v4/historical/employee_count",
+        "v4/employee_count",
+        "v3/stock-screener",
+        "v3/grade/{symbol}",
+        "v3/key-executives/{symbol}",
+        "v4/company-core-information",
+        "v3/market-capitalization/{symbol}",
+        "v3/historical-market-capitalization/{symbol}",
+        "v3/get-all-countries",
+        "v3/analyst-estimates/{symbol}",
+        "v3/analyst-stock-recommendations/{symbol}",
+        "v4/company-outlook",
+        "v4/stock_peers",
+        "v3/is-the-market-open",
+        "v3/delisted-companies",
+        "v4/shares_float",
+        "v4/historical/shares_float",
+    ),
+    "company_search": (
+        "v3/search",
+        "v3/search-ticker",
+        "v3/search-name",
+        "v3/cik-search/{company_name}",
+        "v3/cik/{cik_number}",
+        "v3/cusip/{cusip_number}",
+    ),
+    "constituents": (
+        "v3/sp500_constituent",
+        "v3/historical/sp500_constituent",
+        "v3/nasdaq_constituent",
+        "v3/historical/nasdaq_constituent",
+        "v3/dowjones_constituent",
+        "v3/historical/dowjones_constituent",
+    ),
+    "dividends": (
+        "v3/stock_dividend_calendar",
+        "v3/historical-price-full/stock_dividend/{symbol}",
+    ),
+    "earnings": (
+        "v3/earnings_calendar",
+        "v3/historical/earnings_calendar/{symbol}",
+        "v4/earning_calendar_confirmed",
+        "v3/earnings_surprises/{symbol}",
+    ),
+    "earnings_transcripts": (
+        "v3/earning_call_transcript/{symbol}",
+        "v4/earning_call_transcripts",
+        "v4/batch_earning_call_transcript/{symbol}",
+    ),
+    "economic_data": (
+        "v4/treasury",
+        "v4/economic",
+        "v4/economic_calendar",
+        "v4/market_risk_premium",
+    ),
+    "esg": (
+        "v4/esg-environmental-social-governance-data",
+        "v4/esg-enviromental-social-governance-data-ratings",
+        "v4/esg-environmental-social-governance-sector-benchmark",
+    ),
+    "etf_holdings": (
+        "v4/etf-holdings/portfolio-date",
+        "v4/etf-holdings",
+        "v3/etf-holder/{symbol}",
+        "v4/etf-info",
+        "v3/etf-sector-weightings/{symbol}",
+        "v3/etf-country-weightings/{symbol}",
+        "v3/etf-stock-exposure/{symbol}",
+    ),
+    "financial_statements": (
+        "v3/income-statement/{symbol}",
+        "v3/income-statement/{cik}",
+        "v3/balance-sheet-statement/{symbol}",
+        "v3/balance-sheet-statement/{cik}",
+        "v3/cash-flow-statement/{symbol}",
+        "v3/cash-flow-statement/{cik}",
+        "v3/income-statement-as-reported/{symbol}",
+        "v3/balance-sheet-statement-as-reported/{symbol}",
+        "v3/cash-flow-statement-as-reported/{symbol}",
+        "v3/financial-statement-full-as-reported/{symbol}",
+        "v4/financial-reports-dates",
+        "v4/financial-reports-json",
+    ),
+    "fundraising": (
+        "v4/crowdfunding-offerings-rss-feed",
+        "v4/crowdfunding-offerings/search",
+        "v4/crowdfunding-offerings",
+        "v4/fundraising-rss-feed",
+        "v4/fundraising/search",
+        "v4/fundraising",
+    ),
+    "insider_trading": (
+        "v4/insider-trading-rss-feed",
+        "v4/insider-trading",
+        "v4/insider-trading-transaction-type",
+        "v4/insider-roaster",
+        "v4/insider-roaster-statistics",
+        "v4/mapper-cik-name",
+        "v4/mapper-cik-company/{symbol}",
+        "v4/fail-to-deliver",
+    ),
+    "institutional_stock_ownership": (
+        "v3/form-thirteen/{cik}",
+        "v3/form-thirteen-date/{cik}",
+        "v4/13f-asset-allocation",
+        "v4/institutional-ownership/list",
+        "v4/institutional-ownership/name",
+        "v4/institutional-ownership/portfolio-date",
+        "v4/institutional-ownership/rss_feed",
+        "v4/institutional-ownership/symbol-ownership",
+        "v4/institutional-ownership/institutional-holders/symbol-ownership-percent",
+        "v4/institutional-ownership/portfolio-holdings-summary",
+        "v4/institutional-ownership/industry/portfolio-holdings-summary",
+        "v4/institutional-ownership/institutional-holders/symbol-ownership",
+        "v4/institutional-ownership/portfolio-holdings",
+        "v3/institutional-holder/{symbol}",
+    ),
+    "ipo_calendar": (
+        "v4/ipo-calendar-confirmed",
+        "v4/ipo-calendar-prospectus",
+        " v3/ipo_calendar",
+    ),
+    "market_performance": (
+        "v3/quotes/index",
+        "v4/sector_price_earning_ratio",
+        "v4/industry_price_earning_ratio",
+        "v3/sectors-performance",
+        "v3/historical-sectors-performance",
+        "v3/stock_market/gainers",
+        "v3/stock_market/losers",
+        "v3/stock_market/actives",
+        "v4/commitment_of_traders_report_analysis/{symbol}",
+        "v4/commitment_of_traders_report_analysis",
+        "v4/commitment_of_traders_report/{symbol}",
+        "v4/commitment_of_traders_report",
+    ),
+    "mergers_and_acquisitions": (
+        "v4/mergers-acquisitions-rss-feed",
+        "v4/mergers-acquisitions/search",
+    ),
+    "mutual_fund_holdings": (
+        "v4/mutual-fund-holdins/portfolio-date",
+        "v4/mutual-fund-holdings",
+        "v4/mutual-fund-holdings/name",
+        "v3/mutual-fund-holder/{symbol}",
+    ),
+    "news": (
+        "v3/fmp/articles",
+        "v4/general_news",
+        "v3/stock_news",
+        "v4/stock-news-sentiments-rss-feed",
+        "v4/forex_news",
+        "v4/crypto_news",
+        "v3/press-releases/{symbol}",
+        "v4/historical/social-sentiment",
+        "v4/social-sentiments/trending",
+        "v4/social-sentiments/change",
+    ),
+    "price_targets": (
+        "v4/price-target",
+        "v4/price-target-summary",
+        "v4/price-target-analyst-name",
+        "v4/price-target-analyst-company",
+        "v4/price-target-consensus",
+        "v4/price-target-rss-feed",
+    ),
+    "quote": (
+        "v3/quote/{symbol}",
+        "v3/quote-order/{symbol}",
+        "v3/quote-short/{symbol}",
+        "v3/otc/real-time-price/{symbol}",
+        "v3/quotes/{exchange}",
+        "v3/stock-price-change/{symbol}",
+        "v4/pre-post-market-trade/{symbol}",
+        "v4/pre-post-market/{symbol}",
+        "v4/batch-pre-post-market/{symbol}",
+        "v4/batch-pre-post-market-trade/{symbol}",
+        "v4/forex/last/{pair}",
+        "v4/crypto/last/{pair}",
+        "v3/stock/real-time-price/{symbol}",
+        "v3/stock/real-time-price",
+        "v3/stock/full/real-time-price/{symbol}",
+        "v3/stock/full/real-time-price",
+        "v3/fx/{pair}",
+        "v3/fx",
+    ),
+    "sales_revenue_by_segments": (
+        "v4/revenue-product-segmentation",
+        "v4/revenue-geographic-segmentation",
+    ),
+    "sec_filings": (
+        "v4/rss_feed",
+        "v3/rss_feed",
+        "v4/rss_feed_8k",
+        "v3/sec_filings/{symbol}",
+        "v4/standard_industrial_classification",
+        "v4/standard_industrial_classification/all",
+        "v4/standard_industrial_classification_list",
+    ),
+    "senate": (
+        "v4/senate-trading",
+        "v4/senate-trading-rss-feed",
+        "v4/senate-disclosure",
+        "v4/senate-disclosure-rss-feed",
+    ),
+    "splits": (
+        "v3/stock_split_calendar",
+        "v3/historical-price-full/stock_split/{symbol}",
+    ),
+    "statement_analysis": (
+        "v3/key-metrics/{symbol}",
+        "v3/key-metrics-ttm/{symbol}",
+        "v3/ratios/{symbol}",
+        "v3/ratios-ttm/{symbol}",
+        "v3/cash-flow-statement-growth/{symbol}",
+        "v3/income-statement-growth/{symbol}",
+        "v3/balance-sheet-statement-growth/{symbol}",
+        "v3/financial-growth/{symbol}",
+        "v4/score",
+        "v4/owner-earnings",
+        "v4/enterprise-values/{symbol}",
+    ),
+    "stock_list": (
+        "v3/stock/list",
+        "v3/etf/list",
+        "v3/financial-statement-symbol-lists",
+        "v3/available-traded/list",
+        "v4/commitment_of_traders_report/list",
+        "v3/cik_list",
+        "v3/symbol/available-euronext",
+        "v4/symbol_change",
+        "v3/exchange/{exchange}",
+        "v3/symbol/available-indexes",
+    ),
+    "technical_indicators": ("v3/technical_indicator/{timeframe}/{symbol}",),
+    "upgrades_downgrades": (
+        "v4/upgrades-downgrades-rss-feed",
+        "v4/upgrades-downgrades-consensus",
+        "v4/upgrades-downgrades-grading-company",
+    ),
+    "valuation": (
+        "v3/discounted-cash-flow/{symbol}",
+        "v4/advanced_discounted_cash_flow",
+        "v4/advanced_levered_discounted_cash_flow",
+        "v3/ratings/{symbol}",
+        "v3/historical-rating/{symbol}",
+    ),
+}
+
+# Applied to the templates of a module, in this order, so a template shared by
+# several modules takes the TTL of the last one.
+MODULE_TTLS = {
+    "commodities": MINUTE,
+    "crypto": MINUTE,
+    "forex": MINUTE,
+    "bulk": DAY,
+    "charts": MINUTE,
+    "company_info": DAY,
+    "company_search": DAY,
+    "constituents": DAY,
+    "dividends": HOUR,
+    "earnings": HOUR,
+    "earnings_transcripts": DAY,
+    "economic_data": HOUR,
+    "esg": DAY,
+    "etf_holdings": DAY,
+    "financial_statements": DAY,
+    "fundraising": HOUR,
+    "insider_trading": HOUR,
+    "institutional_stock_ownership": DAY,
+    "ipo_calendar": HOUR,
+    "market_performance": MINUTE,
+    "mergers_and_acquisitions": HOUR,
+    "mutual_fund_holdings": DAY,
+    "news": 5 * MINUTE,
+    "price_targets": HOUR,
+    "quote": 5,
+    "sales_revenue_by_segments": DAY,
+    "sec_filings": HOUR,
+    "senate": HOUR,
+    "splits": HOUR,
+    "statement_analysis": DAY,
+    "stock_list": DAY,
+    "technical_indicators": MINUTE,
+    "upgrades_downgrades": HOUR,
+    "valuation": DAY,
+}
+
+OVERRIDES = {
+    # quote.REALTIME_PRICE_ENDPOINT and the other real-time prices.
+    "v3/stock/real-time-price/{symbol}": 1,
+    "v3/stock/real-time-price": 1,
+    "v3/stock/full/real-time-price/{symbol}": 1,
+    "v3/stock/full/real-time-price": 1,
+    # charts.INTRADAY_CHART_ENDPOINT and charts.DAILY_CHART_EOD_ENDPOINT.
+    "v3/historical-chart/{timeframe}/{symbol}": past_is_final(MINUTE),
+    "v3/historical-price-full/{symbol}": HOUR,
+    # company_info.MARKET_OPEN_ENDPOINT, STOCK_SCREEN_ENDPOINT and
+    # ALL_COUNTRIES_ENDPOINT.
+    "v3/is-the-market-open": MINUTE,
+    "v3/stock-screener": HOUR,
+    "v3/get-all-countries": 30 * DAY,
+    # sec_filings.ALL_INDUSTRY_CLASSIFICATION_CODES_ENDPOINT.
+    "v4/standard_industrial_classification_list": 30 * DAY,
+}
+
+
+def default_policy() -> dict:
+    """Returns the built-in endpoint template to TTL table.
+
+    Returns:
+        dict
+    """
+    policy = {}
+    for module, ttl in MODULE_TTLS.items():
+        policy.update(dict.fromkeys(MODULE_TEMPLATES[module], ttl))
+    policy.update(OVERRIDES)
+    return policy
+
+
+def _segments(template: str) -> tuple:
+    # None stands for a {placeholder} segment.
+    return tuple(None if part.startswith("{") else part for part in template.split("/"))
+
+
+class TTLPolicy:
+    """Looks up the time to live of a request from its endpoint template.
+
+    Methods:
+    - template(endpoint)
+    - expire_after(endpoint, params=None)
+    """
+
+    def __init__(self, overrides: dict | None = None, default=DEFAULT_EXPIRE_AFTER):
+        """Initializes the policy.
+
+        Args:
+            overrides (dict, optional): Endpoint template to TTL, merged over
+             the built-in table, e.g. {FULL_QUOTE_ENDPOINT: 1}.
+            default: The TTL of endpoints missing from the table.
+
+        Returns:
+            None
+        """
+        self.ttls = default_policy()
+        self.ttls.update(overrides or {})
+        self.default = default
+        # Literal templates are looked up first, so v4/shares_float never
+        # matches a placeholder template that happens to fit it.
+        self._literals = set()
+        self._shapes = {}
+        for template in self.ttls:
+            if "{" not in template:
+                self._literals.add(template)
+                continue
+            segments = _segments(template)
+            self._shapes.setdefault(len(segments), []).append((segments, template))
+
+    def template(self, endpoint: str) -> str | None:
+        """Returns the endpoint template a formatted endpoint was built from.
+
+        Args:
+            endpoint (str): A formatted endpoint such as v3/quote/AAPL.
+
+        Returns:
+            str | None
+        """
+        if endpoint in self._literals:
+            return endpoint
+        parts = endpoint.split("/")
+        for segments, template in self._shapes.get(len(parts), ()):
+            if all(
+                part if segment is None else part == segment
+                for segment, part in zip(segments, parts)
+            ):
+                return template
+        return None
+
+    def expire_after(self, endpoint: str, params: dict | None = None):
+        """Returns the TTL of a request.
+
+        Args:
+            endpoint (str): A formatted endpoint such as v3/quote/AAPL.
+            params (dict, optional): The request params.
+
+        Returns:
+            int: Seconds, or NEVER_EXPIRE.
+        """
+        template = self.template(endpoint)
+        ttl = self.default if template is None else self.ttls[template]
+        if callable(ttl):
+            ttl = ttl(params or {})
+        return ttl
@@ -3,15 +3,60 @@
 For interacting with the Company, Crypto, and Forex WebSocket servers.
 """
 import json
+import random
 import threading
+import time
+from datetime import datetime
+from typing import NamedTuple
+from zoneinfo import ZoneInfo
 
 import websocket
 
+from financial_modeling_prep.fan_out import fan_out
+from financial_modeling_prep.ring_buffer import COALESCE, DROP_OLDEST, RingBuffer
+from financial_modeling_prep.ticks import TRADE, TickBatcher, decode, loads
+
+RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 60.0
+# A connection open this long resets the backoff.
+STABLE_CONNECTION = 30.0
+# Seconds between pings, and how long a pong may take before a half-open
+# connection is dropped and reopened.
+PING_INTERVAL = 20.0
+PING_TIMEOUT = 10.0
+
+# Tickers per subscription frame, and the pause between frames.
+SUBSCRIBE_BATCH_SIZE = 100
+SUBSCRIBE_INTERVAL = 0.05
+
 COMPANY_WEBSOCKET_ENDPOINT = "wss://websockets.financemodelingprep.com"
 CRYPTO_WEBSOCKET_ENDPOINT = "wss://crypto.financemodelingprep.com"
 FOREX_WEBSOCKET_ENDPOINT = "wss://forex.financemodelingprep.com"
 
 
+class SubscriptionStatus(NamedTuple):
+    """The server's answers to subscribe_many() or unsubscribe_many()."""
+
+    confirmed: list
+    rejected: dict
+    pending: list
+
+
+def _reply_tickers(reply: dict) -> list:
+    """Returns the tickers a subscription reply is about."""
+    data = reply.get("data")
+    tickers = data.get("ticker") if isinstance(data, dict) else None
+    if tickers is None:
+        # e.g. "Subscribed to aapl" or "Subscribed to aapl, msft"
+        message = str(reply.get("message", ""))
+        if " to " not in message:
+            return []
+        tickers = message.rsplit(" to ", 1)[1].split(",")
+    if isinstance(tickers, str):
+        tickers = [tickers]
+    return [ticker.strip().lower() for ticker in tickers if ticker.strip()]
+
+
 class _WSClient:
     """
     A WebSocket client for interacting with a WebSocket server.
@@ -35,18 +80,87 @@ class _WSClient:
 
         unsubscribe(ticker):
             Unsubscribes from updates for a specific ticker.
+
+        subscribe_many(tickers, timeout=None):
+            Subscribes to many tickers in batched frames.
+
+        unsubscribe_many(tickers, timeout=None):
+            Unsubscribes from many tickers in batched frames.
+
+        stats():
+            Returns the ring buffer counters.
     """
 
     ENDPOINT = None
-
-    def __init__(self, api_key, callback):
+    SUBSCRIBE_BATCH_SIZE = SUBSCRIBE_BATCH_SIZE
+    SUBSCRIBE_INTERVAL = SUBSCRIBE_INTERVAL
+    PING_INTERVAL = PING_INTERVAL
+    PING_TIMEOUT = PING_TIMEOUT
+
+    def __init__(
+        self,
+        api_key,
+        callback,
+        *,
+        decoded=False,
+        batch_size=None,
+        batch_interval=None,
+        on_event=None,
+        queue_size=None,
+        overflow=DROP_OLDEST,
+        workers=1,
+        reconnect=True,
+        max_reconnect_delay=MAX_RECONNECT_DELAY,
+        on_reconnect=None,
+        quote_book=None,
+        recorder=None,
+    ):
         """Initializes a WebSocket client.
 
          With the provided URL, API key, and callback function.
 
+        By default the callback receives every raw message. With decoded set,
+        messages are decoded once here and the callback receives lists of
+        ticks.Tick instead; batch_size and/or batch_interval additionally
+        gather the ticks of many messages into each call.
+
+        With queue_size set, the receive thread only queues messages (or
+        ticks) in a ring buffer and worker threads run the callback, so a slow
+        callback never stalls the socket. See ring_buffer for the overflow
+        policies; with more than one worker, calls may run out of order.
+
+        A dropped connection is reopened after an exponentially growing
+        delay, then the client logs in again and resubscribes every ticker
+        subscribed so far. on_reconnect can fill the gap, see quote_backfill()
+        and chart_backfill().
+
         Args:
             api_key (str): The API key for authentication.
             callback (function): The callback function to handle incoming messages.
+            decoded (bool): Deliver lists of Tick instead of raw messages.
+            batch_size (int, optional): Deliver ticks in batches of this size.
+             Implies decoded.
+            batch_interval (float, optional): The longest a tick is held back
+             for its batch, in seconds. Implies decoded.
+            on_event (function, optional): Called with the decoded messages
+             that are not ticks, such as login and subscription replies, when
+             decoded is on.
+            queue_size (int, optional): Hand messages to worker threads
+             through a ring buffer of this size.
+            overflow (str): What happens when the buffer is full: drop_oldest,
+             coalesce (a quote replaces the pending one of its symbol, trades
+             are never coalesced, implies decoded) or block.
+            workers (int): The number of threads running the callback.
+            reconnect (bool): Reconnect when the connection drops.
+            max_reconnect_delay (float): The longest wait between attempts,
+             in seconds.
+            on_reconnect (function, optional): Called on its own thread after
+             every reconnection with the subscribed tickers and the epoch
+             times the connection was lost and restored.
+            quote_book (QuoteBook, optional): Updated in place with every
+             quote tick on the receive thread. Implies decoded.
+            recorder (TickRecorder, optional): Appends every tick received
+             to a tick log, see tick_log.replay().
 
         Returns:
             None
@@ -54,10 +168,140 @@ class _WSClient:
         self.ws_url = self.ENDPOINT
         self.api_key = api_key
         self.callback = callback
+        self.decoded = (
+            decoded
+            or batch_size is not None
+            or batch_interval is not None
+            or (queue_size is not None and overflow == COALESCE)
+            or quote_book is not None
+        )
+        self.quote_book = quote_book
+        self.recorder = recorder
+        self.on_event = on_event
+        self.batcher = None
+        if batch_size is not None or batch_interval is not None:
+            self.batcher = TickBatcher(
+                callback, batch_size=batch_size or 1000, batch_interval=batch_interval
+            )
+        self.buffer = None
+        if queue_size is not None:
+            self.buffer = RingBuffer(queue_size, overflow)
+        self.workers = workers
+        self.worker_threads = []
+        self.reconnect = reconnect
+        self.max_reconnect_delay = max_reconnect_delay
+        self.on_reconnect = on_reconnect
+        self.subscriptions = set()
+        # Ticker to (event, status message) of the last subscription reply.
+        self.replies = {}
+        self._replies_lock = threading.Lock()
+        self.reconnects = 0
+        self._stopped = threading.Event()
+        self._disconnected_at = None
         self.ws = None
         self.thread = None
         self.lock = threading.Lock()
 
+    def _handle(self, message):
+        """Passes a received message on to the callback, or the buffer.
+
+        Args:
+            message: The message received from the websocket.
+
+        Returns:
+            None
+        """
+        if not self.decoded:
+            if isinstance(message, str) and '"event"' in message:
+                self._record_reply(loads(message))
+            if self.recorder is not None:
+                self.recorder.record_message(message)
+            if self.buffer is not None:
+                self.buffer.put(message)
+            else:
+                self.callback(message)
+            return
+        ticks, events = decode(message)
+        for event in events:
+            self._record_reply(event)
+            if self.on_event is not None:
+                self.on_event(event)
+        if not ticks:
+            return
+        if self.recorder is not None:
+            self.recorder.record(ticks)
+        if self.quote_book is not None:
+            self.quote_book.add(ticks)
+        if self.buffer is not None:
+            for tick in ticks:
+                # Every trade counts towards volume, so trades never coalesce.
+                key = None if tick.type == TRADE else (tick.symbol, tick.type)
+                self.buffer.put(tick, key)
+        else:
+            self._deliver(ticks)
+
+    def _record_reply(self, reply):
+        """Notes the tickers a subscribe or unsubscribe reply confirms or rejects.
+
+        Args:
+            reply: A decoded message that is not a tick.
+
+        Returns:
+            None
+        """
+        if not isinstance(reply, dict):
+            return
+        event = reply.get("event")
+        if event not in ("subscribe", "unsubscribe"):
+            return
+        status = reply.get("status", 200)
+        message = None if status == 200 else str(reply.get("message", status))
+        with self._replies_lock:
+            for ticker in _reply_tickers(reply):
+                self.replies[ticker] = (event, message)
+
+    def _deliver(self, items):
+        """Runs the callback on raw messages or decoded ticks.
+
+        Args:
+            items (list): Raw messages, or ticks when decoded is on.
+
+        Returns:
+            None
+        """
+        if not self.decoded:
+            for message in items:
+                self.callback(message)
+        elif self.batcher is not None:
+            self.batcher.add(items)
+        else:
+            self.callback(items)
+
+    def _work(self):
+        """Delivers buffered items until the buffer is closed and empty.
+
+        Returns:
+            None
+        """
+        max_items = self.batcher.batch_size if self.batcher is not None else 1000
+        while True:
+            items = self.buffer.get_many(max_items)
+            if items:
+                self._deliver(items)
+            elif self.buffer.closed:
+                return
+
+    def stats(self):
+        """Returns the counters of the ring buffer.
+
+        Returns:
+            dict: depth, max_depth, received, delivered, dropped and
+             coalesced, empty without queue_size.
+        """
+        if self.buffer is None:
+            return {}
+        return self.buffer.stats()
+
     def connect(self):
         """Establishes a connection to the WebSocket server.
 
@@ -75,7 +319,7 @@ class _WSClient:
             Returns:
                 None
             """
-            self.callback(message)
+            self._handle(message)
 
         def on_error(_, error):
             """Prints the error message received from the websocket.
@@ -101,26 +345,65 @@ class _WSClient:
             """
             print("Connection closed.")
 
-        def on_open(_):
-            """Initiates the login process when the WebSocket connection is opened.
+        def on_open(ws):
+            """Logs in and restores the subscriptions when the connection opens.
 
             Args:
-                _: The websocket object.
+                ws: The websocket object.
 
             Returns:
                 None
             """
+            nonlocal connected
+            if self._stopped.is_set() or ws is not self.ws:
+                # stop() ran before this connection existed to be closed.
+                ws.close()
+                return
+            connected = True
             self.login()
-
-        self.ws = websocket.WebSocketApp(
-            self.ws_url,
-            on_message=on_message,
-            on_error=on_error,
-            on_close=on_close,
-            on_open=on_open,
-        )
-
-        self.ws.run_forever()
+            with self.lock:
+                tickers = sorted(self.subscriptions)
+            self._send_many("subscribe", tickers)
+            disconnected_at, self._disconnected_at = self._disconnected_at, None
+            if disconnected_at is not None:
+                self.reconnects += 1
+                if self.on_reconnect is not None:
+                    threading.Thread(
+                        target=self.on_reconnect,
+                        args=(tickers, disconnected_at, time.time()),
+                        daemon=True,
+                    ).start()
+
+        delay = RECONNECT_DELAY
+        thread = threading.current_thread()
+        while True:
+            with self.lock:
+                # Checked under the lock, so stop() closes this very socket. A
+                # thread left over from before a stop() and start() leaves.
+                if self._stopped.is_set() or self.thread is not thread:
+                    return
+                self.ws = websocket.WebSocketApp(
+                    self.ws_url,
+                    on_message=on_message,
+                    on_error=on_error,
+                    on_close=on_close,
+                    on_open=on_open,
+                )
+            opened = time.monotonic()
+            connected = False
+            self.ws.run_forever(
+                ping_interval=self.PING_INTERVAL, ping_timeout=self.PING_TIMEOUT
+            )
+            if self._stopped.is_set() or not self.reconnect:
+                return
+            # A failed attempt does not lose data, only a dropped connection.
+            if connected and self._disconnected_at is None:
+                self._disconnected_at = time.time()
+            if time.monotonic() - opened >= STABLE_CONNECTION:
+                delay = RECONNECT_DELAY
+            # Full jitter, so many clients dropped together do not return together.
+            self._stopped.wait(random.uniform(0, delay))
+            delay = min(delay * 2, self.max_reconnect_delay)
 
     def login(self):
         """Sends login data with the API key to authenticate with the WebSocket server.
@@ -137,7 +420,16 @@ class _WSClient:
         Returns:
             None
         """
+        self._stopped.clear()
         with self.lock:
+            if self.buffer is not None:
+                self.buffer.reopen()
+                self.worker_threads = [
+                    threading.Thread(target=self._work, daemon=True)
+                    for _ in range(self.workers)
+                ]
+                for worker in self.worker_threads:
+                    worker.start()
             self.thread = threading.Thread(target=self.connect)
             self.thread.start()
 
@@ -147,20 +439,100 @@ class _WSClient:
         Returns:
             None
         """
+        self._stopped.set()
         with self.lock:
-            self.ws.close()
+            if self.ws is not None:
+                self.ws.close()
+        if self.buffer is not None:
+            self.buffer.close()
+            for worker in self.worker_threads:
+                worker.join()
+        if self.batcher is not None:
+            self.batcher.close()
+
+    def _send(self, event, ticker):
+        """Sends a subscription frame, if the connection is open.
+
+        Args:
+            event (str): subscribe or unsubscribe.
+            ticker (str | list[str]): The ticker symbol, or several.
+
+        Returns:
+            bool: False when the connection is down.
+        """
+        try:
+            self.ws.send(json.dumps({"event": event, "data": {"ticker": ticker}}))
+        except (AttributeError, websocket.WebSocketConnectionClosedException):
+            return False
+        return True
+
+    def _send_many(self, event, tickers):
+        """Sends tickers SUBSCRIBE_BATCH_SIZE per frame, SUBSCRIBE_INTERVAL apart.
+
+        Args:
+            event (str): subscribe or unsubscribe.
+            tickers (list[str]): The ticker symbols.
+
+        Returns:
+            bool: False when the connection went down.
+        """
+        for start in range(0, len(tickers), self.SUBSCRIBE_BATCH_SIZE):
+            if start and self._stopped.wait(self.SUBSCRIBE_INTERVAL):
+                return False
+            chunk = tickers[start : start + self.SUBSCRIBE_BATCH_SIZE]
+            if not self._send(event, chunk if len(chunk) > 1 else chunk[0]):
+                return False
+        return True
+
+    def _wait_replies(self, event, tickers, timeout):
+        """Waits up to timeout seconds for the server to answer for every ticker.
+
+        Args:
+            event (str): subscribe or unsubscribe.
+            tickers (list[str]): The ticker symbols.
+            timeout (float, optional): None returns at once.
+
+        Returns:
+            SubscriptionStatus
+        """
+
+        def status():
+            confirmed, rejected, pending = [], {}, []
+            for ticker in tickers:
+                reply_event, message = self.replies.get(ticker.lower(), (None, None))
+                if reply_event != event:
+                    pending.append(ticker)
+                elif message is None:
+                    confirmed.append(ticker)
+                else:
+                    rejected[ticker] = message
+            return SubscriptionStatus(confirmed, rejected, pending)
+
+        deadline = time.monotonic() + (timeout or 0)
+        while True:
+            with self._replies_lock:
+                result = status()
+            remaining = deadline - time.monotonic()
+            if not result.pending or remaining <= 0:
+                return result
+            # Replies arrive one per ticker, polling checks them in bulk.
+            time.sleep(min(remaining, 0.02))
 
     def subscribe(self, ticker):
         """Subscribes to updates for a specific ticker.
 
+        The subscription is remembered and restored after a reconnection,
+        or sent once connected when the connection is down.
+
         Args:
             ticker (str): The ticker symbol to subscribe to.
 
         Returns:
             None
         """
-        subscribe_data = {"event": "subscribe", "data": {"ticker": ticker}}
-        self.ws.send(json.dumps(subscribe_data))
+        with self.lock:
+            self.subscriptions.add(ticker)
+        self._send("subscribe", ticker)
 
     def unsubscribe(self, ticker):
         """Unsubscribes from updates for a specific ticker.
@@ -171,8 +543,103 @@ class _WSClient:
         Returns:
             None
         """
-        unsubscribe_data = {"event": "unsubscribe", "data": {"ticker": ticker}}
-        self.ws.send(json.dumps(unsubscribe_data))
+        with self.lock:
+            self.subscriptions.discard(ticker)
+        self._send("unsubscribe", ticker)
+
+    def subscribe_many(self, tickers, timeout=None):
+        """Subscribes to many tickers in as few frames as possible.
+
+        Tickers are sent SUBSCRIBE_BATCH_SIZE per frame, SUBSCRIBE_INTERVAL
+        seconds apart, so the server does not throttle the connection.
+
+        Args:
+            tickers (list[str]): The ticker symbols to subscribe to.
+            timeout (float, optional): Wait this long for the server to
+             confirm every subscription.
+
+        Returns:
+            SubscriptionStatus: The confirmed, rejected (ticker to server
+             message) and still unanswered tickers.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        with self.lock:
+            self.subscriptions.update(tickers)
+        with self._replies_lock:
+            for ticker in tickers:
+                self.replies.pop(ticker.lower(), None)
+        self._send_many("subscribe", tickers)
+        return self._wait_replies("subscribe", tickers, timeout)
+
+    def unsubscribe_many(self, tickers, timeout=None):
+        """Unsubscribes from many tickers in as few frames as possible.
+
+        Args:
+            tickers (list[str]): The ticker symbols to unsubscribe from.
+            timeout (float, optional): Wait this long for the server to
+             confirm every unsubscription.
+
+        Returns:
+            SubscriptionStatus
+        """
+        tickers = list(dict.fromkeys(tickers))
+        with self.lock:
+            self.subscriptions.difference_update(tickers)
+        with self._replies_lock:
+            for ticker in tickers:
+                self.replies.pop(ticker.lower(), None)
+        self._send_many("unsubscribe", tickers)
+        return self._wait_replies("unsubscribe", tickers, timeout)
+
+
+def quote_backfill(api, callback):
+    """Returns an on_reconnect hook fetching fresh quotes after a reconnection.
+
+    Args:
+        api: The FinancialModelingPrep client used for the requests.
+        callback: Called with a dict of symbol to full quote rows.
+
+    Returns:
+        function
+    """
+
+    def on_reconnect(tickers, *_):
+        # Quotes are a snapshot, so the length of the gap does not matter.
+        symbols = [ticker.upper() for ticker in tickers]
+        callback(api.batch(api.quote.get_full_quote, symbols))
+
+    return on_reconnect
+
+
+def chart_backfill(api, callback, timeframe="1min", timezone="America/New_York"):
+    """Returns an on_reconnect hook fetching the bars missed while disconnected.
+
+    Args:
+        api: The FinancialModelingPrep client used for the requests.
+        callback: Called with each ticker and its bars of the gap, oldest
+         first.
+        timeframe (str): 1min, 5min, 15min, 30min, 1hour or 4hour.
+        timezone (str): The timezone of the chart dates.
+
+    Returns:
+        function
+    """
+    zone = ZoneInfo(timezone)
+
+    def on_reconnect(tickers, disconnected_at, reconnected_at):
+        start = datetime.fromtimestamp(disconnected_at, zone).isoformat(" ")[:19]
+        end = datetime.fromtimestamp(reconnected_at, zone).isoformat(" ")[:19]
+        for result in fan_out(
+            lambda ticker: api.charts.get_intraday_chart(
+                timeframe, ticker.upper(), start[:10], end[:10]
+            ),
+            tickers,
+        ):
+            if result.ok and isinstance(result.result, list):
+                bars = [bar for bar in result.result if start <= bar["date"] <= end]
+                callback(result.symbol, sorted(bars, key=lambda bar: bar["date"]))
+
+    return on_reconnect
 
 
 class CompanyWSClient(_WSClient):
@@ -198,6 +665,15 @@ class CompanyWSClient(_WSClient):
         unsubscribe(ticker):
             Unsubscribes from updates for a specific ticker.
 
+        subscribe_many(tickers, timeout=None):
+            Subscribes to many tickers in batched frames.
+
+        unsubscribe_many(tickers, timeout=None):
+            Unsubscribes from many tickers in batched frames.
+
+        stats():
+            Returns the ring buffer counters.
+
     Response:
         s: Ticker related to the asset.
         t: Timestamp
@@ -259,6 +735,15 @@ class CryptoWSClient(_WSClient):
         unsubscribe(ticker):
             Unsubscribes from updates for a specific ticker.
 
+        subscribe_many(tickers, timeout=None):
+            Subscribes to many tickers in batched frames.
+
+        unsubscribe_many(tickers, timeout=None):
+            Unsubscribes from many tickers in batched frames.
+
+        stats():
+            Returns the ring buffer counters.
+
     Response:
         s: Ticker related to the asset.
         t: Timestamp
@@ -321,6 +806,15 @@ class ForexWSClient(_WSClient):
         unsubscribe(ticker):
             Unsubscribes from updates for a specific ticker.
 
+        subscribe_many(tickers, timeout=None):
+            Subscribes to many tickers in batched frames.
+
+        unsubscribe_many(tickers, timeout=None):
+            Unsubscribes from many tickers in batched frames.
+
+        stats():
+            Returns the ring buffer counters.
+
     Response:
         s: Ticker related to the asset.
         t: Timestamp